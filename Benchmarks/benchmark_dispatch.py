@@ -0,0 +1,91 @@
+"""
+This module benchmarks how the ReminderDispatcher delivers a burst of Reminders that fall due together.
+It sends the same Reminders, spread over a number of channels, to fake channels whose sends take a fixed time,
+once coalescing each channel's Reminders by due window and once sending one message per Reminder,
+and prints the number of messages and the wall-clock time of each, paced as the dispatcher paces real channels.
+It needs neither Discord nor the database.
+Run it as a module from the directory above the repository (e.g. "python -m Smorg.Benchmarks.benchmark_dispatch").
+"""
+
+import asyncio
+
+from datetime import datetime, timezone
+from time import perf_counter
+from types import SimpleNamespace
+
+from ..Bot.Cogs.Helpers.dispatcher import ReminderDispatcher
+from ..Bot.Cogs.Helpers.Enumerators.universalist import MentionableType
+
+CHANNEL_COUNT: int = 10
+REMINDER_COUNT: int = 200
+SEND_SECONDS: float = 0.05
+
+
+class BenchmarkChannel:
+    """
+    This class stands in for a Discord channel, taking a fixed time to send each message and counting them.
+    """
+    def __init__(self):
+        self.message_count: int = 0
+
+    async def send(self, content: str) -> None:
+        await asyncio.sleep(SEND_SECONDS)
+        self.message_count += 1
+
+
+class UncoalescedDispatcher(ReminderDispatcher):
+    """
+    This class is a ReminderDispatcher that gives every Reminder a due window of its own,
+    so that each one is sent as a separate message.
+    """
+    @staticmethod
+    def find_due_window(reminder) -> int:
+        return id(reminder)
+
+
+def make_reminders(due_time: datetime) -> list:
+    """
+    This function builds Reminder rows that are all due at once, spread evenly over the benchmark's Guilds.
+
+    :param datetime due_time: the time zone aware date and time at which every Reminder is due.
+    :return list: the Reminder rows.
+    """
+    return [
+        SimpleNamespace(
+            guild_id=number % CHANNEL_COUNT, target_type=MentionableType.MEMBER.value, target_id=number,
+            reminder_datetime=due_time, reminder_text=f"Benchmark reminder {number}."
+        )
+        for number in range(REMINDER_COUNT)
+    ]
+
+
+async def time_dispatch(dispatcher_class: type) -> tuple:
+    """
+    This function dispatches the benchmark's Reminders through a given kind of dispatcher and times it.
+
+    :param type dispatcher_class: ReminderDispatcher or a subclass of it.
+    :return tuple: the number of messages sent and the time that sending them took, in seconds.
+    """
+    channels: dict = {g_id: BenchmarkChannel() for g_id in range(CHANNEL_COUNT)}
+
+    async def get_reminder_channels(guild_ids: set) -> dict:
+        return {g_id: g_id for g_id in guild_ids}
+
+    reminder_dispatcher: ReminderDispatcher = dispatcher_class(get_reminder_channels, channels.get)
+    due_reminders: list = make_reminders(datetime.now(timezone.utc).replace(second=0, microsecond=0))
+    start_time: float = perf_counter()
+    await reminder_dispatcher.dispatch(due_reminders)
+    return sum(channel.message_count for channel in channels.values()), perf_counter() - start_time
+
+
+async def main() -> None:
+    print(f"{REMINDER_COUNT} reminders across {CHANNEL_COUNT} channels, {SEND_SECONDS * 1000:.0f} ms per send")
+    print(f"{'Dispatcher':>12} | {'Messages':>10} | {'Time (s)':>10}")
+    for dispatcher_name, dispatcher_class in (("Coalesced", ReminderDispatcher),
+                                              ("Uncoalesced", UncoalescedDispatcher)):
+        message_count, elapsed_time = await time_dispatch(dispatcher_class)
+        print(f"{dispatcher_name:>12} | {message_count:>10} | {elapsed_time:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+This module benchmarks the random quote selection behind the yoink Command.
+It fills a scratch Guild with progressively more quotes, times Quote.get_random_quote_by at each size,
+and prints the median latency of each size, which should stay flat as the Guild's quote count grows.
+It runs against the database configured in secretbord and deletes its scratch Guild once it finishes.
+Run it as a module from the directory above the repository (e.g. "python -m Smorg.Benchmarks.benchmark_yoink").
+"""
+
+from statistics import median
+from time import perf_counter
+
+from ..Bot.smorgasDB import Guild, Quote, Session
+
+BENCHMARK_GUILD_ID: int = 0
+QUOTE_COUNTS: tuple = (100, 1000, 10000, 100000)
+TRIALS: int = 200
+
+
+def fill_quotes(g_id: int, current_count: int, target_count: int) -> None:
+    """
+    This function adds quotes to a Guild in bulk until it holds a target number of them.
+
+    :param int g_id: a Discord Guild ID.
+    :param int current_count: the number of quotes that the Guild currently has.
+    :param int target_count: the number of quotes that the Guild should have.
+    """
+    benchmark_session: Session = Session()
+    benchmark_session.bulk_insert_mappings(Quote, [
+        {
+            "guild_id": g_id, "guild_quote_number": number, "author": f"Author {number % 50}",
+            "text": f"Benchmark quote {number}.",
+            "content_hash": Quote.hash_content(f"Author {number % 50}", f"Benchmark quote {number}.")
+        }
+        for number in range(current_count + 1, target_count + 1)
+    ])
+    benchmark_session.query(Guild).filter_by(guild_id=g_id).update({"quote_count": target_count})
+    benchmark_session.commit()
+    benchmark_session.close()
+
+
+def time_random_quotes(g_id: int, trials: int) -> float:
+    """
+    This function repeatedly retrieves a random quote from a Guild and measures how long each retrieval takes.
+
+    :param int g_id: a Discord Guild ID.
+    :param int trials: the number of retrievals to time.
+    :return float: the median latency of a retrieval, in milliseconds.
+    """
+    latencies: list = []
+    for _ in range(trials):
+        start_time: float = perf_counter()
+        Quote.get_random_quote_by(g_id)
+        latencies.append((perf_counter() - start_time) * 1000)
+    return median(latencies)
+
+
+def remove_scratch_guild(g_id: int) -> None:
+    """
+    This function deletes the benchmark's scratch Guild and all of its quotes.
+
+    :param int g_id: a Discord Guild ID.
+    """
+    benchmark_session: Session = Session()
+    benchmark_session.query(Quote).filter_by(guild_id=g_id).delete()
+    benchmark_session.query(Guild).filter_by(guild_id=g_id).delete()
+    benchmark_session.commit()
+    benchmark_session.close()
+
+
+def main() -> None:
+    remove_scratch_guild(BENCHMARK_GUILD_ID)
+    Guild.create_guild_with(BENCHMARK_GUILD_ID, None)
+    try:
+        current_count: int = 0
+        print(f"{'Quotes':>10} | {'Median Latency (ms)':>20}")
+        for quote_count in QUOTE_COUNTS:
+            fill_quotes(BENCHMARK_GUILD_ID, current_count, quote_count)
+            current_count = quote_count
+            print(f"{quote_count:>10} | {time_random_quotes(BENCHMARK_GUILD_ID, TRIALS):>20.3f}")
+    finally:
+        remove_scratch_guild(BENCHMARK_GUILD_ID)
+
+
+if __name__ == "__main__":
+    main()
@@ -137,6 +137,25 @@ class DateConstant(NamedConstant):
     LEAP_YEAR_MODULO = 4
 
 
+class SchedulerConstant(NamedConstant):
+    """
+    This class contains the constants that bound the ReminderScheduler's window of upcoming Reminders.
+    The window spans a number of seconds but holds no more than a number of distinct due times;
+    a failed refill or claim is retried after a number of seconds.
+    Due Reminders are sent by no more than a number of concurrent dispatch workers, and those of a channel
+    that fall due within the same window of a number of seconds are coalesced into as few messages as possible.
+    Due Reminders are claimed in batches of no more than a number of Reminders per database shard, under a lease
+    of a number of seconds, within which they must be sent and acknowledged before another process may claim them.
+    """
+    WINDOW_SECONDS = 900
+    WINDOW_SIZE = 1000
+    RETRY_SECONDS = 60
+    DISPATCH_WORKERS = 8
+    COALESCE_SECONDS = 60
+    CLAIM_BATCH_SIZE = 500
+    LEASE_SECONDS = 300
+
+
 class TimeConstant(NamedConstant):
     """
     This class contains various constant values for times that may be used in multiple locations.
@@ -195,3 +214,38 @@ class PeriodConstant:
     SINE_MERIDIEM = 0  # "without a midday," referring to how there's no period separation in a twenty-four hour clock
     ANTE_MERIDIEM = 1
     POST_MERIDIEM = 2
+
+
+class RecurrenceConstant(NamedConstant):
+    """
+    This class contains the words that recurrence rules accept for not recurring, for weekdays, and for weekends,
+    and the groups of days that the latter two stand for.
+    """
+    NON_RECURRING = ('never', 'once')
+    WEEKDAYS = ('weekdays', (0, 1, 2, 3, 4))
+    WEEKENDS = ('weekends', (5, 6))
+
+
+class RecurrenceUnit(Enum, init='value minutes adverb'):
+    """
+    This enumeration contains the units by which a recurrence rule's interval can be given,
+    along with the number of minutes that each spans and the adverb, if any, that stands for one of it.
+    """
+    MINUTE = 'minute', 1, None
+    HOUR = 'hour', 60, 'hourly'
+    DAY = 'day', 1440, 'daily'
+    WEEK = 'week', 10080, 'weekly'
+
+
+class WeekdayAliases(Enum, init='value aliases'):
+    """
+    This enumeration contains the days of the week, numbered as datetime numbers them, with their accepted names.
+    The first alias of each day is the one with which recurrence rules are written.
+    """
+    MONDAY = 0, ('mon', 'monday')
+    TUESDAY = 1, ('tue', 'tues', 'tuesday')
+    WEDNESDAY = 2, ('wed', 'wednesday')
+    THURSDAY = 3, ('thu', 'thur', 'thurs', 'thursday')
+    FRIDAY = 4, ('fri', 'friday')
+    SATURDAY = 5, ('sat', 'saturday')
+    SUNDAY = 6, ('sun', 'sunday')
@@ -1,9 +1,14 @@
 """
 This module contains various NamedConstant items that are widely used throughout Smorg's Cogs and Helpers.
-The classes in this file are: ColorConstant, DiscordConstant, HelpDescription, MessageConstant, and StaticText.
+The classes in this file are: ColorConstant, DiscordConstant, HelpDescription, MentionableType, MessageConstant,
+and StaticText.
 """
 
-from aenum import NamedConstant
+from __future__ import annotations
+
+from aenum import IntEnum, NamedConstant
+from discord import Member, Role
+from typing import Union
 
 
 class ColorConstant(NamedConstant):
@@ -22,7 +27,10 @@ class ColorConstant(NamedConstant):
 class DiscordConstant(NamedConstant):
     """
     This class holds constants related to Discord limitations, especially those related to character limits.
+    Each channel's messages are also limited to a burst of a number of them in a period of some seconds.
     """
+    CHANNEL_MESSAGE_BURST = 5
+    CHANNEL_MESSAGE_PERIOD = 5
     MAX_MEMBER_NAME_LENGTH = 32
     MAX_ROLE_LENGTH = 100
     MAX_MESSAGE_LENGTH = 2000
@@ -39,9 +47,17 @@ class HelpDescription(NamedConstant):
     """
     This class holds constants of help strings related to each overarching Smorg command. Subcommands are not included.
     """
+    ARCHIVE = "This command moves a Guild's quotes in and out of Smorg; it requires the Manage Server permission. " \
+              "Its export subcommand attaches every stored quote as an NDJSON file, " \
+              "and its import subcommand stores the quotes in an attached NDJSON or CSV file " \
+              "with author and text fields, skipping any that are already stored."
     DISPLAY = "This command, when combined with various subcommands, relates information about Smorg's capabilities " \
               "and its current state. " \
-              "Current subcommands include dice, functions, operators, quotes, reminders, and zones."
+              "Current subcommands include authors, dice, functions, operators, quotes, reminders, search, next, " \
+              "and zones. Quotes, reminders, and search results are shown a page at a time; " \
+              "they take an optional page number, written as page=N before their other arguments, " \
+              "and next shows the page after the last one that you displayed. " \
+              "Search, followed by some words, shows the quotes that best match them."
     FORGET = "This command allows someone to delete a reminder. To do so, it accepts arguments of a role and a time. " \
              "It deletes a reminder corresponding to that role and time."
     GOVERN = "This command tells Smorg what channel in which it should perform some task. " \
@@ -55,6 +71,11 @@ class HelpDescription(NamedConstant):
     PURGE = "This command deletes a specified number of messages prior to the given command."
     QUOTE = "This command embeds a quote. It takes a quote and, optionally, an author as arguments. " \
             "The author can be a mention or regular text."
+    RECUR = "This command makes a reminder repeat. It accepts arguments of a role, a time, and a rule. " \
+            "Rules can be intervals, such as 'every 2 days' or 'weekly', " \
+            "or days of the week in the time's time zone, such as 'on mon, wed, fri' or 'on weekdays'; " \
+            "'never' stops the reminder from repeating. If another reminder for the same role is already set " \
+            "for one of its times, the repeating reminder skips that time, as the other reminder is sent then."
     REMIND = "This command signals a role at a certain time with a certain message. " \
              "It takes arguments in the order of role, time, and an optional message. " \
              "Time can be in terms of a twelve-hour or twenty-four-hour clock. " \
@@ -70,7 +91,36 @@ class HelpDescription(NamedConstant):
     SUPPORT = "This command retrieves a help menu that lists information about all commands that Smorg supports."
     TRANSLATE = "This command translates text of one set of characters to another set of characters. " \
                 "Current sets of characters include the Latin alphabet (alphabet) and Morse code (morse)."
-    YOINK = "This command retrieves and displays a random stored quote."
+    YOINK = "This command retrieves and displays a random stored quote. " \
+            "It optionally takes the number of a stored quote, which it displays instead."
+
+
+class MentionableType(IntEnum, init='value mention_format'):
+    """
+    This Enum holds the kinds of Discord entities that Smorg can mention, as stored alongside their IDs
+    by the database. Each kind carries the format with which a mention of one of its IDs is rendered.
+    """
+    MEMBER = 1, "<@{}>"
+    ROLE = 2, "<@&{}>"
+
+    @classmethod
+    def of(cls, mentionable: Union[Member, Role]) -> MentionableType:
+        """
+        This method determines the kind of a given mentionable Discord entity.
+
+        :param Union[Member, Role] mentionable: a Member or Role.
+        :return MentionableType: the kind of mentionable that was given.
+        """
+        return cls.ROLE if isinstance(mentionable, Role) else cls.MEMBER
+
+    def mention(self, target_id: int) -> str:
+        """
+        This method renders a mention of a given ID of this kind.
+
+        :param int target_id: the Discord ID of a Member or Role.
+        :return str: the text that pings the Member or Role in a message.
+        """
+        return self.mention_format.format(target_id)
 
 
 class MessageConstant(NamedConstant):
@@ -99,5 +149,6 @@ class StaticText(NamedConstant):
     REMINDER_NOTIFICATION = "Your reminder has been successfully processed! It'll be sent at the specified time."
     REVISED_REMINDER_NOTIFICATION = "Your reminder revision has been successfully processed!"
     FORGOTTEN_REMINDER_NOTIFICATION = "Your reminder deletion has been successfully processed!"
+    RECURRING_REMINDER_NOTIFICATION = "Your reminder's new schedule has been successfully processed!"
     LIST_TRUNCATION_TEXT = "[...]"
     LOG_DEFAULT_TEXT = "Your log has successfully been created. It has been attached here."
@@ -20,4 +20,4 @@ class Checker:
         :param Context ctx: the context from which the command was made.
         :return bool: True if Smorg has quotes; False if not.
         """
-        return Quote.count_quotes(ctx.guild.id) > 0
+        return await Quote.count_quotes.awaitable(ctx.guild.id) > 0
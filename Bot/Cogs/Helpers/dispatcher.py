@@ -0,0 +1,209 @@
+"""
+This module contains the ReminderDispatcher, which sends due Reminders concurrently while pacing each channel
+and coalescing the Reminders that share a channel and a due window, and the DispatchMetrics that it records
+about how late they were delivered.
+"""
+
+import asyncio
+import logging
+import time
+
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Callable, NamedTuple
+
+from .condenser import Condenser
+from .Enumerators.timekeeper import SchedulerConstant
+from .Enumerators.universalist import DiscordConstant, MentionableType
+
+
+class DispatchMetrics(NamedTuple):
+    """
+    This class is a snapshot of the ReminderDispatcher's counters since it was created.
+    Lags, in seconds, run from when a Reminder was due to when it was sent.
+    """
+    delivered: int
+    failed: int
+    total_lag: float
+    maximum_lag: float
+
+    @property
+    def average_lag(self) -> float:
+        return self.total_lag / self.delivered if self.delivered else 0.0
+
+
+class ReminderDispatcher(Condenser):
+    """
+    This class sends a batch of due Reminders. It looks up the reminder channels of all of their Guilds at once,
+    groups the Reminders by channel, and hands the channels to a bounded pool of workers.
+    Each channel's Reminders are sent in order by one worker, which paces them to stay within the channel's
+    rate limit bucket, so that a backlog in one channel does not hold up the others.
+    The Reminders of a channel that fall due in the same window are coalesced into one message, one line apiece,
+    which is only split, between Reminders, where it would exceed Discord's message length. Messages rather than embeds
+    are sent because only a message's mentions notify the ones whom they mention.
+    The dispatcher is given two functions: get_reminder_channels, a coroutine function that takes a set of Guild IDs
+    and returns each Guild's reminder channel ID, and get_channel, which finds a channel by its ID.
+    Reminders that cannot be sent are logged and counted as failed without stopping the rest.
+    """
+    def __init__(self, get_reminder_channels: Callable, get_channel: Callable):
+        self.get_reminder_channels: Callable = get_reminder_channels
+        self.get_channel: Callable = get_channel
+        self.channel_sends: dict = {}
+        self.delivered: int = 0
+        self.failed: int = 0
+        self.total_lag: float = 0.0
+        self.maximum_lag: float = 0.0
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    async def dispatch(self, due_reminders: list) -> None:
+        """
+        This method sends a batch of due Reminders to their Guilds' reminder channels.
+
+        :param list due_reminders: the Reminder rows that are due.
+        """
+        channel_ids: dict = await self.get_reminder_channels({reminder.guild_id for reminder in due_reminders})
+        channel_reminders: dict = defaultdict(list)
+        for reminder in due_reminders:
+            channel_reminders[channel_ids.get(reminder.guild_id)].append(reminder)
+
+        channel_queue: asyncio.Queue = asyncio.Queue()
+        for channel_id, reminders in channel_reminders.items():
+            channel_queue.put_nowait((channel_id, reminders))
+        worker_count: int = min(SchedulerConstant.DISPATCH_WORKERS, len(channel_reminders))
+        await asyncio.gather(*(self.work_through(channel_queue) for _ in range(worker_count)))
+
+        self.forget_idle_channels()
+        current_metrics: DispatchMetrics = self.metrics()
+        self.logger.info(
+            f"Dispatched {len(due_reminders)} reminders to {len(channel_reminders)} channels; "
+            f"{current_metrics.delivered} delivered and {current_metrics.failed} failed so far, "
+            f"with an average lag of {current_metrics.average_lag:.2f} s and a maximum of "
+            f"{current_metrics.maximum_lag:.2f} s."
+        )
+
+    async def work_through(self, channel_queue: asyncio.Queue) -> None:
+        """
+        This method is a dispatch worker. It takes channels from the queue until none are left
+        and sends each one's Reminders in order, one due window at a time.
+        If a window's messages cannot all be sent, its Reminders are counted as failed.
+
+        :param asyncio.Queue channel_queue: pairs of a channel ID and the Reminders that are bound for it.
+        """
+        while not channel_queue.empty():
+            channel_id, reminders = channel_queue.get_nowait()
+            destination_channel = self.get_channel(channel_id) if channel_id is not None else None
+            reminders.sort(key=lambda reminder: reminder.reminder_datetime)
+            for _, window_reminders in groupby(reminders, key=self.find_due_window):
+                window_reminders: list = list(window_reminders)
+                try:
+                    if destination_channel is None:
+                        raise LookupError(f"Channel {channel_id} is not a reminder channel that Smorg can find.")
+                    for message_segment in await self.coalesce(window_reminders):
+                        await self.pace(channel_id)
+                        await destination_channel.send(message_segment)
+                    for reminder in window_reminders:
+                        self.record_delivery(reminder.reminder_datetime)
+                except Exception:
+                    self.failed += len(window_reminders)
+                    self.logger.exception(
+                        f"Reminders for Guild {window_reminders[0].guild_id} could not be sent "
+                        f"({len(window_reminders)} in all)."
+                    )
+
+    async def coalesce(self, window_reminders: list) -> list:
+        """
+        This method joins the Reminders of a due window into as few messages as fit Discord's message length,
+        one Reminder to a line. A message is only ever broken between Reminders, so that a Reminder whose text
+        has line breaks of its own stays whole, unless that Reminder alone is too long for one message.
+
+        :param list window_reminders: the Reminder rows of one channel and due window, in order.
+        :return list: the messages to send, in order.
+        """
+        compact_messages: list = []
+        compact_message: str = ""
+        for reminder in window_reminders:
+            reminder_line: str = self.compose_reminder(reminder)
+            if compact_message and len(compact_message) + len(reminder_line) < DiscordConstant.MAX_MESSAGE_LENGTH:
+                compact_message += f"\n{reminder_line}"
+                continue
+            if compact_message:
+                compact_messages.append(compact_message)
+            if len(reminder_line) > DiscordConstant.MAX_MESSAGE_LENGTH:
+                *reminder_segments, compact_message = await self.condense(
+                    reminder_line, "\n", DiscordConstant.MAX_MESSAGE_LENGTH
+                )
+                compact_messages.extend(reminder_segments)
+            else:
+                compact_message = reminder_line
+        if compact_message:
+            compact_messages.append(compact_message)
+        return compact_messages
+
+    async def pace(self, channel_id: int) -> None:
+        """
+        This method waits, if necessary, until a channel's rate limit bucket has room for another message,
+        and then records the message against it.
+
+        :param int channel_id: the ID of the channel to which a message is about to be sent.
+        """
+        recent_sends: deque = self.channel_sends.setdefault(channel_id, deque())
+        current_time: float = time.monotonic()
+        while recent_sends and current_time - recent_sends[0] >= DiscordConstant.CHANNEL_MESSAGE_PERIOD:
+            recent_sends.popleft()
+        if len(recent_sends) >= DiscordConstant.CHANNEL_MESSAGE_BURST:
+            await asyncio.sleep(DiscordConstant.CHANNEL_MESSAGE_PERIOD - (current_time - recent_sends.popleft()))
+        recent_sends.append(time.monotonic())
+
+    def forget_idle_channels(self) -> None:
+        """
+        This method drops the rate limit records of channels that have not been sent anything for a full period,
+        as their buckets have emptied.
+        """
+        current_time: float = time.monotonic()
+        for channel_id in [
+            channel_id for channel_id, recent_sends in self.channel_sends.items()
+            if current_time - recent_sends[-1] >= DiscordConstant.CHANNEL_MESSAGE_PERIOD
+        ]:
+            del self.channel_sends[channel_id]
+
+    def record_delivery(self, due_time: datetime) -> None:
+        """
+        This method counts a delivered Reminder and measures how late it was.
+
+        :param datetime due_time: the time zone aware date and time at which the Reminder was due.
+        """
+        lag: float = max((datetime.now(timezone.utc) - due_time).total_seconds(), 0.0)
+        self.delivered += 1
+        self.total_lag += lag
+        self.maximum_lag = max(self.maximum_lag, lag)
+
+    def metrics(self) -> DispatchMetrics:
+        """
+        This method takes a snapshot of the dispatcher's counters.
+
+        :return DispatchMetrics: the number of Reminders delivered and failed and their lags, since it was created.
+        """
+        return DispatchMetrics(self.delivered, self.failed, self.total_lag, self.maximum_lag)
+
+    @staticmethod
+    def find_due_window(reminder) -> int:
+        """
+        This method finds the due window of a Reminder, within which it is coalesced with its channel's other Reminders.
+
+        :param reminder: a Reminder row.
+        :return int: the number of whole windows between the epoch and the Reminder's due time.
+        """
+        return int(reminder.reminder_datetime.timestamp()) // SchedulerConstant.COALESCE_SECONDS
+
+    @staticmethod
+    def compose_reminder(reminder) -> str:
+        """
+        This method writes the line for a Reminder. The mention of the one whom the Reminder is for
+        is only rendered here, as it is sent.
+
+        :param reminder: a Reminder row.
+        :return str: the Reminder's line of the message that its channel is sent.
+        """
+        return f"Reminder for {MentionableType(reminder.target_type).mention(reminder.target_id)}: " \
+               f"{reminder.reminder_text}"
@@ -3,7 +3,7 @@ This module contains the Embedder class, a widely-used mix-in that helps various
 """
 
 from discord import TextChannel, Embed
-from typing import Any, Callable, Iterable, List, Union
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Union
 
 from .exceptioner import EmptyEmbed
 from .Enumerators.universalist import ColorConstant, DiscordConstant
@@ -15,16 +15,20 @@ class Embedder:
     It also contains two template methods for fashioning the overall Embed objects.
     """
     @staticmethod
-    async def embed(destination_channel: TextChannel, sorted_data: List[Any], initialize_embed: Callable,
+    async def embed(destination_channel: TextChannel, sorted_data: Union[Iterable[Any], AsyncIterable[Any]],
+                    initialize_embed: Callable,
                     initialize_field: Callable, embed_items: Union[dict, None] = None,
-                    field_items: Union[dict, None] = None) -> None:
+                    field_items: Union[dict, None] = None, first_page_number: int = 1) -> None:
         """
         This method produces Discord Embeds of varying kinds and sends them to a given channel.
         It accepts functions to produce the overall Embed and its fields for data sets of varying sizes,
         taking two optional dictionaries to add to each function's customization.
+        The data may be an asynchronous iterable, such as a stream of database rows;
+        each Embed is sent as soon as it is full, so only one Embed's worth of data needs to be held at a time.
 
         :param TextChannel destination_channel: the channel to which the Embed will be posted.
-        :param List[Any] sorted_data: the data which will fill up the Embed's fields, pre-sorted.
+        :param Union[Iterable[Any], AsyncIterable[Any]] sorted_data: the data which will fill up the Embed's fields,
+        pre-sorted.
         :param Callable initialize_embed: the function that initializes each Embed;
         it should be adaptive to producing multiple Embeds.
         :param Callable initialize_field: the function that initializes each field for each Embed;
@@ -34,17 +38,19 @@ class Embedder:
         the initialize_embed function, set up as keyword arguments.
         :param Union[dict, None] field_items: the additional items that are necessary to process
         the initialize_field function, set up as keyword arguments.
+        :param int first_page_number: the page number of the first Embed, for data that continues earlier pages.
         """
         if not embed_items:
             embed_items = {}
         if not field_items:
             field_items = {}
-        enumerated_data: enumerate = enumerate(sorted_data)
+        embed_items.update({'page_number': first_page_number})
         data_embed: Embed = await initialize_embed(**embed_items)
-        for counter, contents in enumerated_data:
-            embed_items.update({'page_number': (counter // DiscordConstant.MAX_EMBED_FIELDS) + 1})
+        async for counter, contents in Embedder.enumerate_data(sorted_data):
+            position: int = counter + (first_page_number - 1) * DiscordConstant.MAX_EMBED_FIELDS
+            embed_items.update({'page_number': (position // DiscordConstant.MAX_EMBED_FIELDS) + 1})
             if field_items and 'counter' in field_items:
-                field_items.update({'counter': counter})
+                field_items.update({'counter': position})
             if counter and (counter % DiscordConstant.MAX_EMBED_FIELDS) == 0:
                 await destination_channel.send(embed=data_embed)
                 data_embed = await initialize_embed(**embed_items)
@@ -58,6 +64,23 @@ class Embedder:
                 raise EmptyEmbed
         await destination_channel.send(embed=data_embed)
 
+    @staticmethod
+    async def enumerate_data(sorted_data: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[tuple]:
+        """
+        This method enumerates either kind of data that the embed method accepts as one asynchronous iterator.
+
+        :param Union[Iterable[Any], AsyncIterable[Any]] sorted_data: the data which will fill up an Embed's fields.
+        :return AsyncIterator[tuple]: an iterator over each item's position and the item itself.
+        """
+        if isinstance(sorted_data, AsyncIterable):
+            counter: int = 0
+            async for contents in sorted_data:
+                yield counter, contents
+                counter += 1
+        else:
+            for counter, contents in enumerate(sorted_data):
+                yield counter, contents
+
     @staticmethod
     async def initialize_itemized_embed(items: str, color: ColorConstant, page_number: int = 1) -> Embed:
         """
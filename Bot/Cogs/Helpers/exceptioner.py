@@ -150,6 +150,40 @@ class MissingSubcommand(UserInputError):
         super().__init__(message=message, *args)
 
 
+class DuplicateQuote(UserInputError):
+    """
+    This exception indicates that a Guild has already stored a quote with the same author and text.
+    """
+    def __init__(self, message: Union[str, None] = None, *args):
+        super().__init__(message=message, *args)
+
+
+class MissingQuote(UserInputError):
+    """
+    This exception indicates that a quote with a given number was not found.
+    """
+    def __init__(self, message: Union[str, None] = None, *args):
+        super().__init__(message=message, *args)
+
+
+class MissingPageTrail(UserInputError):
+    """
+    This exception indicates that there is no paged display from which to continue.
+    """
+    def __init__(self, message: Union[str, None] = None, *args):
+        super().__init__(message=message, *args)
+
+
+class InvalidImport(UserInputError):
+    """
+    This exception indicates that quotes could not be imported from a message's attachment.
+    The line number is that of the first invalid quote; if it is None, no suitable attachment was given.
+    """
+    def __init__(self, line_number: Union[int, None] = None, message: Union[str, None] = None, *args):
+        self.line_number: Union[int, None] = line_number
+        super().__init__(message=message, *args)
+
+
 class MissingReminder(UserInputError):
     """
     This exception indicates that a reminder with given attributes was not found.
@@ -158,6 +192,14 @@ class MissingReminder(UserInputError):
         super().__init__(message=message, *args)
 
 
+class InvalidRecurrence(UserInputError):
+    """
+    This exception indicates that a reminder's recurrence rule could not be understood.
+    """
+    def __init__(self, message: Union[str, None] = None, *args):
+        super().__init__(message=message, *args)
+
+
 class InvalidRoll(UserInputError):
     """
     This exception indicates that a user's given roll is invalid, as not all of the inputted characters were accepted.
@@ -0,0 +1,117 @@
+"""
+This module contains the RecurrenceRule, which describes how a reminder repeats and computes its next occurrence.
+"""
+
+from __future__ import annotations
+
+import re
+
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Pattern, Union
+
+from .Enumerators.timekeeper import RecurrenceConstant, RecurrenceUnit, WeekdayAliases
+from .exceptioner import InvalidRecurrence
+
+
+class RecurrenceRule(NamedTuple):
+    """
+    This class is a reminder's rule for repeating. It either repeats after a fixed interval,
+    such as "every 2 days" or "hourly", or on certain days of the week at the time of day of its first occurrence,
+    such as "on mon, wed, fri" or "on weekdays". Days of the week are told apart in the time zone
+    in which the reminder was given, which is kept as a UTC offset.
+    A reminder stores its rule as text, as compose_rule writes it, and only its next occurrence as its due time;
+    next_after computes each following occurrence as the last one fires.
+    """
+    interval: Union[timedelta, None]
+    weekdays: tuple
+    utc_offset: timedelta
+
+    @classmethod
+    def parse(cls, rule_text: str, utc_offset: timedelta = timedelta(0)) -> Union[RecurrenceRule, None]:
+        """
+        This method reads a recurrence rule from text, either as a member gives it or as compose_rule wrote it.
+
+        :param str rule_text: the text of a recurrence rule.
+        :param timedelta utc_offset: the UTC offset of the time zone in which the reminder was given,
+        unless the text already names one.
+        :return Union[RecurrenceRule, None]: the rule that the text describes, or None if it says not to repeat.
+        """
+        normalized_text: str = " ".join(rule_text.lower().split())
+        if normalized_text in RecurrenceConstant.NON_RECURRING:
+            return None
+        for unit in RecurrenceUnit:
+            if normalized_text == unit.adverb:
+                return cls(timedelta(minutes=unit.minutes), (), timedelta(0))
+
+        interval_pattern: Pattern = re.compile(r'every (?:(?P<count>\d{1,5}) )?(?P<unit>minute|hour|day|week)s?')
+        interval_match = interval_pattern.fullmatch(normalized_text)
+        if interval_match:
+            interval_count: int = int(interval_match.group("count") or 1)
+            if interval_count < 1:
+                raise InvalidRecurrence
+            interval_minutes: int = interval_count * RecurrenceUnit(interval_match.group("unit")).minutes
+            return cls(timedelta(minutes=interval_minutes), (), timedelta(0))
+
+        weekday_pattern: Pattern = re.compile(
+            r'on (?P<days>[a-z, ]+?)(?: utc(?P<sign>[+-])(?P<hours>\d{2}):(?P<minutes>\d{2}))?'
+        )
+        weekday_match = weekday_pattern.fullmatch(normalized_text)
+        if weekday_match is None:
+            raise InvalidRecurrence
+        weekdays: set = set()
+        for day_name in re.split(r'[, ]+', weekday_match.group("days").strip(", ")):
+            if day_name == RecurrenceConstant.WEEKDAYS[0]:
+                weekdays.update(RecurrenceConstant.WEEKDAYS[1])
+            elif day_name == RecurrenceConstant.WEEKENDS[0]:
+                weekdays.update(RecurrenceConstant.WEEKENDS[1])
+            else:
+                weekday: Union[WeekdayAliases, None] = next(
+                    (day for day in WeekdayAliases if day_name in day.aliases), None
+                )
+                if weekday is None:
+                    raise InvalidRecurrence
+                weekdays.add(weekday.value)
+        if weekday_match.group("sign"):
+            utc_offset = (-1 if weekday_match.group("sign") == "-" else 1) * timedelta(
+                hours=int(weekday_match.group("hours")), minutes=int(weekday_match.group("minutes"))
+            )
+        return cls(None, tuple(sorted(weekdays)), utc_offset)
+
+    def compose_rule(self) -> str:
+        """
+        This method writes the rule as text that parse can read back, naming its interval in the largest whole unit
+        or its days of the week and UTC offset.
+
+        :return str: the text of the rule, as it is stored with its reminder.
+        """
+        if self.interval is not None:
+            interval_minutes: int = int(self.interval.total_seconds()) // 60
+            unit: RecurrenceUnit = next(
+                unit for unit in reversed(RecurrenceUnit) if interval_minutes % unit.minutes == 0
+            )
+            interval_count: int = interval_minutes // unit.minutes
+            return f"every {unit.value}" if interval_count == 1 else f"every {interval_count} {unit.value}s"
+        offset_minutes: int = int(self.utc_offset.total_seconds()) // 60
+        return f"on {','.join(WeekdayAliases(day).aliases[0] for day in self.weekdays)} " \
+               f"UTC{'-' if offset_minutes < 0 else '+'}{abs(offset_minutes) // 60:02d}:{abs(offset_minutes) % 60:02d}"
+
+    def next_after(self, occurrence: datetime, current_time: datetime) -> datetime:
+        """
+        This method computes the occurrence that follows one that has fired. Occurrences that were missed,
+        such as while Smorg was offline, are skipped, so that the next occurrence is always after the current time.
+
+        :param datetime occurrence: the time zone aware date and time of the occurrence that fired.
+        :param datetime current_time: the time zone aware date and time at which it fired.
+        :return datetime: the time zone aware date and time of the reminder's next occurrence.
+        """
+        if self.interval is not None:
+            skipped_intervals: int = max((current_time - occurrence) // self.interval, 0)
+            return occurrence + (skipped_intervals + 1) * self.interval
+        local_zone: timezone = timezone(self.utc_offset)
+        local_occurrence: datetime = occurrence.astimezone(local_zone)
+        candidate_date = max(local_occurrence.date(), current_time.astimezone(local_zone).date())
+        while True:
+            candidate_occurrence: datetime = datetime.combine(candidate_date, local_occurrence.timetz())
+            if candidate_occurrence.weekday() in self.weekdays and candidate_occurrence > max(occurrence, current_time):
+                return candidate_occurrence
+            candidate_date += timedelta(days=1)
@@ -0,0 +1,174 @@
+"""
+This module contains the ReminderScheduler, which wakes Smorg when Reminders are due rather than on a fixed poll.
+"""
+
+import asyncio
+import heapq
+import logging
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Union
+
+from .Enumerators.timekeeper import SchedulerConstant
+
+
+class ReminderScheduler:
+    """
+    This class keeps the next window of Reminders' due times in a heap and sleeps until the earliest of them.
+    The window is refilled from the database once it has passed, and due Reminders are claimed from it as they fall due;
+    otherwise, the database is left alone. Commands that change the schedule tell the scheduler through schedule()
+    and unschedule(), which wake it early so that it can sleep until the new earliest time.
+    Each distinct due time is held once in the heap, with its number of Reminders kept alongside it;
+    times whose Reminders have all been unscheduled are dropped lazily, once they reach the top of the heap.
+    Reminders that are added without telling the scheduler, such as by another process, are found at the next refill.
+    Claimed Reminders are held in the window until their lease expires, and are only let go once they are delivered,
+    so that the scheduler wakes to claim them again if their delivery fails. Reminders that were due
+    but could not be claimed are under another process's lease, which expires no later than this process's would;
+    the scheduler wakes once more at that time, so that those of a process that crashed are claimed as soon as
+    their lease expires rather than at a later refill.
+    The scheduler is given three coroutine functions: load_due_times, which takes a horizon and a limit and returns
+    each due time up to the horizon paired with its number of Reminders; claim_due_reminders, which takes a time
+    and claims a batch of the Reminders due by then, returning an empty list once none are left;
+    and deliver_reminders, which sends a list of claimed Reminders and settles them.
+    """
+    def __init__(self, load_due_times: Callable, claim_due_reminders: Callable, deliver_reminders: Callable):
+        self.load_due_times: Callable = load_due_times
+        self.claim_due_reminders: Callable = claim_due_reminders
+        self.deliver_reminders: Callable = deliver_reminders
+        self.due_times: list = []
+        self.due_counts: Counter = Counter()
+        self.window_end: Union[datetime, None] = None
+        self.lease_expiries: set = set()
+        self.schedule_changed: asyncio.Event = asyncio.Event()
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    def schedule(self, due_time: datetime, reminder_count: int = 1) -> None:
+        """
+        This method adds a Reminder's due time to the window, if it falls within it, and wakes the scheduler.
+
+        :param datetime due_time: the time zone aware date and time at which a new Reminder is due.
+        :param int reminder_count: the number of Reminders that are due then.
+        """
+        if self.window_end is not None and due_time <= self.window_end:
+            if not self.due_counts[due_time]:
+                heapq.heappush(self.due_times, due_time)
+            self.due_counts[due_time] += reminder_count
+            self.schedule_changed.set()
+
+    def unschedule(self, due_time: datetime, reminder_count: int = 1) -> None:
+        """
+        This method removes a Reminder's due time from the window, if it is held there, and wakes the scheduler.
+
+        :param datetime due_time: the time zone aware date and time at which a removed Reminder was due.
+        :param int reminder_count: the number of Reminders that are no longer due then.
+        """
+        if self.due_counts[due_time] > 0:
+            self.due_counts[due_time] -= min(reminder_count, self.due_counts[due_time])
+            self.schedule_changed.set()
+
+    def hold_lease(self, lease_expiry: datetime, reminder_count: int) -> None:
+        """
+        This method adds the expiry of a lease on some claimed Reminders to the window,
+        so that the scheduler wakes to claim them again if they are still in the database then.
+
+        :param datetime lease_expiry: the time zone aware date and time at which the lease expires.
+        :param int reminder_count: the number of Reminders under the lease.
+        """
+        self.schedule(lease_expiry, reminder_count)
+        if lease_expiry in self.due_counts:
+            self.lease_expiries.add(lease_expiry)
+
+    def get_next_wake(self) -> datetime:
+        """
+        This method finds when the scheduler should next wake: at the earliest due time with Reminders left,
+        or at the end of the window, if there is none.
+
+        :return datetime: the time zone aware date and time at which the scheduler should next wake.
+        """
+        while self.due_times and not self.due_counts[self.due_times[0]]:
+            del self.due_counts[heapq.heappop(self.due_times)]
+        return min(self.due_times[0], self.window_end) if self.due_times else self.window_end
+
+    async def refill_window(self, current_time: datetime) -> None:
+        """
+        This method loads the window that follows some time from the database. If the window holds too many
+        distinct due times, it is cut short at the last of them. Counts for the same due time on different
+        database shards are added together, and times that were scheduled while it loaded are kept.
+
+        :param datetime current_time: the time zone aware date and time at which the window starts.
+        """
+        window_end: datetime = current_time + timedelta(seconds=SchedulerConstant.WINDOW_SECONDS)
+        due_times: list = (await self.load_due_times(window_end, SchedulerConstant.WINDOW_SIZE))[
+            :SchedulerConstant.WINDOW_SIZE
+        ]
+        if len(due_times) == SchedulerConstant.WINDOW_SIZE:
+            window_end = due_times[-1][0]
+        loaded_counts: Counter = Counter()
+        for due_time, reminder_count in due_times:
+            loaded_counts[due_time] += reminder_count
+        for due_time, reminder_count in loaded_counts.items():
+            self.due_counts[due_time] = max(self.due_counts[due_time], reminder_count)
+        self.due_times = [due_time for due_time in self.due_counts if due_time <= window_end]
+        heapq.heapify(self.due_times)
+        self.due_counts = Counter({due_time: self.due_counts[due_time] for due_time in self.due_times})
+        self.lease_expiries &= set(self.due_times)
+        self.window_end = window_end
+
+    async def fire_due_reminders(self, current_time: datetime) -> None:
+        """
+        This method drops the due times that have passed from the window and claims and delivers their Reminders,
+        one batch at a time until none are left to claim; each batch's lease is held in the window until it is sent.
+        Any other Reminders that are due by then, including those that the window never held, are claimed with them.
+        If fewer Reminders were claimed than the window held, the lease under which the rest were claimed elsewhere
+        is held in their place; those that were themselves held for a lease are not held again.
+
+        :param datetime current_time: the time zone aware date and time by which Reminders are due.
+        """
+        fired_count: int = 0
+        while self.due_times and self.due_times[0] <= current_time:
+            due_time: datetime = heapq.heappop(self.due_times)
+            if due_time not in self.lease_expiries:
+                fired_count += self.due_counts[due_time]
+            self.lease_expiries.discard(due_time)
+            del self.due_counts[due_time]
+        lease_expiry: datetime = current_time + timedelta(seconds=SchedulerConstant.LEASE_SECONDS)
+        claimed_count: int = 0
+        due_reminders: list = await self.claim_due_reminders(current_time)
+        while due_reminders:
+            self.hold_lease(lease_expiry, len(due_reminders))
+            await self.deliver_reminders(due_reminders)
+            self.unschedule(lease_expiry, len(due_reminders))
+            claimed_count += len(due_reminders)
+            due_reminders = await self.claim_due_reminders(current_time)
+        if claimed_count < fired_count:
+            self.hold_lease(lease_expiry, fired_count - claimed_count)
+
+    async def run(self) -> None:
+        """
+        This method is the scheduler's loop. It refills the window once it has passed, sleeps until the next wake
+        or until the schedule changes, and, once it wakes at a due time, fires the Reminders that are due.
+        A failed refill or claim is logged and retried after a pause, so that the loop outlives database outages.
+        """
+        while True:
+            try:
+                current_time: datetime = datetime.now(timezone.utc)
+                if self.window_end is None or current_time >= self.window_end:
+                    await self.refill_window(current_time)
+                self.schedule_changed.clear()
+                next_wake: datetime = self.get_next_wake()
+                try:
+                    await asyncio.wait_for(
+                        self.schedule_changed.wait(), max((next_wake - current_time).total_seconds(), 0)
+                    )
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+                current_time = datetime.now(timezone.utc)
+                if self.due_times and self.due_times[0] <= current_time:
+                    await self.fire_due_reminders(current_time)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("The reminder scheduler failed; it will retry.")
+                await asyncio.sleep(SchedulerConstant.RETRY_SECONDS)
@@ -41,7 +41,9 @@ class Arranger(commands.Cog):
         :param commands.Context ctx: the context from which the command was made.
         :param discord.TextChannel channel: the channel in which quotes will now be displayed.
         """
-        await self.handle_domain(ctx, Guild.update_quotation_channel, channel.id, StaticText.GOVERN_QUOTATION_TEXT)
+        await self.handle_domain(
+            ctx, Guild.update_quotation_channel.awaitable, channel.id, StaticText.GOVERN_QUOTATION_TEXT
+        )
 
     @govern.command()
     async def reminder(self, ctx: commands.Context, channel: discord.TextChannel) -> None:
@@ -52,7 +54,9 @@ class Arranger(commands.Cog):
         :param commands.Context ctx: the context from which the command was made.
         :param discord.TextChannel channel: the channel in which reminders will now be displayed.
         """
-        await self.handle_domain(ctx, Guild.update_reminder_channel, channel.id, StaticText.GOVERN_REMINDER_TEXT)
+        await self.handle_domain(
+            ctx, Guild.update_reminder_channel.awaitable, channel.id, StaticText.GOVERN_REMINDER_TEXT
+        )
 
     @govern.command()
     async def gamble(self, ctx: commands.Context, channel: discord.TextChannel) -> None:
@@ -63,7 +67,9 @@ class Arranger(commands.Cog):
         :param commands.Context ctx: the context from which the command was made.
         :param discord.TextChannel channel: the channel in which quotes will now be displayed.
         """
-        await self.handle_domain(ctx, Guild.update_gamble_channel, channel.id, StaticText.GOVERN_GAMBLE_TEXT)
+        await self.handle_domain(
+            ctx, Guild.update_gamble_channel.awaitable, channel.id, StaticText.GOVERN_GAMBLE_TEXT
+        )
 
     async def handle_domain(self, ctx: commands.Context, table_update_method: Callable, channel_id: int,
                             govern_message: str) -> None:
@@ -71,10 +77,11 @@ class Arranger(commands.Cog):
         This method allows users to alter the chats in which Smorg posts information.
 
         :param ctx: The context from which the command was made.
-        :param table_update_method: The SmorgDB method which will update the relevant domain channel for Smorg.
+        :param table_update_method: The awaitable SmorgDB method which will update the relevant domain channel
+        for Smorg.
         :param str govern_message: The message which Smorg reports back after updating the relevant domain channel.
         :param int channel_id: The ID of the channel which the user wants to designate as a domain for Smorg's messages.
         """
         current_guild: discord.Guild = ctx.guild
-        table_update_method(current_guild.id, channel_id)
+        await table_update_method(current_guild.id, channel_id)
         await self.bot.get_channel(channel_id).send(govern_message)
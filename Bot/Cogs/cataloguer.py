@@ -1,21 +1,44 @@
 """
 This module contains the Cataloguer Cog. Centered around the display Command and making heavy use of
 the Embedder module, it outputs various information about the bot's functionality and its current state.
+A Guild's quotes and reminders are displayed a page at a time; each member's place in them is kept as a page trail.
+The PageNumber converter reads the page argument that those displays take.
 """
 
 import discord
+from collections import OrderedDict
 from datetime import datetime
 from discord.ext import commands
-from typing import Optional, Union
+from functools import partial
+from typing import Callable, Optional, Union
 
 from .Helpers.chronologist import Chronologist
 from .Helpers.embedder import Embedder
-from .Helpers.exceptioner import EmptyEmbed, Exceptioner, MissingSubcommand
+from .Helpers.exceptioner import EmptyEmbed, Exceptioner, MissingPageTrail, MissingSubcommand
 from .Helpers.Enumerators.croupier import RollMechanic
 from .Helpers.Enumerators.tabulator import MathematicalOperator, MathematicalFunction
 from .Helpers.Enumerators.timekeeper import TimeZone
-from .Helpers.Enumerators.universalist import ColorConstant, HelpDescription
-from ..smorgasDB import Quote, Reminder
+from .Helpers.Enumerators.universalist import ColorConstant, HelpDescription, MentionableType
+from ..smorgasDB import AuthorQuoteCount, Quote, Reminder
+
+
+class PageNumber(commands.Converter):
+    """
+    This class converts a page argument, which is written as page=N, to the number of the page.
+    As it is named, it cannot be mistaken for an author, a mentionable, or search terms that are themselves numbers.
+    """
+    async def convert(self, ctx: commands.Context, argument: str) -> int:
+        """
+        This method reads the number of the page from a page argument.
+
+        :param commands.Context ctx: the context from which the command was made.
+        :param str argument: the argument that may be a page argument.
+        :return int: the number of the page, starting from 1.
+        """
+        argument_name, separator, page_number = argument.partition("=")
+        if argument_name.lower() != "page" or not separator or not page_number.isdigit() or int(page_number) < 1:
+            raise commands.BadArgument(f'"{argument}" is not a page argument, which is written as page=N.')
+        return int(page_number)
 
 
 class Cataloguer(commands.Cog, Chronologist, Embedder, Exceptioner):
@@ -23,16 +46,21 @@ class Cataloguer(commands.Cog, Chronologist, Embedder, Exceptioner):
     This Cog centers around the display Command. It displays information about Smorg as a companion to the Helper Cog
     and also lists information relevant to a given Member or Guild. It uses various other classes--especially
     Embedder--to do so.
+    Paged displays remember, for each member in each Guild, the key at which each page that they have seen ends.
+    Thus, the next page or any earlier one costs one indexed range query.
     """
+    PAGE_TRAIL_LIMIT: int = 1024
+
     def __init__(self, bot: commands.AutoShardedBot):
         self.bot = bot
+        self.page_trails: OrderedDict = OrderedDict()
         super().__init__()
 
     @commands.group(description=HelpDescription.DISPLAY)
     async def display(self, ctx: commands.Context) -> None:
         """
         This method is the main Command of the module. Its behavior is described in more detail in its subcommands,
-        which are as follows: dice, operators, reminders, quotes, and zones.
+        which are as follows: authors, dice, operators, reminders, quotes, search, next, and zones.
 
         :param commands.Context ctx: the context from which the command was made.
         """
@@ -71,85 +99,260 @@ class Cataloguer(commands.Cog, Chronologist, Embedder, Exceptioner):
         )
 
     @staticmethod
-    async def initialize_reminder_field(reminder_datetime: datetime, reminder_message: str, counter: int) -> tuple:
+    async def initialize_reminder_field(reminder_datetime: datetime, reminder_message: str,
+                                        recurrence_rule: Union[str, None], counter: int) -> tuple:
         """
         ...
         This method creates the main attributes of a field for an Embed object to display reminders.
 
         :param datetime reminder_datetime: a scheduled time for a reminder to be posted for some mentionable.
         :param str reminder_message: a message that a user wanted to be posted at the reminder's scheduled time.
+        :param Union[str, None] recurrence_rule: the rule by which the reminder repeats, if it does.
         :param int counter: a number representing the position of the item in its data structure.
         :return tuple: two strings and a Boolean for the three keyword arguments of an Embed field.
         """
         name: str = f"Reminder {counter + 1}, Scheduled at {reminder_datetime.strftime(r'%H:%M UTC%Z on %d %b %Y')}"
+        if recurrence_rule is not None:
+            name += f", Repeating {recurrence_rule}"
         value: str = f"{reminder_message or '[No Message Provided]'}"
         inline: bool = False
         return name, value, inline
 
     @display.command()
-    async def reminders(self, ctx: commands.Context,
+    async def reminders(self, ctx: commands.Context, page_number: Optional[PageNumber] = 1,
                         mentionable: Optional[Union[discord.Member, discord.Role]] = None) -> None:
         """
-        This method uses the embed function to compose and output Embeds to Discord concerning
-        the reminders held by the database that are related to a given Guild and mention.
+        This method uses the embed function to compose and output an Embed to Discord concerning
+        a page of the reminders held by the database that are related to a given Guild and mention.
 
         :param commands.Context ctx: the context from which the command was made.
+        :param Optional[PageNumber] page_number: the page of reminders to display, starting from 1, as page=N.
         :param Optional[Union[discord.Member, discord.Role]] mentionable: a Member or Role which will be mentioned.
         by reminders; if not filled, it is assumed that the author of the message is the desired Member.
         """
-        mention: str = mentionable.mention if mentionable else ctx.author.mention
-        reminder_name: str = mentionable.name if mentionable else ctx.author.name
-        reminder_list: list = Reminder.get_reminders_by(ctx.guild.id, mention)
+        mentionable = mentionable or ctx.author
         embed_items: dict = {
-            "item_author": reminder_name,
+            "item_author": mentionable.name,
             "items": "reminders",
             "color": ColorConstant.CALM_GREEN
         }
-        field_items: dict = {"counter": None}
-        await self.embed(ctx.channel, reminder_list, initialize_embed=self.initialize_authored_embed,
-                         initialize_field=self.initialize_reminder_field, embed_items=embed_items,
-                         field_items=field_items)
+        page_trail: dict = self.start_page_trail(
+            ctx, ("reminders", mentionable.id), None,
+            partial(Reminder.get_reminder_page_by.awaitable, ctx.guild.id, MentionableType.of(mentionable),
+                    mentionable.id),
+            lambda reminder_row: reminder_row.reminder_datetime, self.initialize_authored_embed,
+            self.initialize_reminder_field, embed_items, {"counter": None}
+        )
+        await self.display_page(ctx, page_trail, page_number)
 
     @staticmethod
-    async def initialize_quote_field(quote_author: str, quote: str, overall_author: Union[str, None], counter: int) -> \
-            tuple:
+    async def initialize_quote_field(quote_number: int, quote_author: str, quote: str,
+                                     overall_author: Union[str, None]) -> tuple:
         """
         This method creates the main attributes of a field for an Embed object to display quotes.
 
+        :param int quote_number: the number of an individual quote within its Guild.
         :param str quote_author: the author of an individual quote.
         :param str quote: the actual text of the quotation.
         :param Union[str, None] overall_author: an singular author for which quotes are being retrieved, if supplied.
-        :param int counter: a number representing the position of the item in its data structure.
         :return tuple: two strings and a Boolean for the three keyword arguments of an Embed field.
         """
-        name: str = f"Quote {counter + 1}"
+        name: str = f"Quote {quote_number}"
         value: str = f"\"{quote}\" -- " \
                      f"{quote_author if quote_author != overall_author else (overall_author or 'Anonymous')}"
         inline: bool = False
         return name, value, inline
 
     @display.command()
-    async def quotes(self, ctx: commands.Context, author: Union[discord.Member, str, None]) -> None:
+    async def quotes(self, ctx: commands.Context, page_number: Optional[PageNumber] = 1,
+                     author: Union[discord.Member, str, None] = None) -> None:
         """
-        This method uses the embed function to compose and output Embeds to Discord concerning
-        the quotes held by the database that are related to a given Guild and, optionally, an author.
+        This method uses the embed function to compose and output an Embed to Discord concerning
+        a page of the quotes held by the database that are related to a given Guild and, optionally, an author.
 
         :param commands.Context ctx: the context from which the command was made.
+        :param Optional[PageNumber] page_number: the page of quotes to display, starting from 1, as page=N.
         :param Union[discord.Member, str, None] author: the author of quotes whose quotations are to be displayed;
         if None, all of the Guild's quotes are displayed.
         """
         overall_name: str = author.name if isinstance(author, discord.Member) else author
-        quote_list: list = Quote.get_quotes_by(g_id=ctx.guild.id, auth=overall_name)
         embed_items: dict = {
             "item_author": overall_name or ctx.guild.name,
             "items": "quotes",
             "color": ColorConstant.HEAVENLY_YELLOW
         }
-        field_items: dict = {"counter": None, "overall_author": overall_name}
+        page_trail: dict = self.start_page_trail(
+            ctx, ("quotes", overall_name), 0, partial(Quote.get_quote_page_by.awaitable, ctx.guild.id, overall_name),
+            lambda quote_row: quote_row.guild_quote_number, self.initialize_authored_embed,
+            self.initialize_quote_field, embed_items, {"overall_author": overall_name}
+        )
+        await self.display_page(ctx, page_trail, page_number)
+
+    @staticmethod
+    async def initialize_search_embed(terms: str, color: ColorConstant, page_number: int = 1) -> discord.Embed:
+        """
+        This method creates a Discord Embed that holds the results of a search through a Guild's quotes.
+
+        :param str terms: the words for which the quotes were searched.
+        :param ColorConstant color: the color that the Embed should be.
+        :param int page_number: the number indicating that the nth Embed is being created.
+        :return discord.Embed: an Embed used to store and to output the quotes that match a search.
+        """
+        if page_number == 1:
+            desc: str = f'The quotes that best match "{terms}" are:'
+        else:
+            desc = f'Further quotes that match "{terms}" are:'
+        search_embed: discord.Embed = discord.Embed(
+            title=f'Quotes Matching "{terms}", Page {page_number}',
+            description=desc,
+            color=color
+        )
+        return search_embed
+
+    @staticmethod
+    async def initialize_search_field(quote_number: int, quote_author: str, quote: str, search_position: int) \
+            -> tuple:
+        """
+        This method creates the main attributes of a field for an Embed object to display a quote found by a search.
+
+        :param int quote_number: the number of an individual quote within its Guild.
+        :param str quote_author: the author of an individual quote.
+        :param str quote: the actual text of the quotation.
+        :param int search_position: the quote's place among the search's results, from the best match.
+        :return tuple: two strings and a Boolean for the three keyword arguments of an Embed field.
+        """
+        name: str = f"Result {search_position}: Quote {quote_number}"
+        value: str = f"\"{quote}\" -- {quote_author or 'Anonymous'}"
+        inline: bool = False
+        return name, value, inline
+
+    @display.command(name='search')
+    async def search_quotes(self, ctx: commands.Context, page_number: Optional[PageNumber] = 1, *,
+                            terms: str) -> None:
+        """
+        This method uses the embed function to compose and output an Embed to Discord concerning
+        a page of the Guild's quotes whose authors or text match some search terms, from the best match.
+
+        :param commands.Context ctx: the context from which the command was made.
+        :param Optional[PageNumber] page_number: the page of results to display, starting from 1, as page=N.
+        :param str terms: the words to search for; a quote must match all of them.
+        """
+        embed_items: dict = {
+            "terms": terms,
+            "color": ColorConstant.HEAVENLY_YELLOW
+        }
+        page_trail: dict = self.start_page_trail(
+            ctx, ("search", terms), None, partial(Quote.search_quotes_by.awaitable, ctx.guild.id, terms),
+            lambda result_row: (result_row.search_position, result_row.guild_quote_number),
+            self.initialize_search_embed, self.initialize_search_field, embed_items, {}
+        )
+        await self.display_page(ctx, page_trail, page_number)
+
+    @staticmethod
+    async def initialize_author_field(author: str, quote_count: int, counter: int) -> tuple:
+        """
+        This method creates the main attributes of a field for an Embed object to display quoted authors.
+
+        :param str author: the author of some of a Guild's quotes.
+        :param int quote_count: the number of the Guild's quotes by the author.
+        :param int counter: a number representing the position of the item in its data structure.
+        :return tuple: two strings and a Boolean for the three keyword arguments of an Embed field.
+        """
+        name: str = f"{counter + 1}. {author or 'Anonymous'}"
+        value: str = f"{quote_count} quote{'s' if quote_count != 1 else ''}"
+        inline: bool = False
+        return name, value, inline
+
+    @display.command()
+    async def authors(self, ctx: commands.Context) -> None:
+        """
+        This method uses the embed function to compose and output an Embed to Discord concerning
+        the authors with the most quotes in a given Guild, from the most quoted.
+
+        :param commands.Context ctx: the context from which the command was made.
+        """
+        top_authors: list = await AuthorQuoteCount.get_top_authors_by.awaitable(ctx.guild.id)
+        embed_items: dict = {
+            "item_author": ctx.guild.name,
+            "items": "most quoted authors",
+            "color": ColorConstant.HEAVENLY_YELLOW
+        }
+        await self.embed(
+            ctx.channel, top_authors, initialize_embed=self.initialize_authored_embed,
+            initialize_field=self.initialize_author_field, embed_items=embed_items, field_items={"counter": None}
+        )
+
+    @display.command(name='next')
+    async def next_page(self, ctx: commands.Context) -> None:
+        """
+        This method displays the page after the last page of quotes, quote search results, or reminders
+        that the caller displayed
+        in the Guild.
+
+        :param commands.Context ctx: the context from which the command was made.
+        """
+        page_trail: Union[dict, None] = self.page_trails.get((ctx.guild.id, ctx.author.id))
+        if page_trail is None:
+            raise MissingPageTrail
+        await self.display_page(ctx, page_trail, page_trail["page_number"] + 1)
+
+    def start_page_trail(self, ctx: commands.Context, listing: tuple, first_key: Union[int, tuple, None],
+                         get_page: Callable, get_page_key: Callable, initialize_embed: Callable,
+                         initialize_field: Callable, embed_items: dict, field_items: dict) -> dict:
+        """
+        This method retrieves the caller's page trail through a paged display, starting a new one
+        if the caller was last paging through a different display.
+
+        :param commands.Context ctx: the context from which the command was made.
+        :param tuple listing: the kind of item displayed and the criterion by which they were chosen.
+        :param Union[int, tuple, None] first_key: the key after which the first page starts.
+        :param Callable get_page: the awaitable function which takes a key and a number of pages to skip after it
+        and retrieves the page after those.
+        :param Callable get_page_key: the function which gives the key of one of the display's rows.
+        :param Callable initialize_embed: the function that initializes each Embed.
+        :param Callable initialize_field: the function that initializes each field for each Embed.
+        :param dict embed_items: the additional items that are necessary to initialize each Embed.
+        :param dict field_items: the additional items that are necessary to initialize each field.
+        :return dict: the caller's page trail.
+        """
+        trail_key: tuple = (ctx.guild.id, ctx.author.id)
+        page_trail: Union[dict, None] = self.page_trails.get(trail_key)
+        if page_trail is None or page_trail["listing"] != listing:
+            page_trail = {
+                "listing": listing, "page_keys": {0: first_key}, "page_number": 0, "get_page": get_page,
+                "get_page_key": get_page_key, "initialize_embed": initialize_embed,
+                "initialize_field": initialize_field, "embed_items": embed_items, "field_items": field_items
+            }
+            self.page_trails[trail_key] = page_trail
+        self.page_trails.move_to_end(trail_key)
+        while len(self.page_trails) > self.PAGE_TRAIL_LIMIT:
+            self.page_trails.popitem(last=False)
+        return page_trail
+
+    async def display_page(self, ctx: commands.Context, page_trail: dict, page_number: int) -> None:
+        """
+        This method composes and outputs one page of a paged display. The page starts after the key
+        at which the closest earlier page that the caller has seen ends; any pages in between are skipped
+        in the same query. The key at which the page ends is then added to the caller's page trail.
+
+        :param commands.Context ctx: the context from which the command was made.
+        :param dict page_trail: the caller's page trail through the display.
+        :param int page_number: the page to display, starting from 1.
+        """
+        page_keys: dict = page_trail["page_keys"]
+        known_page_number: int = max(
+            (known_page_number for known_page_number in page_keys if known_page_number < page_number), default=0
+        )
+        page_rows: list = []
+        if page_number > 0:
+            page_rows = await page_trail["get_page"](page_keys[known_page_number], page_number - 1 - known_page_number)
+        if page_rows:
+            page_keys[page_number] = page_trail["get_page_key"](page_rows[-1])
+            page_trail["page_number"] = page_number
         await self.embed(
-            ctx.channel, quote_list, initialize_embed=self.initialize_authored_embed,
-            initialize_field=self.initialize_quote_field,
-            embed_items=embed_items, field_items=field_items
+            ctx.channel, page_rows, initialize_embed=page_trail["initialize_embed"],
+            initialize_field=page_trail["initialize_field"], embed_items=page_trail["embed_items"],
+            field_items=page_trail["field_items"], first_page_number=max(page_number, 1)
         )
 
     @staticmethod
@@ -258,12 +461,15 @@ class Cataloguer(commands.Cog, Chronologist, Embedder, Exceptioner):
         inline: bool = False
         return name, value, inline
 
+    @authors.error
     @dice.error
     @display.error
     @functions.error
     @operators.error
     @reminders.error
     @quotes.error
+    @search_quotes.error
+    @next_page.error
     @zones.error
     async def display_error(self, ctx: commands.Context, error: Exception) -> None:
         """
@@ -55,7 +55,7 @@ class Gambler(commands.Cog, Condenser, Embedder, Exceptioner):
                     ctx, roll, flat_tokens, verbose_dice, roll_result, description, recipient.dm_channel
                 )
         else:
-            gamble_channel_id: int = Guild.get_gamble_channel_by(ctx.guild.id)
+            gamble_channel_id: int = await Guild.get_gamble_channel_by.awaitable(ctx.guild.id)
             current_channel: discord.TextChannel = self.bot.get_channel(gamble_channel_id) or ctx.channel
             await self.send_roll(ctx, roll, flat_tokens, verbose_dice, roll_result, description, current_channel)
 
@@ -4,12 +4,18 @@ a manual implementation up until this point.
 """
 
 import discord
+import logging
+import time
+
 from discord.ext import commands
+from typing import Union
 
 from .Helpers.exceptioner import *
 from .Helpers.Enumerators.universalist import StaticText
 from ..smorgasDB import BaseAddition, Guild
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class Hearer(commands.Cog, Exceptioner):
     """
@@ -19,53 +25,113 @@ class Hearer(commands.Cog, Exceptioner):
         self.bot = bot
         self.passable_errors: tuple = (
             commands.CommandNotFound, DuplicateOperator, ImproperFunction, MissingParenthesis,
-            InvalidRecipient, MissingReminder, InvalidRoll, InvalidSequence
+            InvalidRecipient, MissingReminder, InvalidRecurrence, InvalidRoll, InvalidSequence
         )
-        self.reset_database_on_start = True
+        self.reset_database_on_start = False
+        self.has_bootstrapped = False
+        self.has_reconciled = False
         self.say_hello = False
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """
         This method fires when Smorg is starting up, performing appropriate initialization behavior.
-        It is set to restart the database if one flag is ticked and also to signal to every server that it is in
-        that it is ready to run.
+        The first time, it brings the database's structure up to date--or, if one flag is ticked, resets the database.
+        As it also fires on reconnects, it does neither afterward. Then, it reconciles the database's Guilds with those
+        that Smorg is in, in bulk, and it can signal to every server that it is ready to run.
+        Guilds that are unavailable are left alone until they become available, and only the Guilds on the Discord
+        shards that this process runs can be deleted, as other processes may run the rest.
+        """
+        if not self.has_bootstrapped:
+            if self.reset_database_on_start:
+                await BaseAddition.reset_database.awaitable()
+            else:
+                applied_migrations: list = await BaseAddition.bootstrap_database.awaitable()
+                for migration_name in applied_migrations:
+                    logger.info(f"Applied the database migration: {migration_name}.")
+            self.has_bootstrapped = True
+        reconciliation_start: float = time.perf_counter()
+        unavailable_guild_ids: set = {guild.id for guild in self.bot.guilds if guild.unavailable}
+        new_guild_ids, departed_guild_ids = await Guild.reconcile_with.awaitable(
+            {guild.id: self.find_default_channel_id(guild) for guild in self.bot.guilds if not guild.unavailable},
+            lambda g_id: g_id not in unavailable_guild_ids and self.runs_shard_of(g_id)
+        )
+        self.has_reconciled = True
+        logger.info(
+            f"Reconciled {len(self.bot.guilds)} Guilds in {time.perf_counter() - reconciliation_start:.3f}s: "
+            f"created {len(new_guild_ids)} and deleted {len(departed_guild_ids)}."
+        )
+        if self.say_hello:
+            new_guild_id_set: set = set(new_guild_ids)
+            for guild in self.bot.guilds:
+                if not guild.unavailable:
+                    await self.greet(guild, guild.id in new_guild_id_set)
+
+    def runs_shard_of(self, g_id: int) -> bool:
         """
-        if self.reset_database_on_start:
-            BaseAddition.reset_database()
-        for guild in self.bot.guilds:
-            await self.signal_ready(guild)
+        This method determines whether this process runs the Discord shard that a Guild belongs to.
+
+        :param int g_id: a Discord Guild ID.
+        :return bool: True, if this process runs the Guild's shard; False, otherwise.
+        """
+        shard_count: int = self.bot.shard_count or 1
+        shard_ids = self.bot.shard_ids if self.bot.shard_ids is not None else range(shard_count)
+        return (g_id >> 22) % shard_count in shard_ids
 
     async def signal_ready(self, guild: discord.Guild) -> None:
         """
-        This method informs each server that Smorg is online. If Smorg does not recognize a certain server,
+        This method informs a server that Smorg is online. If Smorg does not recognize a certain server,
         that server also has information about it stored in Smorg's database.
 
         :param discord.Guild guild: a Discord Guild of which Smorg is a member.
         """
-        if Guild.exists_with(guild.id):
-            channel_id: int = Guild.get_reminder_channel_by(guild.id)
-            ready_channel: discord.TextChannel = self.bot.get_channel(channel_id)
-            if self.say_hello:
-                await ready_channel.send(StaticText.REGULAR_ON_READY_TEXT)
+        is_new_guild: bool = not await Guild.exists_with.awaitable(guild.id)
+        if is_new_guild:
+            await Guild.create_guild_with.awaitable(guild.id, self.find_default_channel_id(guild))
+        if self.say_hello:
+            await self.greet(guild, is_new_guild)
+
+    async def greet(self, guild: discord.Guild, is_new_guild: bool) -> None:
+        """
+        This method sends Smorg's greeting to a Guild's reminder channel, if Smorg knew the Guild,
+        or to its default channel, if Smorg did not. A Guild without text channels is greeted through its owner.
+
+        :param discord.Guild guild: a Discord Guild of which Smorg is a member.
+        :param bool is_new_guild: whether Smorg has just stored information about the Guild.
+        """
+        if not is_new_guild:
+            channel_id: Union[int, None] = await Guild.get_reminder_channel_by.awaitable(guild.id)
+            ready_channel: Union[discord.abc.Messageable, None] = self.bot.get_channel(channel_id)
+            greeting: str = StaticText.REGULAR_ON_READY_TEXT
         elif guild.text_channels:
-            general_channels: list = [channel for channel in guild.text_channels if channel.name == 'general']
-            if general_channels or len(guild.text_channels) > 0:
-                default_channel_id: int = general_channels[0].id
-            else:
-                default_channel_id = guild.text_channels[0].id
-            Guild.create_guild_with(guild.id, default_channel_id)
-            ready_channel = self.bot.get_channel(default_channel_id)
-            if self.say_hello:
-                await ready_channel.send(StaticText.NEW_ON_READY_TEXT)
+            ready_channel = self.bot.get_channel(self.find_default_channel_id(guild))
+            greeting = StaticText.NEW_ON_READY_TEXT
         else:
-            Guild.create_guild_with(guild.id, None)
             guild_owner: discord.Member = guild.owner
             if not guild_owner.dm_channel:
                 await self.bot.get_user(guild_owner.id).create_dm()
             ready_channel = guild_owner.dm_channel
-            if self.say_hello:
-                await ready_channel.send(StaticText.ERROR_ON_READY_TEXT)
+            greeting = StaticText.ERROR_ON_READY_TEXT
+        if ready_channel:
+            await ready_channel.send(greeting)
+
+    @staticmethod
+    def find_default_channel_id(guild: discord.Guild) -> Union[int, None]:
+        """
+        This method chooses the channel that a new Guild's quotations and reminders are sent to:
+        its first channel named general, or else its first text channel.
+
+        :param discord.Guild guild: a Discord Guild of which Smorg is a member.
+        :return Union[int, None]: the ID of the chosen channel, if the Guild has any text channels.
+        """
+        general_channels: list = [channel for channel in guild.text_channels if channel.name == 'general']
+        if general_channels:
+            default_channel_id: Union[int, None] = general_channels[0].id
+        elif guild.text_channels:
+            default_channel_id = guild.text_channels[0].id
+        else:
+            default_channel_id = None
+        return default_channel_id
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
@@ -77,6 +143,17 @@ class Hearer(commands.Cog, Exceptioner):
         """
         await self.signal_ready(guild)
 
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        """
+        This method occurs when a Guild becomes available. If it was unavailable when Smorg reconciled its Guilds,
+        Smorg stores information about it now, if it has none; Guilds available before then are reconciled in bulk.
+
+        :param discord.Guild guild: a Discord Guild which has just become available.
+        """
+        if self.has_reconciled and not await Guild.exists_with.awaitable(guild.id):
+            await Guild.create_guild_with.awaitable(guild.id, self.find_default_channel_id(guild))
+
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         """
@@ -84,7 +161,7 @@ class Hearer(commands.Cog, Exceptioner):
 
         :param discord.Guild guild: a Discord Guild which Smorg has just left.
         """
-        Guild.delete_guild_with(guild.id)
+        await Guild.delete_guild_with.awaitable(guild.id)
 
     @commands.Cog.listener()
     async def on_command_error(self, ctx: commands.Context, error: Exception) -> None:
@@ -139,6 +216,17 @@ class Hearer(commands.Cog, Exceptioner):
                     error_description = 'An operator that was applied was invalid.'
                 elif isinstance(error, InvalidFunction):
                     error_description = 'A function that was applied was invalid.'
+                elif isinstance(error, DuplicateQuote):
+                    error_description = 'Your Guild has already immortalized that quote.'
+                elif isinstance(error, MissingQuote):
+                    error_description = 'Your Guild does not have a quote with that number.'
+                elif isinstance(error, InvalidImport):
+                    if error.line_number is None:
+                        error_description = 'You must attach an NDJSON or CSV file of quotes to import.'
+                    else:
+                        error_description = f'Line {error.line_number} of your attachment is not a valid quote.'
+                elif isinstance(error, MissingPageTrail):
+                    error_description = 'You have not displayed any quotes or reminders in this Guild to continue from.'
                 else:
                     error_description = 'Something about your input could not be processed.'
             elif isinstance(error, commands.CheckFailure):
@@ -62,7 +62,7 @@ class Helper(Chronologist, commands.Cog, Embedder):
         :param commands.Context ctx: the context from which the command was made.
         :param str new_prefix: the new prefix that Smorg will use to identify a certain Guild's Command calls.
         """
-        Guild.update_prefix(ctx.guild.id, new_prefix)
+        await Guild.update_prefix.awaitable(ctx.guild.id, new_prefix)
         await ctx.send(f"You've updated your Guild's prefix to '{new_prefix}'.")
 
     @commands.command(description=HelpDescription.PURGE)
@@ -1,24 +1,27 @@
 """
 This module holds the quoter Cog. Its functionality revolves around user-supplied quotations.
-It consists of three Command objects: quote, immortalize, and yoink.
+It consists of four Command objects: quote, immortalize, yoink, and archive.
 """
 
+import csv
 import discord
+import json
 from discord.ext import commands
-from random import randint
-from typing import Union
+from tempfile import TemporaryFile
+from typing import Optional, Union
 
 from .Helpers.checker import Checker
-from .Helpers.exceptioner import Exceptioner
-from .Helpers.Enumerators.universalist import ColorConstant, HelpDescription
+from .Helpers.exceptioner import DuplicateQuote, Exceptioner, InvalidImport, MissingQuote, MissingSubcommand
+from .Helpers.Enumerators.universalist import ColorConstant, DiscordConstant, HelpDescription
 from ..smorgasDB import Guild, Quote
 
 
 class Quoter(commands.Cog, Exceptioner):
     """
-    This class centers around quotations and currently has three pertinent Command objects:
-    quote, immortalize, and yoink. The first embeds a quote; the second does the same and saves it to Smorg's database;
-    the third retrieves a random quotation from the database and displays it.
+    This class centers around quotations and currently has four pertinent Command objects:
+    quote, immortalize, yoink, and archive. The first embeds a quote; the second does the same and saves it to Smorg's
+    database; the third retrieves a random quotation from the database and displays it;
+    the fourth exports a Guild's quotations to a file or imports them from one.
     """
     def __init__(self, bot: commands.AutoShardedBot):
         self.bot = bot
@@ -39,16 +42,17 @@ class Quoter(commands.Cog, Exceptioner):
     async def immortalize(self, ctx: commands.Context, text: str,
                           author: Union[discord.Member, str, None] = None) -> None:
         """
-        This method, using the helper method handle_quote(), embeds a supplied quotation with an optional author.
-        Then, it saves this quote and author to the database.
+        This method saves a supplied quotation with an optional author to the database.
+        Then, using the helper method handle_quote(), it embeds them, unless the Guild had already saved them.
 
         :param commands.Context ctx: the context from which the command was made.
         :param str text: the actual quotation.
         :param Union[discord.Member, str, None] author: the author of the given quotation, if desired.
         """
         text_author: str = await self.handle_author(author, anonymous_default="A True Legend")
+        if not await Quote.create_quote_with.awaitable(ctx.guild.id, text, text_author):
+            raise DuplicateQuote
         await self.handle_quote(ctx, text, text_author, "The Masterpiece of ", ColorConstant.HEAVENLY_YELLOW)
-        Quote.create_quote_with(ctx.guild.id, text, text_author)
 
     async def handle_quote(self, ctx: commands.Context, text: str, author: Union[discord.Member, str, None],
                            title_without_author: str, color: ColorConstant) -> None:
@@ -63,7 +67,7 @@ class Quoter(commands.Cog, Exceptioner):
         :param ColorConstant color: the color of the left side of the Embed.
         """
         current_guild_id: int = ctx.guild.id
-        quotation_channel_id: Union[int, None] = Guild.get_quotation_channel_by(current_guild_id)
+        quotation_channel_id: Union[int, None] = await Guild.get_quotation_channel_by.awaitable(current_guild_id)
         current_channel: discord.TextChannel = self.bot.get_channel(quotation_channel_id) or ctx.channel
         quote_response = discord.Embed(
             title=title_without_author + author,
@@ -93,18 +97,108 @@ class Quoter(commands.Cog, Exceptioner):
 
     @commands.command(description=HelpDescription.YOINK)
     @commands.check(Checker.is_yoinkable)
-    async def yoink(self, ctx: commands.Context) -> None:
+    async def yoink(self, ctx: commands.Context, quote_number: Optional[int] = None) -> None:
         """
         This method retrieves a random Quote formed by the calling Guild in the database.
+        If a number is given, it instead retrieves the Guild's Quote with that number.
 
         :param commands.Context ctx: the context from which the command was made.
+        :param Optional[int] quote_number: the number of a specific Quote to retrieve, if desired.
         """
-        current_guild_id: int = ctx.guild.id
-        maximum: int = Quote.count_quotes(current_guild_id) - 1
-        yoinked_quote: Quote = Quote.get_random_quote_by(current_guild_id, randint(0, maximum))
+        if quote_number is None:
+            yoinked_quote: Quote = await Quote.get_random_quote_by.awaitable(ctx.guild.id)
+        else:
+            yoinked_quote = await Quote.get_quote_by.awaitable(ctx.guild.id, quote_number)
+            if not yoinked_quote:
+                raise MissingQuote
         yoink_response: discord.Embed = discord.Embed(
             title=f'The Legendary Words of {yoinked_quote.author or "A Forgotten Prodigy"}',
             description=yoinked_quote.text,
             color=ColorConstant.HOT_PINK
         )
+        yoink_response.set_footer(text=f'Quote {yoinked_quote.guild_quote_number}')
         await ctx.send(embed=yoink_response)
+
+    @commands.group(description=HelpDescription.ARCHIVE)
+    @commands.has_guild_permissions(manage_guild=True)
+    async def archive(self, ctx: commands.Context) -> None:
+        """
+        This Command allows a Guild's administrators to move its quotes in and out of Smorg in bulk.
+        Its subcommands include export and import.
+
+        :param commands.Context ctx: the context from which the command was made.
+        """
+        if ctx.invoked_subcommand is None:
+            raise MissingSubcommand
+
+    @archive.command(name='export')
+    async def export_quotes(self, ctx: commands.Context) -> None:
+        """
+        This method sends a Guild's quotes as an attached NDJSON file, one quote per line.
+        The quotes are streamed from the database into a temporary file, so only a batch of them is held at a time.
+
+        :param commands.Context ctx: the context from which the command was made.
+        """
+        with TemporaryFile() as export_file:
+            async for quote_number, quote_author, quote_text in Quote.stream_quotes_by(ctx.guild.id):
+                quote_record: dict = {"number": quote_number, "author": quote_author, "text": quote_text}
+                export_file.write(f"{json.dumps(quote_record, ensure_ascii=False)}\n".encode("utf-8"))
+            export_file.seek(0)
+            await ctx.send(file=discord.File(export_file, filename=f"quotes-{ctx.guild.id}.ndjson"))
+
+    @archive.command(name='import')
+    async def import_quotes(self, ctx: commands.Context) -> None:
+        """
+        This method stores the quotes in an NDJSON or CSV file attached to the command's message.
+        Each quote needs text and may have an author; quotes that the Guild already has are skipped.
+
+        :param commands.Context ctx: the context from which the command was made.
+        """
+        if not ctx.message.attachments:
+            raise InvalidImport
+        attachment: discord.Attachment = ctx.message.attachments[0]
+        try:
+            attachment_lines: list = (await attachment.read()).decode("utf-8-sig").splitlines(keepends=True)
+        except UnicodeDecodeError:
+            raise InvalidImport
+        quote_records: list = []
+        if attachment.filename.lower().endswith(".csv"):
+            # A quoted field may span lines, so each quote is numbered by the reader's line count once it is read.
+            csv_reader: csv.DictReader = csv.DictReader(attachment_lines)
+            quote_records.extend((csv_reader.line_num, quote_record) for quote_record in csv_reader)
+        elif attachment.filename.lower().endswith((".ndjson", ".jsonl", ".json")):
+            for line_number, attachment_line in enumerate(attachment_lines, start=1):
+                if attachment_line.strip():
+                    try:
+                        quote_records.append((line_number, json.loads(attachment_line)))
+                    except json.JSONDecodeError:
+                        raise InvalidImport(line_number)
+        else:
+            raise InvalidImport
+        quotes: list = [
+            await self.handle_quote_record(quote_record, line_number) for line_number, quote_record in quote_records
+        ]
+        imported_count: int = await Quote.import_quotes_with.awaitable(ctx.guild.id, quotes)
+        import_response: discord.Embed = discord.Embed(
+            title="The Archives Grow",
+            description=f"{imported_count} of the {len(quotes)} quotes in your file were stored; "
+                        f"the rest were already stored.",
+            color=ColorConstant.HEAVENLY_YELLOW
+        )
+        await ctx.send(embed=import_response)
+
+    async def handle_quote_record(self, quote_record: dict, line_number: int) -> tuple:
+        """
+        This method checks and finalizes one quote read from an imported file.
+
+        :param dict quote_record: the quote's fields, which must include text and may include an author.
+        :param int line_number: the line of the file on which the quote ends.
+        :return tuple: the finalized author and text of the quote.
+        """
+        if not isinstance(quote_record, dict) or not isinstance(quote_record.get("text"), str) \
+                or not quote_record["text"].strip() or not isinstance(quote_record.get("author") or "", str):
+            raise InvalidImport(line_number)
+        author: str = await self.handle_author(quote_record.get("author"), anonymous_default="A True Legend")
+        if len(author) > DiscordConstant.MAX_ROLE_LENGTH:
+            raise InvalidImport(line_number)
+        return author, quote_record["text"]
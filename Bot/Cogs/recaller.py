@@ -1,34 +1,61 @@
 """
 This module contains the recaller Cog. It revolves around the setting, altering, activating, and deleting of reminders.
 Reminders are notifications that Smorg pings some mention with at a specified datetime with an optional message.
-It consists of three commands: remind, forget, and revise.
+It consists of four commands: remind, forget, revise, and recur.
 """
 
-from datetime import datetime
+import asyncio
+
+from datetime import datetime, timedelta, timezone
 from discord import DiscordException, Embed, Member, Role, TextChannel
-from discord.ext import commands, tasks
+from discord.ext import commands
+from functools import partial
+from socket import gethostname
 from sqlalchemy.exc import DataError
 from typing import Optional, Union
+from uuid import uuid4
 
 from .Helpers.chronologist import Chronologist
-from .Helpers.exceptioner import Exceptioner, MissingReminder
-from .Helpers.Enumerators.universalist import DiscordConstant, HelpDescription, StaticText
-from ..smorgasDB import Guild, Reminder
+from .Helpers.dispatcher import ReminderDispatcher
+from .Helpers.exceptioner import Exceptioner, InvalidRecurrence, MissingReminder
+from .Helpers.Enumerators.timekeeper import SchedulerConstant
+from .Helpers.Enumerators.universalist import DiscordConstant, HelpDescription, MentionableType, StaticText
+from .Helpers.recurrence import RecurrenceRule
+from .Helpers.scheduler import ReminderScheduler
+from ..smorgasDB import BaseAddition, Guild, Reminder
 
 
 class Recaller(commands.Cog, Chronologist, Exceptioner):
     """
-    This class centers around reminders. Pertaining to said reminders are three Command objects:
-    remind, revise, and forget. The first creates a reminder based on a mention, a written-out datetime,
+    This class centers around reminders. Pertaining to said reminders are four Command objects:
+    remind, revise, forget, and recur. The first creates a reminder based on a mention, a written-out datetime,
     and an optional message. The second revises either a reminder's scheduled time or a reminder's message
-    (or both) based on given input. Finally, the third deletes a reminder from the database.
-    This class also handles the actual pinging process, running a check every minute to see if a reminder
-    should be sent. Once a reminder is sent, it is deleted from the database.
+    (or both) based on given input. The third deletes a reminder from the database.
+    Finally, the fourth makes a reminder repeat by a RecurrenceRule, or stops it from repeating.
+    This class also handles the actual pinging process through a ReminderScheduler, which sleeps until
+    the next reminder is due and is woken early by these commands once their changes are committed,
+    and a ReminderDispatcher,
+    which sends due reminders concurrently. Once a reminder is due, this bot process claims it under a lease,
+    so that no other process sends it too, and deletes it from the database, or moves it on to its next occurrence,
+    once it has been sent. A process's claimant name is unique to it, even across restarts.
     """
     def __init__(self, bot: commands.AutoShardedBot):
         self.bot = bot
         super().__init__()
-        self.check_reminders.start()
+        self.reminder_dispatcher: ReminderDispatcher = ReminderDispatcher(
+            Guild.get_reminder_channels_by.awaitable, self.bot.get_channel
+        )
+        self.reminder_scheduler: ReminderScheduler = ReminderScheduler(
+            Reminder.get_due_times_before.awaitable, self.claim_due_reminders, self.deliver_reminders
+        )
+        self.claimant: str = f"{gethostname()[:Reminder.CLAIMANT_LENGTH - 33]}:{uuid4().hex}"
+        self.scheduler_task: asyncio.Task = self.bot.loop.create_task(self.run_reminder_scheduler())
+
+    def cog_unload(self) -> None:
+        """
+        This method stops the ReminderScheduler when the Cog is unloaded.
+        """
+        self.scheduler_task.cancel()
 
     @commands.command(description=HelpDescription.REMIND)
     async def remind(self, ctx: commands.Context, mentionable: Union[Member, Role], reminder_time: str,
@@ -46,8 +73,11 @@ class Recaller(commands.Cog, Chronologist, Exceptioner):
         """
         current_guild_id = ctx.guild.id
         validated_datetime: datetime = await self.handle_time(reminder_time)
-        Reminder.create_reminder_with(current_guild_id, mentionable.mention, message, validated_datetime)
-        reminder_channel_id: Union[int, None] = Guild.get_reminder_channel_by(current_guild_id)
+        await Reminder.create_reminder_with.awaitable(
+            current_guild_id, MentionableType.of(mentionable), mentionable.id, message, validated_datetime
+        )
+        BaseAddition.call_after_commit(partial(self.reminder_scheduler.schedule, validated_datetime))
+        reminder_channel_id: Union[int, None] = await Guild.get_reminder_channel_by.awaitable(current_guild_id)
         current_channel: TextChannel = self.bot.get_channel(reminder_channel_id) or ctx.channel
         await current_channel.send(StaticText.REMINDER_NOTIFICATION)
 
@@ -70,14 +100,18 @@ class Recaller(commands.Cog, Chronologist, Exceptioner):
         :param Optional[str] new_message: new, replacement text to provide a reminder with context.
         """
         current_guild_id = ctx.guild.id
+        target_type: MentionableType = MentionableType.of(mentionable)
         old_datetime: datetime = await self.handle_time(old_reminder_time)
-        reminder_channel_id: Union[int, None] = Guild.get_reminder_channel_by(current_guild_id)
+        reminder_channel_id: Union[int, None] = await Guild.get_reminder_channel_by.awaitable(current_guild_id)
         current_channel: TextChannel = self.bot.get_channel(reminder_channel_id) or ctx.channel
-        if Reminder.has_reminder_with(current_guild_id, mentionable.mention, old_datetime):
+        if await Reminder.has_reminder_with.awaitable(current_guild_id, target_type, mentionable.id, old_datetime):
             new_datetime: datetime = await self.handle_time(new_reminder_time)
-            Reminder.update_reminder_with(
-                current_guild_id, mentionable.mention, old_datetime, new_datetime, new_message
+            await Reminder.update_reminder_with.awaitable(
+                current_guild_id, target_type, mentionable.id, old_datetime, new_datetime, new_message
             )
+            if new_datetime:
+                BaseAddition.call_after_commit(partial(self.reminder_scheduler.unschedule, old_datetime))
+                BaseAddition.call_after_commit(partial(self.reminder_scheduler.schedule, new_datetime))
             await current_channel.send(StaticText.REVISED_REMINDER_NOTIFICATION)
         else:
             raise MissingReminder
@@ -94,17 +128,58 @@ class Recaller(commands.Cog, Chronologist, Exceptioner):
         "HH:MM PP TZ; DD MONTH YY", where all components but the hour are optional and defaults,
         barring the minute being 0 and the time zone being UTC, are based on the given time zone.
         """
-        mention: str = mentionable.mention
+        target_type: MentionableType = MentionableType.of(mentionable)
         current_guild_id = ctx.guild.id
-        reminder_channel_id: Union[int, None] = Guild.get_reminder_channel_by(current_guild_id)
+        reminder_channel_id: Union[int, None] = await Guild.get_reminder_channel_by.awaitable(current_guild_id)
         current_channel: TextChannel = self.bot.get_channel(reminder_channel_id) or ctx.channel
         validated_datetime: datetime = await self.handle_time(reminder_time)
-        if Reminder.has_reminder_with(current_guild_id, mention, validated_datetime):
-            Reminder.delete_reminder_with(current_guild_id, mention, validated_datetime)
+        reminder_exists: bool = await Reminder.has_reminder_with.awaitable(
+            current_guild_id, target_type, mentionable.id, validated_datetime
+        )
+        if reminder_exists:
+            await Reminder.delete_reminder_with.awaitable(
+                current_guild_id, target_type, mentionable.id, validated_datetime
+            )
+            BaseAddition.call_after_commit(partial(self.reminder_scheduler.unschedule, validated_datetime))
             await current_channel.send(StaticText.FORGOTTEN_REMINDER_NOTIFICATION)
         else:
             raise MissingReminder
 
+    @commands.command(description=HelpDescription.RECUR)
+    async def recur(self, ctx: commands.Context, mentionable: Union[Member, Role], reminder_time: str, *,
+                    rule: str) -> None:
+        """
+        This Command allows the user to make a reminder repeat. To do so, they must specify the reminder
+        with its mentionable and scheduled time, and then give a rule by which it repeats.
+        Only the reminder's next occurrence is stored; each time it is sent, it moves on to the one after.
+
+        :param commands.Context ctx: the context from which the command was made.
+        :param Union[Member, Role] mentionable: the mentionable item to which a reminder is to be sent.
+        :param str reminder_time: the raw time at which a reminder is to be sent. It should be of the format:
+        "HH:MM PP TZ; DD MONTH YY", where all components but the hour are optional and defaults,
+        barring the minute being 0 and the time zone being UTC, are based on the given time zone.
+        :param str rule: how the reminder repeats: an interval, such as "every 2 days" or "weekly",
+        days of the week, such as "on mon, wed, fri" or "on weekdays", or "never", which stops it from repeating.
+        Days of the week are those of the time zone in which reminder_time is given.
+        """
+        target_type: MentionableType = MentionableType.of(mentionable)
+        current_guild_id = ctx.guild.id
+        validated_datetime: datetime = await self.handle_time(reminder_time)
+        recurrence_rule: Union[RecurrenceRule, None] = RecurrenceRule.parse(rule, validated_datetime.utcoffset())
+        reminder_channel_id: Union[int, None] = await Guild.get_reminder_channel_by.awaitable(current_guild_id)
+        current_channel: TextChannel = self.bot.get_channel(reminder_channel_id) or ctx.channel
+        reminder_exists: bool = await Reminder.has_reminder_with.awaitable(
+            current_guild_id, target_type, mentionable.id, validated_datetime
+        )
+        if reminder_exists:
+            await Reminder.update_recurrence_with.awaitable(
+                current_guild_id, target_type, mentionable.id, validated_datetime,
+                recurrence_rule.compose_rule() if recurrence_rule is not None else None
+            )
+            await current_channel.send(StaticText.RECURRING_REMINDER_NOTIFICATION)
+        else:
+            raise MissingReminder
+
     async def handle_time(self, reminder_time: str) -> datetime:
         """
         This method takes a raw string time and converts it into a valid datetime object;
@@ -129,6 +204,7 @@ class Recaller(commands.Cog, Chronologist, Exceptioner):
     @remind.error
     @revise.error
     @forget.error
+    @recur.error
     async def reminder_error(self, ctx: commands.Context, error: Exception) -> None:
         """
         This method handles errors exclusive to the reminder Command.
@@ -145,6 +221,9 @@ class Recaller(commands.Cog, Chronologist, Exceptioner):
                                 f'{DiscordConstant.MAX_EMBED_FIELD_VALUE} characters.'
         elif isinstance(error, MissingReminder):
             error_description = 'Your server does not have a reminder scheduled for that time and mention.'
+        elif isinstance(error, InvalidRecurrence):
+            error_description = 'Your reminder can repeat at an interval, such as "every 2 days" or "weekly", ' \
+                                'on days of the week, such as "on mon, wed, fri" or "on weekdays", or "never".'
         elif not isinstance(error, DiscordException):
             error_description = f'The error is a non-Discord error. It has the following message: {error}. ' \
                                 f'It should be added and handled properly as soon as possible.'
@@ -152,34 +231,38 @@ class Recaller(commands.Cog, Chronologist, Exceptioner):
             error_embed: Embed = await self.initialize_error_embed(command_name, error_name, error_description)
             await ctx.send(embed=error_embed)
 
-    @tasks.loop(minutes=1)
-    async def check_reminders(self) -> None:
+    async def run_reminder_scheduler(self) -> None:
         """
-        This method checks to see whether a reminder is ready to be sent using the database method
-        pop_reminders_at(). For every reminder that that method returns, this method uses the on_reminder() method
-        to send the reminder to the appropriate Guild.
+        This method runs the ReminderScheduler once the bot is actually ready. Waiting is a safeguard
+        to prevent passed but non-deleted reminders from being sent before their channels can be found.
         """
-        current_time: datetime = datetime.now().replace(microsecond=0)
-        current_reminders: list = Reminder.pop_reminders_at(current_time)
-        for reminder in current_reminders:
-            await self.on_reminder(reminder.guild_id, reminder.mentionable, reminder.reminder_text)
+        await self.bot.wait_until_ready()
+        await self.reminder_scheduler.run()
 
-    @check_reminders.before_loop
-    async def before_checking_reminders(self) -> None:
+    async def claim_due_reminders(self, current_time: datetime) -> list:
         """
-        This method assures that the bot is actually ready before checking to see whether there are any reminders
-        to be sent. It's a safeguard to prevent passed but non-deleted reminders from being sent,
-        should they linger in the database for some reason.
+        This method claims a batch of the reminders that are due from the database for the ReminderScheduler.
+
+        :param datetime current_time: the time zone aware date and time by which reminders are due.
+        :return list: the Reminder rows that are due and were claimed by this process.
         """
-        await self.bot.wait_until_ready()
+        return await Reminder.claim_reminders_at.awaitable(
+            current_time, self.claimant, timedelta(seconds=SchedulerConstant.LEASE_SECONDS),
+            SchedulerConstant.CLAIM_BATCH_SIZE
+        )
 
-    async def on_reminder(self, guild_id: int, mention: str, message: str) -> None:
+    async def deliver_reminders(self, due_reminders: list) -> None:
         """
-        This method sends a reminder to a designated channel for a certain Guild.
+        This method sends claimed reminders through the ReminderDispatcher and then acknowledges them,
+        so that they are deleted from the database. Reminders that could not be sent are acknowledged all the same,
+        as the dispatcher has logged them; only those that are never acknowledged are claimed again,
+        as soon as their lease expires.
+        Recurring reminders have moved on to their next occurrences, which are scheduled in turn.
 
-        :param int guild_id: the ID of the Guild to which the mention and message belong.
-        :param str mention: the characters representing a ping for the one whom the reminder is for.
-        :param str message: additional text to provide a reminder with context.
+        :param list due_reminders: the Reminder rows that were claimed.
         """
-        reminder_channel = self.bot.get_channel(Guild.get_reminder_channel_by(guild_id))
-        await reminder_channel.send(f"Reminder for {mention}: {message}")
+        await self.reminder_dispatcher.dispatch(due_reminders)
+        for next_occurrence in await Reminder.acknowledge_reminders.awaitable(
+            due_reminders, self.claimant, datetime.now(timezone.utc)
+        ):
+            self.reminder_scheduler.schedule(next_occurrence)
@@ -1,79 +1,881 @@
 """
 This file holds Smorg's database implementation. Currently, it applies sqlalchemy to perform most of its operations.
-It contains, firstly, the BaseAddition mix-in that adds a couple utilities to each of the database tables.
-Second, it defines three tables as various operations related to them: Guild, Quote, and Reminder.
+It contains, firstly, the engine and its MeasuredQueuePool, which counts how long connections are waited for,
+and the optional sampled query log. The engine is made by create_database_engine for one of two backends:
+a PostgreSQL server or an embedded SQLite file. Where the two differ, methods take dialect-specific paths.
+It also contains the GuildSettingsCache, which keeps each Guild's prefix and channels in memory,
+and the ConnectionLeakDetector, which can report pooled connections that are held for too long.
+The engines may be several database shards: each Guild's rows live on the one that route_guild picks for it.
+Second, it contains the BaseAddition mix-in that adds a couple utilities to each of the database tables,
+including the per-command unit of work that Smorg's commands share their database work through
+and the routing of each database action to its Guild's shard.
+Third, it defines three tables as various operations related to them: Guild, Quote, and Reminder.
+Finally, it defines the SchemaVersion table and the ordered SCHEMA_MIGRATIONS that bootstrap_database applies.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import hashlib
+import inspect
+import logging
+import os
+import random
 import sqlalchemy
+import time
+import traceback
 
-from datetime import datetime
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from discord import Message
-from discord.ext.commands import Bot
-from functools import wraps
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, SmallInteger, String
+from discord.ext.commands import Bot, Context
+from functools import partial, wraps
+from itertools import chain
+from sqlalchemy import BigInteger, Column, DDL, DateTime, ForeignKey, Index, Integer, SmallInteger, String, event
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, query
-from typing import Callable, Union
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.types import TypeDecorator
+from threading import Event, Lock, Thread
+from types import SimpleNamespace
+from typing import AsyncIterator, Callable, NamedTuple, Union
 
 from . import secretbord
-from .Cogs.Helpers.Enumerators.universalist import DiscordConstant
+from .Cogs.Helpers.Enumerators.universalist import DiscordConstant, MentionableType
+from .Cogs.Helpers.recurrence import RecurrenceRule
 
 
-engine = sqlalchemy.create_engine(
-    f"{secretbord.database}+{secretbord.dialect}://{secretbord.username}:{secretbord.password}@"
-    f"{secretbord.host}:{secretbord.port}/{secretbord.database_name}",
-    connect_args=secretbord.options, echo=True
+class PoolMetrics(NamedTuple):
+    """
+    This class is a snapshot of the connection pool's state and of the time spent waiting on it.
+    Checkouts count every attempt, including those that timed out.
+    Wait times, in seconds, include the time taken to open a new connection when the pool has none idle.
+    """
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait: float
+    maximum_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.checkouts if self.checkouts else 0.0
+
+
+class IndexSizes(NamedTuple):
+    """
+    This class is the size of an index, in bytes, before and after a migration rebuilt it.
+    """
+    before: int
+    after: int
+
+    def __str__(self) -> str:
+        return f"{self.before} bytes before and {self.after} bytes after"
+
+
+class MeasuredQueuePool(QueuePool):
+    """
+    This class is a QueuePool that counts its checkouts and timeouts and measures how long each checkout waits.
+    Its metrics method gives a PoolMetrics snapshot, so that the pool can be tuned under real load.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics_lock: Lock = Lock()
+        self.checkouts: int = 0
+        self.timeouts: int = 0
+        self.total_wait: float = 0.0
+        self.maximum_wait: float = 0.0
+
+    def _do_get(self):
+        wait_started_at: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sqlalchemy.exc.TimeoutError:
+            with self.metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited_for: float = time.perf_counter() - wait_started_at
+            with self.metrics_lock:
+                self.checkouts += 1
+                self.total_wait += waited_for
+                self.maximum_wait = max(self.maximum_wait, waited_for)
+
+    def metrics(self) -> PoolMetrics:
+        """
+        This method takes a snapshot of the pool's state and of its counters.
+
+        :return PoolMetrics: the pool's current state and its counters since it was created.
+        """
+        with self.metrics_lock:
+            return PoolMetrics(
+                self.size(), self.checkedin(), self.checkedout(), max(self.overflow(), 0),
+                self.checkouts, self.timeouts, self.total_wait, self.maximum_wait
+            )
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    This class is a timezone-aware DateTime type that behaves the same on every backend.
+    PostgreSQL stores time zones itself; SQLite does not, so its values are stored in UTC and given UTC back.
+    """
+    impl = DateTime(timezone=True)
+
+    def process_bind_param(self, value: Union[datetime, None], dialect) -> Union[datetime, None]:
+        if dialect.name == 'sqlite' and value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: Union[datetime, None], dialect) -> Union[datetime, None]:
+        if dialect.name == 'sqlite' and value is not None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
+def configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """
+    This function is an engine listener that prepares each new SQLite connection.
+    It turns on write-ahead logging, so that readers and the writer do not block each other, and foreign keys,
+    so that deletions cascade. It also stops pysqlite from managing transactions itself,
+    so that begin_sqlite_transaction can begin each transaction before its first statement, as PostgreSQL does.
+    """
+    dbapi_connection.isolation_level = None
+    sqlite_cursor = dbapi_connection.cursor()
+    for pragma in ("journal_mode = WAL", "synchronous = NORMAL", "foreign_keys = ON"):
+        sqlite_cursor.execute(f"PRAGMA {pragma}")
+    sqlite_cursor.close()
+
+
+def begin_sqlite_transaction(connection) -> None:
+    """
+    This function is an engine listener that begins a transaction on SQLite.
+    """
+    connection.execute("BEGIN")
+
+
+def translate_sqlite_error(context) -> Union[DataError, None]:
+    """
+    This function is an engine listener that raises a DataError when SQLite rejects an overlong value,
+    as PostgreSQL does; SQLite's length limits are enforced by the triggers from enforce_sqlite_lengths.
+    """
+    if str(context.original_exception).startswith("value too long"):
+        return DataError(context.statement, context.parameters, context.original_exception)
+
+
+def create_database_engine(settings) -> sqlalchemy.engine.Engine:
+    """
+    This function creates the engine for the database backend that some settings name.
+    If the database is "sqlite", it is embedded in the file named by database_name and used in write-ahead logging mode;
+    otherwise, it is a server reached through the dialect, credentials, host, and port in the settings.
+    Either way, connections are held in a MeasuredQueuePool that the settings can configure.
+
+    :param settings: the database settings, as held by secretbord.
+    :return sqlalchemy.engine.Engine: an engine for the configured database.
+    """
+    pool_timeout: float = getattr(settings, "pool_timeout", 30)
+    pool_arguments: dict = {
+        "poolclass": MeasuredQueuePool, "pool_size": getattr(settings, "pool_size", 5),
+        "max_overflow": getattr(settings, "pool_max_overflow", 10), "pool_timeout": pool_timeout,
+        "pool_recycle": getattr(settings, "pool_recycle", -1), "pool_pre_ping": getattr(settings, "pool_pre_ping", True)
+    }
+    if settings.database == 'sqlite':
+        database_engine: sqlalchemy.engine.Engine = sqlalchemy.create_engine(
+            f"sqlite:///{settings.database_name}",
+            connect_args={"check_same_thread": False, "timeout": pool_timeout, **getattr(settings, "options", {})},
+            **pool_arguments
+        )
+        event.listen(database_engine, "connect", configure_sqlite_connection)
+        event.listen(database_engine, "begin", begin_sqlite_transaction)
+        event.listen(database_engine, "handle_error", translate_sqlite_error, retval=True)
+    else:
+        database_engine = sqlalchemy.create_engine(
+            f"{settings.database}+{settings.dialect}://{settings.username}:{settings.password}@"
+            f"{settings.host}:{settings.port}/{settings.database_name}",
+            connect_args=settings.options, **pool_arguments
+        )
+    return database_engine
+
+
+# Each shard's settings override secretbord's, so that a shard need only name what differs, such as its host.
+engines: tuple = tuple(
+    create_database_engine(SimpleNamespace(**{**vars(secretbord), **shard_settings}))
+    for shard_settings in getattr(secretbord, "database_shards", [{}])
 )
+if len({shard_engine.dialect.name for shard_engine in engines}) > 1:
+    raise ValueError("Every database shard must use the same backend.")
+engine = engines[0]
 Base = declarative_base(bind=engine)
-Session = sessionmaker(bind=engine)
+Session = sessionmaker(bind=engine, expire_on_commit=False)
+unit_of_work: contextvars.ContextVar = contextvars.ContextVar("unit_of_work", default=None)
+database_shard: contextvars.ContextVar = contextvars.ContextVar("database_shard", default=0)
+database_executor = ThreadPoolExecutor(
+    max_workers=getattr(secretbord, "database_workers", 5), thread_name_prefix="smorgasDB"
+)
+shard_executor = ThreadPoolExecutor(max_workers=len(engines), thread_name_prefix="smorgasDB-shard")
+
+
+def route_guild(g_id: int) -> int:
+    """
+    This function finds the database shard that owns a Guild's rows. It uses Discord's own sharding formula,
+    so that, when there are as many databases as gateway shards, each gateway shard's Guilds share one database.
+
+    :param int g_id: the Guild ID of the Guild whose rows are sought.
+    :return int: the index, within engines, of the database that holds the Guild's rows.
+    """
+    return (g_id >> 22) % len(engines)
+
+
+def current_engine() -> sqlalchemy.engine.Engine:
+    """
+    This function gives the engine of the database shard that the current context works on:
+    the first one, unless a cross-shard operation has selected another.
+
+    :return sqlalchemy.engine.Engine: the engine of the current database shard.
+    """
+    return engines[database_shard.get()]
+
+
+def open_session(g_id: Union[int, None] = None) -> Session:
+    """
+    This function opens a Session on the database that owns a Guild, or, without one, on the current database shard.
+
+    :param Union[int, None] g_id: the Guild ID of the Guild whose rows the Session works on, if any.
+    :return Session: a Session bound to the relevant database shard.
+    """
+    return Session(bind=current_engine() if g_id is None else engines[route_guild(g_id)])
+
+
+class GuildSettingsCache:
+    """
+    This class is a size-bounded cache of each Guild's settings--its prefix and its designated channels.
+    It evicts the least recently used Guild once it is full. Guild's update methods write through to it
+    once their changes commit, so that the prefix and channel getters only query the database on a miss
+    and never serve settings that were rolled back.
+    It is shared between the event loop and the database executor, so all of its operations hold a lock.
+    """
+    def __init__(self, maximum_size: int):
+        self.maximum_size: int = maximum_size
+        self.entries: OrderedDict = OrderedDict()
+        self.lock: Lock = Lock()
+
+    def get(self, g_id: int) -> Union[dict, None]:
+        """
+        This method retrieves the cached settings of a Guild and marks them as recently used.
+
+        :param int g_id: a Discord Guild ID.
+        :return Union[dict, None]: the Guild's settings, if they are cached; an empty dictionary stands for
+        a Guild that Smorg does not know.
+        """
+        with self.lock:
+            guild_settings: Union[dict, None] = self.entries.get(g_id)
+            if guild_settings is not None:
+                self.entries.move_to_end(g_id)
+        return guild_settings
+
+    def put(self, g_id: int, guild_settings: dict) -> None:
+        """
+        This method caches the settings of a Guild, evicting the least recently used Guild if necessary.
+
+        :param int g_id: a Discord Guild ID.
+        :param dict guild_settings: the Guild's settings, keyed by their column names.
+        """
+        with self.lock:
+            self.entries[g_id] = guild_settings
+            self.entries.move_to_end(g_id)
+            while len(self.entries) > self.maximum_size:
+                self.entries.popitem(last=False)
+
+    def update(self, g_id: int, **changed_settings) -> None:
+        """
+        This method writes changed settings through to a cached Guild. Guilds that are not cached are left alone,
+        as their next lookup will retrieve the changed settings from the database.
+
+        :param int g_id: a Discord Guild ID.
+        :param changed_settings: the new values of the Guild's settings, keyed by their column names.
+        """
+        with self.lock:
+            if self.entries.get(g_id):
+                self.entries[g_id] = {**self.entries[g_id], **changed_settings}
+
+    def discard(self, g_id: int) -> None:
+        """
+        This method removes a Guild from the cache, if it is present.
+
+        :param int g_id: a Discord Guild ID.
+        """
+        with self.lock:
+            self.entries.pop(g_id, None)
+
+
+def sample_query(connection, cursor, statement, parameters, context, executemany) -> None:
+    """
+    This function is an engine listener that marks a sampled share of statements to be logged once they finish.
+    """
+    if random.random() < query_log_sample_rate:
+        context.sampled_at = time.perf_counter()
+
+
+def log_sampled_query(connection, cursor, statement, parameters, context, executemany) -> None:
+    """
+    This function is an engine listener that logs a sampled statement along with how long it took.
+    """
+    sampled_at: Union[float, None] = getattr(context, "sampled_at", None)
+    if sampled_at is not None:
+        query_logger.info(f"{(time.perf_counter() - sampled_at) * 1000:.2f} ms: {' '.join(statement.split())}")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+query_logger: logging.Logger = logging.getLogger(f"{__name__}.queries")
+query_log_sample_rate: float = getattr(secretbord, "query_log_sample_rate", 0.0)
+if query_log_sample_rate > 0:
+    for shard_engine in engines:
+        event.listen(shard_engine, "before_cursor_execute", sample_query)
+        event.listen(shard_engine, "after_cursor_execute", log_sampled_query)
+
+
+def get_pool_metrics() -> PoolMetrics:
+    """
+    This function takes a snapshot of the connection pools of every database shard, added together.
+
+    :return PoolMetrics: the pools' current state and their counters since they were created.
+    """
+    shard_metrics: list = [shard_engine.pool.metrics() for shard_engine in engines]
+    return PoolMetrics(*(
+        max(shard_values) if field == "maximum_wait" else sum(shard_values)
+        for field, shard_values in zip(PoolMetrics._fields, zip(*shard_metrics))
+    ))
+
+
+guild_settings_cache = GuildSettingsCache(getattr(secretbord, "guild_cache_size", 4096))
+
+
+class ConnectionLeakDetector:
+    """
+    This class is an opt-in watchdog for the connection pool. It records when and where each connection is checked out.
+    A connection that is checked in after being held for longer than the threshold is reported then;
+    a connection that is never checked in is reported by a background thread once it passes the threshold.
+    Reports are logged as warnings and include the call site that checked the connection out.
+    """
+    CALL_SITE_DEPTH: int = 6
+
+    def __init__(self, threshold: float):
+        self.threshold: float = threshold
+        self.checkouts: dict = {}
+        self.lock: Lock = Lock()
+        self.stopped: Event = Event()
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    def watch(self, *watched_engines: sqlalchemy.engine.Engine) -> None:
+        """
+        This method starts recording the checkouts and checkins of some engines' pools and starts the background thread
+        that reports connections which are never checked in.
+
+        :param sqlalchemy.engine.Engine watched_engines: the engines whose connections should be watched.
+        """
+        for watched_engine in watched_engines:
+            event.listen(watched_engine, "checkout", self.record_checkout)
+            event.listen(watched_engine, "checkin", self.record_checkin)
+        Thread(target=self.report_periodically, name="smorgasDB-leaks", daemon=True).start()
+
+    def record_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        """
+        This method is a pool listener that records when and where a connection is checked out.
+        The call site skips SQLAlchemy's frames, so that it ends in the code which asked for the connection.
+        """
+        sqlalchemy_directory: str = os.path.dirname(sqlalchemy.__file__)
+        call_frames: list = [
+            frame for frame in traceback.extract_stack()[:-1] if not frame.filename.startswith(sqlalchemy_directory)
+        ]
+        call_site: str = "".join(traceback.format_list(call_frames[-self.CALL_SITE_DEPTH:]))
+        with self.lock:
+            self.checkouts[id(connection_record)] = [time.monotonic(), call_site, False]
+
+    def record_checkin(self, dbapi_connection, connection_record) -> None:
+        """
+        This method is a pool listener that reports a connection which was held for too long once it is checked in.
+        """
+        with self.lock:
+            checkout: Union[list, None] = self.checkouts.pop(id(connection_record), None)
+        if checkout is not None:
+            held_for: float = time.monotonic() - checkout[0]
+            if held_for > self.threshold and not checkout[2]:
+                self.logger.warning(f"A connection was held for {held_for:.1f}s. It was checked out at:\n{checkout[1]}")
+
+    def find_leaks(self) -> list:
+        """
+        This method finds the connections which are still checked out and have been held for longer than the threshold.
+
+        :return list: a collection of how long each such connection has been held, in seconds, and its call site.
+        """
+        current_time: float = time.monotonic()
+        with self.lock:
+            return [
+                (current_time - checked_out_at, call_site) for checked_out_at, call_site, reported
+                in self.checkouts.values() if current_time - checked_out_at > self.threshold
+            ]
+
+    def report_periodically(self) -> None:
+        """
+        This method reports each connection that passes the threshold without being checked in, once,
+        until the detector is stopped.
+        """
+        while not self.stopped.wait(self.threshold):
+            current_time: float = time.monotonic()
+            with self.lock:
+                new_leaks: list = [
+                    checkout for checkout in self.checkouts.values()
+                    if current_time - checkout[0] > self.threshold and not checkout[2]
+                ]
+                for checkout in new_leaks:
+                    checkout[2] = True
+            for checked_out_at, call_site, reported in new_leaks:
+                self.logger.warning(
+                    f"A connection has been held for {current_time - checked_out_at:.1f}s and may have leaked. "
+                    f"It was checked out at:\n{call_site}"
+                )
+
+
+connection_leak_detector: Union[ConnectionLeakDetector, None] = None
+if getattr(secretbord, "connection_leak_threshold", None) is not None:
+    connection_leak_detector = ConnectionLeakDetector(secretbord.connection_leak_threshold)
+    connection_leak_detector.watch(*engines)
 
 
 class BaseAddition:
     """
     This class is a mix-in for database tables to provide them with convenient functionality.
     The session_method function is a decorator that makes setting up and tearing down database actions more streamlined.
-    The reset_database function performs an auto-reset on the database and is useful for testing purposes and
-    for updating the structure of the database as needed.
+    Its Sessions are routed to the database shard that owns the Guild named by the decorated function's g_id argument.
+    The fan_out_method function is a decorator that runs a cross-Guild database action on every shard concurrently.
+    The begin_unit_of_work and end_unit_of_work functions are command hooks that let every database action
+    of a command invocation share one Session and one transaction.
+    The call_after_commit function defers work that depends on a Session's changes until they are committed.
+    The awaitable_method function is a decorator that gives a database action an awaitable counterpart
+    which runs on a bounded executor rather than on Smorg's event loop.
+    The stream_method function is a decorator that turns a query into an asynchronous iterator over its rows,
+    which are fetched in batches from a server-side cursor.
+    The paginate function retrieves one page of a query's rows with keyset pagination.
+    The cached_method function is a decorator that supplies a Guild's settings from the GuildSettingsCache.
+    The bootstrap_database function brings the database up to date without losing any data, creating missing tables
+    and running pending migrations; when the database is current, it costs one version check.
+    The reset_database function performs an auto-reset on the database and is useful for testing purposes.
     """
     @classmethod
     def session_method(cls, decorated_function: Callable) -> Callable:
         """
         This function is a decorator that automatically sets up and closes sessions for database connections.
+        If a command's unit of work is in progress, the decorated function joins its Session instead;
+        its changes are then flushed, and they are committed along with the rest of the command's changes.
+        Otherwise, the Session is rolled back if the decorated function raises, and it is closed on every path,
+        so that its connection always returns to the pool; once it commits, the callbacks that the decorated function
+        gave to call_after_commit are called. That Session is opened on the database shard
+        that owns the decorated function's g_id argument, if it has one, or on the current shard otherwise.
 
         :param Callable decorated_function: any function for which a Session is relevant.
         :return Callable: a version of decorated_function which starts by opening a Session and
-        ends by closing it.
+        ends by committing its changes and closing it.
         """
+        find_guild_id: Callable = cls.guild_argument_of(decorated_function)
+
         @wraps(decorated_function)
         def session_decorator(*args, **kwargs):
-            method_session: Session = Session()
-            session_value = decorated_function(method_session, *args, **kwargs)
-            method_session.close()
-            return session_value
-        return session_decorator
+            unit_session: Union[Session, None] = unit_of_work.get()
+            if unit_session is not None:
+                session_value = decorated_function(unit_session, *args, **kwargs)
+                unit_session.flush()
+                return session_value
+            method_session: Session = open_session(find_guild_id(args, kwargs))
+            try:
+                session_value = decorated_function(method_session, *args, **kwargs)
+                method_session.commit()
+                for committed_callback in method_session.info.get("after_commit", []):
+                    committed_callback()
+                return session_value
+            except Exception:
+                method_session.rollback()
+                raise
+            finally:
+                method_session.close()
+        return cls.awaitable_method(session_decorator)
+
+    @staticmethod
+    def guild_argument_of(decorated_function: Callable) -> Callable:
+        """
+        This function finds where a database function takes the Guild ID by which its Session is routed:
+        its g_id argument, which follows its Session.
+
+        :param Callable decorated_function: any function which takes a Session as its first argument.
+        :return Callable: a function which takes the positional and keyword arguments of a call to decorated_function,
+        less its Session, and returns the call's Guild ID, or None if decorated_function does not take one.
+        """
+        argument_names: list = list(inspect.signature(decorated_function).parameters)[1:]
+        if "g_id" not in argument_names:
+            return lambda args, kwargs: None
+        g_id_position: int = argument_names.index("g_id")
+        return lambda args, kwargs: kwargs["g_id"] if "g_id" in kwargs else args[g_id_position]
+
+    @staticmethod
+    def fan_out_method(combine_results: Callable) -> Callable:
+        """
+        This function produces a decorator that runs a cross-Guild database function once on each database shard.
+        The runs are concurrent, and each selects its shard as the current one, so that the Sessions
+        and engines that it uses are those of its shard; they never join a command's unit of work.
+        Like awaitable_method, it gives the decorated function an awaitable counterpart.
+
+        :param Callable combine_results: a function that takes the list of each shard's result, in shard order,
+        and returns the result of the whole.
+        :return Callable: a decorator for any function which should act upon every database shard.
+        """
+        def fan_out_decorator(decorated_function: Callable) -> Callable:
+            @wraps(decorated_function)
+            def shard_decorator(*args, **kwargs):
+                shard_results: list = list(shard_executor.map(
+                    lambda shard: BaseAddition.run_on_shard(shard, decorated_function, *args, **kwargs),
+                    range(len(engines))
+                ))
+                return combine_results(shard_results)
+
+            @wraps(decorated_function)
+            async def awaitable_decorator(*args, **kwargs):
+                event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+                shard_results: list = await asyncio.gather(*(
+                    event_loop.run_in_executor(database_executor, partial(
+                        contextvars.copy_context().run, BaseAddition.run_on_shard, shard, decorated_function,
+                        *args, **kwargs
+                    )) for shard in range(len(engines))
+                ))
+                return combine_results(shard_results)
+
+            shard_decorator.awaitable = awaitable_decorator
+            return shard_decorator
+        return fan_out_decorator
+
+    @staticmethod
+    def run_on_shard(shard: int, decorated_function: Callable, *args, **kwargs):
+        """
+        This function runs a database function with a database shard as the current one and outside of any unit of work.
+
+        :param int shard: the index, within engines, of the database shard to run upon.
+        :param Callable decorated_function: any database function.
+        :return: the result of decorated_function.
+        """
+        shard_token: contextvars.Token = database_shard.set(shard)
+        unit_token: contextvars.Token = unit_of_work.set(None)
+        try:
+            return decorated_function(*args, **kwargs)
+        finally:
+            unit_of_work.reset(unit_token)
+            database_shard.reset(shard_token)
+
+    @staticmethod
+    def awaitable_method(decorated_function: Callable) -> Callable:
+        """
+        This function is a decorator that attaches an awaitable counterpart to a synchronous database function.
+        The counterpart, available as the awaitable attribute of the function, takes the same arguments
+        and runs the function on the database executor, so that the event loop is free while the query runs.
+        The function runs in a copy of the caller's context, so that it can see the caller's unit of work.
+
+        :param Callable decorated_function: any function which performs blocking database work.
+        :return Callable: decorated_function, now with an awaitable attribute.
+        """
+        @wraps(decorated_function)
+        async def awaitable_decorator(*args, **kwargs):
+            event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            return await event_loop.run_in_executor(
+                database_executor, partial(contextvars.copy_context().run, decorated_function, *args, **kwargs)
+            )
+        decorated_function.awaitable = awaitable_decorator
+        return decorated_function
+
+    @staticmethod
+    def stream_method(decorated_function: Callable) -> Callable:
+        """
+        This function is a decorator that streams the rows of a query rather than loading all of them at once.
+        The decorated function receives a Session, like those decorated by session_method, and returns a Query.
+        The resulting asynchronous iterator runs the Query with a server-side cursor and fetches its rows in batches
+        of one Embed's worth on the database executor, so that only one batch is held in memory at a time.
+        It joins the command's unit of work if one is in progress; otherwise, it is routed like session_method.
+
+        :param Callable decorated_function: any function which builds a Query whose rows may be numerous.
+        :return Callable: a function which takes the rest of decorated_function's arguments
+        and returns an asynchronous iterator over the Query's rows.
+        """
+        find_guild_id: Callable = BaseAddition.guild_argument_of(decorated_function)
+
+        @wraps(decorated_function)
+        async def stream_decorator(*args, **kwargs) -> AsyncIterator:
+            event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            unit_session: Union[Session, None] = unit_of_work.get()
+            method_session: Session = unit_session or open_session(find_guild_id(args, kwargs))
+            row_stream = None
+            try:
+                stream_query: query = decorated_function(method_session, *args, **kwargs)
+                row_stream = await event_loop.run_in_executor(database_executor, partial(
+                    contextvars.copy_context().run, method_session.execute,
+                    stream_query.statement.execution_options(stream_results=True)
+                ))
+                row_batch: list = await event_loop.run_in_executor(
+                    database_executor, row_stream.fetchmany, DiscordConstant.MAX_EMBED_FIELDS
+                )
+                while row_batch:
+                    for row in row_batch:
+                        yield row
+                    row_batch = await event_loop.run_in_executor(
+                        database_executor, row_stream.fetchmany, DiscordConstant.MAX_EMBED_FIELDS
+                    )
+            finally:
+                if row_stream is not None:
+                    await event_loop.run_in_executor(database_executor, row_stream.close)
+                if unit_session is None:
+                    await event_loop.run_in_executor(database_executor, method_session.close)
+        return stream_decorator
+
+    @staticmethod
+    def paginate(method_session: Session, page_query: query, page_key: sqlalchemy.Column,
+                 after_key: Union[int, datetime, None], skipped_pages: int = 0) -> list:
+        """
+        This function retrieves one page of a query's rows with keyset pagination: rather than an OFFSET,
+        the page starts after a given key, so it is one indexed range scan however deep it is.
+        Pages that lie between the given key and the desired page can be skipped;
+        their keys alone are scanned, within the same statement, to find where the desired page starts.
+
+        :param method_session: a Session database connection.
+        :param query page_query: the unordered query whose rows are paged through.
+        :param sqlalchemy.Column page_key: the unique column by which the rows are ordered.
+        :param Union[int, datetime, None] after_key: the key after which the page starts; None starts at the first row.
+        :param int skipped_pages: the number of pages between the given key and the desired page.
+        :return list: up to one Embed's worth of the query's rows.
+        """
+        if after_key is not None:
+            page_query = page_query.filter(page_key > after_key)
+        if skipped_pages:
+            skipped_keys = page_query.with_entities(page_key).order_by(page_key).limit(
+                skipped_pages * DiscordConstant.MAX_EMBED_FIELDS
+            ).subquery()
+            page_query = page_query.filter(
+                page_key > method_session.query(sqlalchemy.func.max(skipped_keys.c[page_key.key])).as_scalar()
+            )
+        return page_query.order_by(page_key).limit(DiscordConstant.MAX_EMBED_FIELDS).all()
+
+    @staticmethod
+    def cached_method(key_function: Callable) -> Callable:
+        """
+        This function produces a decorator that supplies a Guild's settings from the GuildSettingsCache.
+        On a miss, the settings are loaded with Guild.get_settings_by and cached for later calls.
+        Like session_method, the decorated function receives its extra argument first;
+        its awaitable counterpart only leaves the event loop when the settings must be loaded.
+
+        :param Callable key_function: a function that takes the decorated function's arguments
+        and returns the relevant Guild's ID.
+        :return Callable: a decorator for any function that reads a Guild's settings.
+        """
+        def cached_decorator(decorated_function: Callable) -> Callable:
+            @wraps(decorated_function)
+            def settings_decorator(*args, **kwargs):
+                g_id: int = key_function(*args, **kwargs)
+                guild_settings: Union[dict, None] = guild_settings_cache.get(g_id)
+                if guild_settings is None:
+                    guild_settings = Guild.get_settings_by(g_id)
+                    guild_settings_cache.put(g_id, guild_settings)
+                return decorated_function(guild_settings, *args, **kwargs)
+
+            @wraps(decorated_function)
+            async def awaitable_decorator(*args, **kwargs):
+                g_id: int = key_function(*args, **kwargs)
+                guild_settings: Union[dict, None] = guild_settings_cache.get(g_id)
+                if guild_settings is None:
+                    guild_settings = await Guild.get_settings_by.awaitable(g_id)
+                    guild_settings_cache.put(g_id, guild_settings)
+                return decorated_function(guild_settings, *args, **kwargs)
+
+            settings_decorator.awaitable = awaitable_decorator
+            return settings_decorator
+        return cached_decorator
+
+    @staticmethod
+    async def begin_unit_of_work(ctx: Context) -> None:
+        """
+        This method is a before-invoke hook that opens the Session which a command invocation's database work shares.
+        It is opened on the database shard that owns the command's Guild.
+
+        :param Context ctx: the context of the command which is about to be invoked.
+        """
+        unit_of_work.set(open_session(ctx.guild.id if ctx.guild is not None else None))
+
+    @staticmethod
+    async def end_unit_of_work(ctx: Context) -> None:
+        """
+        This method is an after-invoke hook that commits a command invocation's database work, if the command
+        succeeded, or rolls it back, if it failed or its commit fails. Once it commits, the callbacks given to
+        call_after_commit are called; on a rollback, they are dropped, and the Guild's cached settings
+        are discarded, as they may hold changes that were never committed.
+
+        :param Context ctx: the context of the command which was invoked.
+        """
+        unit_session: Union[Session, None] = unit_of_work.get()
+        if unit_session is not None:
+            unit_of_work.set(None)
+            # Database workers may be waiting on this unit's row locks, so it is finished outside of their executor.
+            event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            unit_committed: bool = False
+            try:
+                await event_loop.run_in_executor(
+                    None, partial(BaseAddition.finish_unit_of_work, unit_session, not ctx.command_failed)
+                )
+                unit_committed = not ctx.command_failed
+                if unit_committed:
+                    for committed_callback in unit_session.info.get("after_commit", []):
+                        committed_callback()
+            finally:
+                if not unit_committed and ctx.guild is not None:
+                    guild_settings_cache.discard(ctx.guild.id)
+
+    @staticmethod
+    def call_after_commit(committed_callback: Callable, method_session: Union[Session, None] = None) -> None:
+        """
+        This method defers a callback until a Session commits, so that it only acts upon changes
+        that other connections can already see. A database action passes its own Session, which is the unit of work's
+        Session if one is in progress; otherwise, the current command invocation's unit of work is used.
+        If there is neither, each database action has already committed before it returns,
+        so the callback is called at once. If the Session rolls back instead, the callback is dropped.
+
+        :param Callable committed_callback: a function, taking no arguments, to call once the changes are committed.
+        :param Union[Session, None] method_session: the Session whose commit the callback awaits, if any.
+        """
+        pending_session: Union[Session, None] = method_session or unit_of_work.get()
+        if pending_session is None:
+            committed_callback()
+        else:
+            pending_session.info.setdefault("after_commit", []).append(committed_callback)
+
+    @staticmethod
+    def finish_unit_of_work(unit_session: Session, succeeded: bool) -> None:
+        """
+        This method commits or rolls back a unit of work's Session and closes it, even if the commit fails.
+
+        :param Session unit_session: the Session of a command invocation.
+        :param bool succeeded: whether the unit of work's changes should be committed.
+        """
+        try:
+            if succeeded:
+                unit_session.commit()
+            else:
+                unit_session.rollback()
+        except Exception:
+            unit_session.rollback()
+            raise
+        finally:
+            unit_session.close()
+
+    @staticmethod
+    def bootstrap_database() -> list:
+        """
+        This method brings the database up to the structure based upon the classes described below without losing data.
+        If the latest migration has been recorded, it does nothing else. Otherwise, it creates any missing tables;
+        a new database is then current, while an existing one has its pending migrations run and recorded in order.
+        Migrations up to the SQLITE_BASELINE_VERSION are only recorded on SQLite, whose databases started there.
+        Each database shard is brought up to date concurrently.
+        A migration that measures its effect returns the measurement, which is logged along with its shard.
+
+        :return list: the names of the migrations that were run on any shard.
+        """
+        latest_version: int = SCHEMA_MIGRATIONS[-1][0]
+        table_names: list = sqlalchemy.inspect(current_engine()).get_table_names()
+        if SchemaVersion.__tablename__ in table_names and SchemaVersion.get_current_version() == latest_version:
+            return []
+
+        is_new_database: bool = Guild.__tablename__ not in table_names
+        Base.metadata.create_all(bind=current_engine())
+        if is_new_database:
+            SchemaVersion.record_versions(SCHEMA_MIGRATIONS)
+            return []
+
+        current_version: int = SchemaVersion.get_current_version()
+        applied_migrations: list = []
+        for version, name, migration in SCHEMA_MIGRATIONS:
+            if version > current_version:
+                if engine.dialect.name != 'sqlite' or version > SQLITE_BASELINE_VERSION:
+                    migration_measurement = migration()
+                    if migration_measurement is not None:
+                        logger.info(
+                            f"Measured the database migration on shard {database_shard.get()}, {name}: "
+                            f"{migration_measurement}."
+                        )
+                    applied_migrations.append(name)
+                SchemaVersion.record_versions([(version, name, migration)])
+        return applied_migrations
 
     @staticmethod
     def reset_database() -> None:
         """
         This method resets the database down to the structure based upon the classes described below.
+        All data is lost, so it should only be used explicitly, such as for testing purposes.
+        Each database shard is reset concurrently.
         """
-        Base.metadata.drop_all()
-        Base.metadata.create_all()
+        Base.metadata.drop_all(bind=current_engine())
+        Base.metadata.create_all(bind=current_engine())
+        SchemaVersion.record_versions(SCHEMA_MIGRATIONS)
+
+
+BaseAddition.bootstrap_database = staticmethod(BaseAddition.fan_out_method(
+    lambda shard_migrations: list(OrderedDict.fromkeys(chain.from_iterable(shard_migrations)))
+)(BaseAddition.bootstrap_database))
+BaseAddition.reset_database = staticmethod(
+    BaseAddition.fan_out_method(lambda shard_results: None)(BaseAddition.reset_database)
+)
 
 
 class Quote(BaseAddition, Base):
     """
     This class represents a quotation stored from a Guild for the SQLAlchemy ORM.
+    On PostgreSQL, each Quote's author and text are also kept as a generated tsvector column with a GIN index,
+    which full-text searches use; on SQLite, they are kept in an FTS5 table that triggers keep up to date.
+    Neither is mapped; both are created by the SEARCH_STATEMENTS for their dialect.
     """
     __tablename__ = 'quotes'
+    IMPORT_BATCH_SIZE: int = 1000
+    SEARCH_CONFIGURATION: str = 'english'
+    SEARCH_STATEMENTS: dict = {
+        'postgresql': (
+            f"ALTER TABLE quotes ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS "
+            f"(to_tsvector('{SEARCH_CONFIGURATION}', coalesce(author, '') || ' ' || text)) STORED",
+            "CREATE INDEX IF NOT EXISTS ix_quotes_search_vector ON quotes USING gin (search_vector)"
+        ),
+        'sqlite': (
+            "CREATE VIRTUAL TABLE IF NOT EXISTS quotes_search USING fts5(author, text, content='quotes', "
+            "content_rowid='quote_id', tokenize='porter unicode61')",
+            "CREATE TRIGGER IF NOT EXISTS quotes_search_insert AFTER INSERT ON quotes BEGIN "
+            "INSERT INTO quotes_search (rowid, author, text) VALUES (new.quote_id, new.author, new.text); END",
+            "CREATE TRIGGER IF NOT EXISTS quotes_search_delete AFTER DELETE ON quotes BEGIN "
+            "INSERT INTO quotes_search (quotes_search, rowid, author, text) "
+            "VALUES ('delete', old.quote_id, old.author, old.text); END",
+            "CREATE TRIGGER IF NOT EXISTS quotes_search_update AFTER UPDATE OF author, text ON quotes BEGIN "
+            "INSERT INTO quotes_search (quotes_search, rowid, author, text) "
+            "VALUES ('delete', old.quote_id, old.author, old.text); "
+            "INSERT INTO quotes_search (rowid, author, text) VALUES (new.quote_id, new.author, new.text); END"
+        )
+    }
+    __table_args__ = (
+        Index('ix_quotes_guild_quote_number', 'guild_id', 'guild_quote_number', unique=True),
+        Index('ix_quotes_guild_id_author_number', 'guild_id', 'author', 'guild_quote_number'),
+        Index('ix_quotes_guild_content_hash', 'guild_id', 'content_hash', unique=True),
+    )
 
     # Attributes:
     author = Column(String(DiscordConstant.MAX_ROLE_LENGTH), nullable=True)
-    guild_id = Column(BigInteger, ForeignKey('guilds.guild_id'), nullable=False)
-    quote_id = Column(SmallInteger, primary_key=True, autoincrement=True, nullable=False)
+    guild_id = Column(BigInteger, ForeignKey('guilds.guild_id', ondelete='CASCADE'), nullable=False)
+    guild_quote_number = Column(Integer, nullable=False)
+    quote_id = Column(
+        BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True, nullable=False
+    )
     text = Column(String, nullable=False)
+    content_hash = Column(String(64), nullable=False)
     created_at = Column(DateTime, default=sqlalchemy.sql.func.now(), nullable=False)
     last_updated_at = Column(DateTime, default=sqlalchemy.sql.func.now(), nullable=False,
                              onupdate=sqlalchemy.sql.func.now())
@@ -83,8 +885,9 @@ class Quote(BaseAddition, Base):
 
     # Methods:
     def __repr__(self):
-        return f'<Quote(author: {self.author}, guild_id: {self.guild_id}, quote_id: {self.quote_id}, ' \
-               f'text: {self.text}, created_at: {self.created_at}, last_updated_at: {self.last_updated_at})>'
+        return f'<Quote(author: {self.author}, guild_id: {self.guild_id}, ' \
+               f'guild_quote_number: {self.guild_quote_number}, quote_id: {self.quote_id}, text: {self.text}, ' \
+               f'created_at: {self.created_at}, last_updated_at: {self.last_updated_at})>'
 
     # Queries:
     @staticmethod
@@ -92,73 +895,438 @@ class Quote(BaseAddition, Base):
     def count_quotes(method_session: Session, g_id: int) -> int:
         """
         This method counts the number of quotes that a Guild has stored in the database.
+        It reads the Guild's maintained quote count rather than counting its quotes.
 
         :param method_session: a Session database connection.
         :param int g_id: a Discord Guild ID.
         :return int: the number of quotes which belong to a given Guild.
         """
-        count = method_session.query(Quote).filter_by(guild_id=g_id).count()
-        return count
+        count: Union[int, None] = method_session.query(Guild.quote_count).filter_by(guild_id=g_id).scalar()
+        return count or 0
+
+    @staticmethod
+    @BaseAddition.session_method
+    def create_quote_with(method_session: Session, g_id: int, quote: str, auth: str) -> bool:
+        """
+        This method creates and stores a Quote in the database.
+        The Quote is numbered after the Guild's other quotes; the Guild's row is locked while the number is taken,
+        so that the numbers of a Guild's quotes always run from one to its quote count without gaps.
+        The count of the author's quotes in the Guild is updated under the same lock.
+        A quote that the Guild already has, by its content hash, is ignored by the insert itself.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param str quote: the text of the quotation.
+        :param str auth: the author of the quotation.
+        :return bool: True if the quote was stored; False if the Guild already had it.
+        """
+        quoted_guild: Guild = Guild.lock_with(method_session, g_id)
+        inserted_quote: Union[tuple, None] = method_session.execute(
+            "INSERT INTO quotes (guild_id, guild_quote_number, author, text, content_hash, created_at, "
+            "last_updated_at) VALUES (:guild_id, :guild_quote_number, :author, :text, :content_hash, "
+            "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP) ON CONFLICT (guild_id, content_hash) DO NOTHING "
+            "RETURNING quote_id", {
+                "guild_id": g_id, "guild_quote_number": quoted_guild.quote_count + 1, "author": auth, "text": quote,
+                "content_hash": Quote.hash_content(auth, quote)
+            }
+        ).first()
+        if inserted_quote is not None:
+            quoted_guild.quote_count += 1
+            AuthorQuoteCount.add_quote_counts(method_session, g_id, Counter([auth or '']))
+        return inserted_quote is not None
+
+    @staticmethod
+    @BaseAddition.session_method
+    def import_quotes_with(method_session: Session, g_id: int, quotes: list) -> int:
+        """
+        This method stores many quotes in the database at once, skipping any that the Guild already has.
+        Quotes are matched by their content hashes and inserted in multi-row batches
+        under the same lock on the Guild's row as create_quote_with;
+        each batch numbers the quotes that it inserts after the Guild's others and returns their authors,
+        so that the Guild's counts can be updated once at the end.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param list quotes: the authors and texts of the quotations, in the order in which they should be numbered.
+        :return int: the number of quotes that were stored.
+        """
+        quoted_guild: Guild = Guild.lock_with(method_session, g_id)
+        unique_quotes: list = list({Quote.hash_content(*quote): quote for quote in reversed(quotes)}.items())[::-1]
+        imported_authors: Counter = Counter()
+        for batch_start in range(0, len(unique_quotes), Quote.IMPORT_BATCH_SIZE):
+            batch_parameters: dict = {"guild_id": g_id, "quote_count": quoted_guild.quote_count}
+            batch_rows: list = []
+            batch: list = unique_quotes[batch_start:batch_start + Quote.IMPORT_BATCH_SIZE]
+            for position, (content_hash, (author, text)) in enumerate(batch):
+                batch_rows.append(f"({position}, :author_{position}, :text_{position}, :content_hash_{position})")
+                batch_parameters.update({
+                    f"author_{position}": author, f"text_{position}": text, f"content_hash_{position}": content_hash
+                })
+            inserted_authors: list = method_session.execute(
+                f"WITH imported (position, author, text, content_hash) AS (VALUES {', '.join(batch_rows)}) "
+                f"INSERT INTO quotes (guild_id, guild_quote_number, author, text, content_hash, created_at, "
+                f"last_updated_at) "
+                f"SELECT :guild_id, :quote_count + row_number() OVER (ORDER BY imported.position), "
+                f"imported.author, imported.text, imported.content_hash, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+                f"FROM imported WHERE NOT EXISTS (SELECT 1 FROM quotes WHERE quotes.guild_id = :guild_id "
+                f"AND quotes.content_hash = imported.content_hash) "
+                f"RETURNING author", batch_parameters
+            ).fetchall()
+            quoted_guild.quote_count += len(inserted_authors)
+            imported_authors.update(author_row.author or '' for author_row in inserted_authors)
+        AuthorQuoteCount.add_quote_counts(method_session, g_id, imported_authors)
+        return sum(imported_authors.values())
+
+    @staticmethod
+    def hash_content(auth: Union[str, None], quote: str) -> str:
+        """
+        This method computes the content hash by which a Guild's duplicate quotes are recognized.
+        Authors and text are compared without regard to case or to the amount of whitespace between words.
+
+        :param Union[str, None] auth: the author of the quotation.
+        :param str quote: the text of the quotation.
+        :return str: the SHA-256 digest of the normalized author and text, in hexadecimal.
+        """
+        normalized_content: str = "\0".join(" ".join(content.split()).casefold() for content in (auth or '', quote))
+        return hashlib.sha256(normalized_content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    @BaseAddition.session_method
+    def get_quote_by(method_session: Session, g_id: int, q_number: int) -> Union[Quote, None]:
+        """
+        This method retrieves the quote with a given number from a given server from the database.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param int q_number: the number of the quote within its Guild.
+        :return Union[Quote, None]: the Quote object with the given number, if it exists.
+        """
+        quote: Union[Quote, None] = method_session.query(Quote).filter_by(
+            guild_id=g_id, guild_quote_number=q_number
+        ).first()
+        return quote
+
+    @staticmethod
+    def query_quotes_by(method_session: Session, g_id: int, auth: Union[str, None] = None) -> query:
+        """
+        This method builds the query for quotes meeting the criteria of a Guild's ID and, optionally, a specific author.
+
+        :param method_session: a Session database connection.
+        :param g_id: a Discord Guild ID.
+        :param auth: the author of the quotation.
+        :return query: a query for the numbers, authors, and quotations from Quote objects that fulfill
+        the given criteria, in the order of their numbers.
+        """
+        quote_query: query = method_session.query(Quote.guild_quote_number, Quote.author, Quote.text)
+        if auth:
+            quote_query = quote_query.filter_by(guild_id=g_id, author=auth)
+        else:
+            quote_query = quote_query.filter_by(guild_id=g_id)
+        return quote_query.order_by(Quote.guild_quote_number)
+
+    @staticmethod
+    @BaseAddition.session_method
+    def get_quotes_by(method_session: Session, g_id: int, auth: Union[str, None] = None) -> list:
+        """
+        This method retrieves quotes based on the criteria of a Guild's ID and, optionally, a specific author.
+
+        :param method_session: a Session database connection.
+        :param g_id: a Discord Guild ID.
+        :param auth: the author of the quotation.
+        :return list: collection of numbers, authors, and quotations from Quote objects that fulfill the given criteria,
+        in the order of their numbers.
+        """
+        quote_list: list = Quote.query_quotes_by(method_session, g_id, auth).all()
+        return quote_list
+
+    @staticmethod
+    @BaseAddition.session_method
+    def get_quote_page_by(method_session: Session, g_id: int, auth: Union[str, None] = None, after_number: int = 0,
+                          skipped_pages: int = 0) -> list:
+        """
+        This method retrieves a page of quotes based on the criteria of a Guild's ID and, optionally, a specific author.
+        As a Guild's quote numbers have no gaps, a page of all of its quotes never needs to skip pages to be found.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param Union[str, None] auth: the author of the quotation.
+        :param int after_number: the quote number after which the page starts.
+        :param int skipped_pages: the number of pages between the given quote number and the desired page.
+        :return list: up to one Embed's worth of numbers, authors, and quotations from Quote objects that fulfill
+        the given criteria, in the order of their numbers.
+        """
+        if not auth:
+            after_number += skipped_pages * DiscordConstant.MAX_EMBED_FIELDS
+            skipped_pages = 0
+        page_query: query = Quote.query_quotes_by(method_session, g_id, auth).order_by(None)
+        return BaseAddition.paginate(method_session, page_query, Quote.guild_quote_number, after_number, skipped_pages)
+
+    @staticmethod
+    @BaseAddition.session_method
+    def search_quotes_by(method_session: Session, g_id: int, terms: str, after_result: Union[tuple, None] = None,
+                         skipped_pages: int = 0) -> list:
+        """
+        This method retrieves a page of a Guild's quotes whose authors or text match some search terms,
+        ranked by how well they match, in one query against the quotes' full-text index for the dialect.
+        Like paginate, it pages with a keyset rather than an OFFSET: the page starts after the rank and number
+        of the last result that was displayed, and only the results of any skipped pages are scanned.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param str terms: the words to search for; all of them must match.
+        :param Union[tuple, None] after_result: the position in the ranking and the quote number of the result
+        after which the page starts; None starts at the best match.
+        :param int skipped_pages: the number of pages between the given result and the desired page.
+        :return list: up to one Embed's worth of numbers, authors, and quotations from matching Quote objects,
+        along with their positions in the ranking, from the best match.
+        """
+        if engine.dialect.name == 'sqlite':
+            return Quote.search_sqlite_quotes_by(method_session, g_id, terms, after_result, skipped_pages)
+        search_query = sqlalchemy.func.plainto_tsquery(Quote.SEARCH_CONFIGURATION, terms)
+        search_vector = sqlalchemy.literal_column(f"{Quote.__tablename__}.search_vector")
+        search_rank = sqlalchemy.func.ts_rank(search_vector, search_query)
+        search_order: tuple = (search_rank.desc(), Quote.guild_quote_number)
+        after_position, after_number = after_result if after_result is not None else (0, None)
+        quote_query: query = method_session.query(
+            Quote.guild_quote_number, Quote.author, Quote.text,
+            (after_position + sqlalchemy.func.row_number().over(order_by=search_order)).label("search_position")
+        ).filter(
+            Quote.guild_id == g_id, search_vector.op('@@')(search_query)
+        )
+        if after_result is not None:
+            after_rank = method_session.query(search_rank).filter(
+                Quote.guild_id == g_id, Quote.guild_quote_number == after_number
+            ).correlate(None).as_scalar()
+            quote_query = quote_query.filter(sqlalchemy.or_(
+                search_rank < after_rank,
+                sqlalchemy.and_(search_rank == after_rank, Quote.guild_quote_number > after_number)
+            ))
+        quote_list: list = quote_query.order_by(*search_order).offset(
+            skipped_pages * DiscordConstant.MAX_EMBED_FIELDS
+        ).limit(DiscordConstant.MAX_EMBED_FIELDS).all()
+        return quote_list
+
+    @staticmethod
+    def search_sqlite_quotes_by(method_session: Session, g_id: int, terms: str,
+                                after_result: Union[tuple, None] = None, skipped_pages: int = 0) -> list:
+        """
+        This method searches a Guild's quotes as search_quotes_by does, using SQLite's FTS5 table and its BM25 ranking.
+        Each search term is quoted, so that all of them must match and none are read as FTS5 syntax.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param str terms: the words to search for; all of them must match.
+        :param Union[tuple, None] after_result: the position in the ranking and the quote number of the result
+        after which the page starts; None starts at the best match.
+        :param int skipped_pages: the number of pages between the given result and the desired page.
+        :return list: up to one Embed's worth of numbers, authors, and quotations from matching Quote objects,
+        along with their positions in the ranking, from the best match.
+        """
+        search_query: str = " ".join(f'"{term.replace(chr(34), chr(34) * 2)}"' for term in terms.split())
+        if not search_query:
+            return []
+        search_parameters: dict = {
+            "search_query": search_query, "guild_id": g_id, "limit": DiscordConstant.MAX_EMBED_FIELDS,
+            "offset": skipped_pages * DiscordConstant.MAX_EMBED_FIELDS, "after_position": 0,
+            "after_rank": None, "after_number": None
+        }
+        if after_result is not None:
+            search_parameters["after_position"], search_parameters["after_number"] = after_result
+            search_parameters["after_rank"] = method_session.execute(
+                "SELECT bm25(quotes_search) FROM quotes_search WHERE quotes_search MATCH :search_query "
+                "AND rowid = (SELECT quote_id FROM quotes "
+                "WHERE guild_id = :guild_id AND guild_quote_number = :after_number)", search_parameters
+            ).scalar()
+        quote_list: list = method_session.execute(
+            "SELECT guild_quote_number, author, text, :after_position + "
+            "row_number() OVER (ORDER BY search_rank, guild_quote_number) AS search_position FROM ("
+            "SELECT quotes.guild_quote_number, quotes.author, quotes.text, bm25(quotes_search) AS search_rank "
+            "FROM quotes_search JOIN quotes ON quotes.quote_id = quotes_search.rowid "
+            "WHERE quotes_search MATCH :search_query AND quotes.guild_id = :guild_id) "
+            "WHERE :after_number IS NULL OR search_rank > :after_rank "
+            "OR (search_rank = :after_rank AND guild_quote_number > :after_number) "
+            "ORDER BY search_position LIMIT :limit OFFSET :offset", search_parameters
+        ).fetchall()
+        return quote_list
+
+    @staticmethod
+    @BaseAddition.stream_method
+    def stream_quotes_by(method_session: Session, g_id: int, auth: Union[str, None] = None) -> query:
+        """
+        This method streams quotes based on the criteria of a Guild's ID and, optionally, a specific author.
+
+        :param method_session: a Session database connection.
+        :param g_id: a Discord Guild ID.
+        :param auth: the author of the quotation.
+        :return query: the query whose numbers, authors, and quotations are streamed, in the order of their numbers.
+        """
+        return Quote.query_quotes_by(method_session, g_id, auth)
+
+    @staticmethod
+    @BaseAddition.session_method
+    def get_random_quote_by(method_session: Session, g_id: int) -> Union[Quote, None]:
+        """
+        This method retrieves a random quote from a given server from the database.
+        It does so in a single indexed query that returns one row: the database draws a random number
+        up to the Guild's quote count and looks up the quote with that number in the Guild.
+        SQLite's random() gives a random 64-bit integer rather than a fraction, so it is reduced modulo the count.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :return Union[Quote, None]: a Quote object randomly selected from a given Guild, if it has any quotes.
+        """
+        if engine.dialect.name == 'sqlite':
+            random_expression = sqlalchemy.func.abs(sqlalchemy.func.random()) % Guild.quote_count + 1
+        else:
+            random_expression = sqlalchemy.cast(
+                sqlalchemy.func.floor(sqlalchemy.func.random() * Guild.quote_count) + 1, Integer
+            )
+        random_number = method_session.query(random_expression).filter(Guild.guild_id == g_id).as_scalar()
+        quote: Union[Quote, None] = method_session.query(Quote).filter(
+            Quote.guild_id == g_id, Quote.guild_quote_number == random_number
+        ).first()
+        return quote
 
+    # Migrations:
     @staticmethod
     @BaseAddition.session_method
-    def create_quote_with(method_session: Session, g_id: int, quote: str, auth: str) -> None:
+    def migrate_quote_identity(method_session: Session) -> None:
         """
-        This method creates and stores a Quote in the database.
+        This method migrates a database made before quotes were numbered within their Guilds.
+        It widens quote_id to a 64-bit integer, numbers each Guild's existing quotes in the order of their creation,
+        and records each Guild's quote count. It is written for PostgreSQL and can safely be run more than once.
 
         :param method_session: a Session database connection.
-        :param int g_id: a Discord Guild ID.
-        :param str quote: the text of the quotation.
-        :param str auth: the author of the quotation.
         """
-        new_quote = Quote(author=auth, guild_id=g_id, text=quote)
-        method_session.add(new_quote)
+        migration_statements: tuple = (
+            "ALTER TABLE quotes ALTER COLUMN quote_id TYPE BIGINT",
+            "ALTER SEQUENCE IF EXISTS quotes_quote_id_seq AS BIGINT",
+            "ALTER TABLE guilds ADD COLUMN IF NOT EXISTS quote_count INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE quotes ADD COLUMN IF NOT EXISTS guild_quote_number INTEGER",
+            "UPDATE quotes SET guild_quote_number = numbered_quotes.guild_quote_number FROM ("
+            "SELECT quote_id, row_number() OVER (PARTITION BY guild_id ORDER BY quote_id) AS guild_quote_number "
+            "FROM quotes) AS numbered_quotes WHERE quotes.quote_id = numbered_quotes.quote_id",
+            "ALTER TABLE quotes ALTER COLUMN guild_quote_number SET NOT NULL",
+            "UPDATE guilds SET quote_count = (SELECT count(*) FROM quotes WHERE quotes.guild_id = guilds.guild_id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_quotes_guild_quote_number ON quotes (guild_id, guild_quote_number)"
+        )
+        for statement in migration_statements:
+            method_session.execute(statement)
         method_session.commit()
 
     @staticmethod
-    @BaseAddition.session_method
-    def get_quotes_by(method_session: Session, g_id: int, auth: Union[str, None] = None) -> list:
+    def migrate_author_index() -> None:
         """
-        This method retrieves quotes based on the criteria of a Guild's ID and, optionally, a specific author.
+        This method migrates a database made before each Guild's Quotes were indexed by their authors.
+        It can safely be run more than once.
+        """
+        with current_engine().begin() as migration_connection:
+            migration_connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_quotes_guild_id_author ON quotes (guild_id, author)"
+            )
 
-        :param method_session: a Session database connection.
-        :param g_id: a Discord Guild ID.
-        :param auth: the author of the quotation.
-        :return list: collection of authors and quotations from Quote objects that fulfill the given criteria.
+    @staticmethod
+    def migrate_search_vector() -> None:
         """
-        if auth:
-            quote_list: list = method_session.query(Quote.author, Quote.text).filter_by(guild_id=g_id, author=auth) \
-                .all()
-        else:
-            quote_list: list = method_session.query(Quote.author, Quote.text).filter_by(guild_id=g_id).all()
-        return quote_list
+        This method migrates a database made before Quotes could be searched by their content.
+        It adds their generated tsvector column and its GIN index on PostgreSQL and can safely be run more than once.
+        """
+        if engine.dialect.name == 'postgresql':
+            with current_engine().begin() as migration_connection:
+                for statement in Quote.SEARCH_STATEMENTS['postgresql']:
+                    migration_connection.execute(statement)
 
     @staticmethod
     @BaseAddition.session_method
-    def get_random_quote_by(method_session: Session, g_id: int, q_number: int) -> Quote:
+    def migrate_content_hashes(method_session: Session) -> None:
         """
-        This method retrieves a random quote from a given server from the database.
+        This method migrates a database made before Quotes were recognized by their content hashes.
+        It hashes existing quotes in batches, deletes each Guild's later duplicates, and renumbers the quotes
+        that remain without gaps; quotes are renumbered through negative numbers so that no two ever share one.
+        Afterwards, the Guilds' quote counts are recounted, followed by their authors' counts.
+        It is written for PostgreSQL and can safely be run more than once.
 
         :param method_session: a Session database connection.
-        :param int g_id: a Discord Guild ID.
-        :param int q_number: a random number less than the maximum number of quotes that a server has.
-        :return Quote: a Quote object randomly selected from a given Guild.
         """
-        quote: Quote = method_session.query(Quote).filter_by(guild_id=g_id).all()[q_number]
-        return quote
+        method_session.execute("ALTER TABLE quotes ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+        last_quote_id: int = 0
+        while unhashed_quotes := method_session.execute(
+            "SELECT quote_id, author, text FROM quotes WHERE quote_id > :last_quote_id AND content_hash IS NULL "
+            "ORDER BY quote_id LIMIT :batch_size",
+            {"last_quote_id": last_quote_id, "batch_size": Quote.IMPORT_BATCH_SIZE}
+        ).fetchall():
+            method_session.execute(
+                "UPDATE quotes SET content_hash = :content_hash WHERE quote_id = :quote_id", [
+                    {"quote_id": quote_id, "content_hash": Quote.hash_content(author, text)}
+                    for quote_id, author, text in unhashed_quotes
+                ]
+            )
+            last_quote_id = unhashed_quotes[-1].quote_id
+        migration_statements: tuple = (
+            "DELETE FROM quotes WHERE quote_id IN (SELECT quote_id FROM ("
+            "SELECT quote_id, row_number() OVER (PARTITION BY guild_id, content_hash ORDER BY guild_quote_number) "
+            "AS copy_number FROM quotes) AS copies WHERE copies.copy_number > 1)",
+            "UPDATE quotes SET guild_quote_number = -numbered_quotes.guild_quote_number FROM ("
+            "SELECT quote_id, row_number() OVER (PARTITION BY guild_id ORDER BY guild_quote_number) "
+            "AS guild_quote_number FROM quotes) AS numbered_quotes WHERE quotes.quote_id = numbered_quotes.quote_id "
+            "AND quotes.guild_quote_number <> numbered_quotes.guild_quote_number",
+            "UPDATE quotes SET guild_quote_number = -guild_quote_number WHERE guild_quote_number < 0",
+            "UPDATE guilds SET quote_count = (SELECT count(*) FROM quotes WHERE quotes.guild_id = guilds.guild_id)",
+            "ALTER TABLE quotes ALTER COLUMN content_hash SET NOT NULL",
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_quotes_guild_content_hash ON quotes (guild_id, content_hash)"
+        )
+        for statement in migration_statements:
+            method_session.execute(statement)
+        method_session.commit()
+        AuthorQuoteCount.migrate_author_quote_counts()
+
+    @staticmethod
+    def migrate_author_number_index() -> None:
+        """
+        This method migrates a database made before the index of each Guild's Quotes by their authors
+        also ordered them by their numbers, which lets an author's Quotes be paged through with range scans.
+        It replaces the old index and can safely be run more than once.
+        """
+        index_names: list = [
+            index["name"] for index in sqlalchemy.inspect(current_engine()).get_indexes(Quote.__tablename__)
+        ]
+        for index in Quote.__table__.indexes:
+            if index.name == 'ix_quotes_guild_id_author_number' and index.name not in index_names:
+                index.create(bind=current_engine())
+        with current_engine().begin() as migration_connection:
+            migration_connection.execute("DROP INDEX IF EXISTS ix_quotes_guild_id_author")
+
+
+for search_dialect, search_statements in Quote.SEARCH_STATEMENTS.items():
+    for search_statement in search_statements:
+        event.listen(Quote.__table__, "after_create", DDL(search_statement).execute_if(dialect=search_dialect))
+event.listen(Quote.__table__, "before_drop", DDL("DROP TABLE IF EXISTS quotes_search").execute_if(dialect='sqlite'))
 
 
 class Reminder(Base, BaseAddition):
     """
     This class represents a reminder stored from a Guild for the SQLAlchemy ORM.
-    Once Smorg pings a role with a Reminder, that Reminder is deleted.
+    A Reminder's target is stored as a MentionableType and a Discord ID; its mention is only rendered once it is sent.
+    Once Smorg pings a role with a Reminder, that Reminder is deleted, unless it has a recurrence rule;
+    a recurring Reminder instead moves on to its next occurrence, which is the only one that is stored.
+    A due Reminder is first claimed by a bot process under a lease, which names the process and when the lease expires,
+    and is only deleted or moved on once that process acknowledges that it has been sent.
     """
     __tablename__ = 'reminders'
+    __table_args__ = (
+        Index('ix_reminders_reminder_datetime', 'reminder_datetime'),
+    )
+    RECURRENCE_RULE_LENGTH: int = 64
+    CLAIMANT_LENGTH: int = 64
 
-    guild_id = Column(BigInteger, ForeignKey('guilds.guild_id'), primary_key=True, nullable=False)
-    mentionable = Column(String(100), primary_key=True, nullable=False)
-    reminder_datetime = Column(DateTime(timezone=True), primary_key=True, nullable=False)
+    guild_id = Column(BigInteger, ForeignKey('guilds.guild_id', ondelete='CASCADE'), primary_key=True, nullable=False)
+    target_type = Column(SmallInteger, primary_key=True, nullable=False)
+    target_id = Column(BigInteger, primary_key=True, nullable=False)
+    reminder_datetime = Column(UTCDateTime, primary_key=True, nullable=False)
     reminder_text = Column(String(DiscordConstant.MAX_EMBED_FIELD_VALUE), nullable=True)
+    recurrence_rule = Column(String(RECURRENCE_RULE_LENGTH), nullable=True)
+    claimed_by = Column(String(CLAIMANT_LENGTH), nullable=True)
+    claim_expires_at = Column(UTCDateTime, nullable=True)
     created_at = Column(DateTime, default=sqlalchemy.sql.func.now(), nullable=False)
     last_updated_at = Column(DateTime, default=sqlalchemy.sql.func.now(), nullable=False,
                              onupdate=sqlalchemy.sql.func.now())
@@ -168,131 +1336,451 @@ class Reminder(Base, BaseAddition):
 
     # Methods:
     def __repr__(self) -> str:
-        return f'<Reminder(guild_id: {self.guild_id}, mentionable: {self.mentionable}, ' \
-               f'reminder_datetime: {self.reminder_datetime}, reminder_text: {self.reminder_text}, ' \
-               f'created_at: {self.created_at}, last_updated_at: {self.last_updated_at})>'
+        return f'<Reminder(guild_id: {self.guild_id}, target_type: {self.target_type}, ' \
+               f'target_id: {self.target_id}, reminder_datetime: {self.reminder_datetime}, ' \
+               f'reminder_text: {self.reminder_text}, created_at: {self.created_at}, ' \
+               f'last_updated_at: {self.last_updated_at})>'
 
     @staticmethod
     @BaseAddition.session_method
-    def create_reminder_with(method_session: Session, g_id: int, mentionable: str, r_text: Union[str, None],
-                             r_datetime: datetime) -> None:
+    def create_reminder_with(method_session: Session, g_id: int, t_type: MentionableType, t_id: int,
+                             r_text: Union[str, None], r_datetime: datetime) -> None:
         """
         This method creates a Reminder with a given mentionable, datetime, and optional message.
 
         :param method_session: a Session database connection.
         :param int g_id: a Discord Guild ID.
-        :param str mentionable: text representing a Role or Member's mention.
+        :param MentionableType t_type: the kind of mentionable that the Reminder targets.
+        :param int t_id: the Discord ID of the Role or Member that the Reminder targets.
         :param Union[str, None] r_text: text referring to what the Role or Member should be reminded about.
         :param datetime r_datetime: the date and time at which the Reminder will be sent.
         """
-        new_guild = Reminder(guild_id=g_id, mentionable=mentionable, reminder_text=r_text, reminder_datetime=r_datetime)
-        method_session.add(new_guild)
-        method_session.commit()
+        new_reminder = Reminder(
+            guild_id=g_id, target_type=t_type, target_id=t_id, reminder_text=r_text, reminder_datetime=r_datetime
+        )
+        method_session.add(new_reminder)
 
     @staticmethod
     @BaseAddition.session_method
-    def update_reminder_with(method_session: Session, g_id: int, mention: str, old_r_datetime: datetime,
-                             new_r_datetime: Union[datetime, None], new_r_text: Union[str, None]) -> None:
+    def update_reminder_with(method_session: Session, g_id: int, t_type: MentionableType, t_id: int,
+                             old_r_datetime: datetime, new_r_datetime: Union[datetime, None],
+                             new_r_text: Union[str, None]) -> None:
         """
         This method updates a Reminder with a new datetime and/or new text.
 
         :param method_session: a Session database connection.
         :param g_id: a Discord Guild ID.
-        :param mention: text representing a Role or Member's mention.
+        :param MentionableType t_type: the kind of mentionable that the Reminder targets.
+        :param int t_id: the Discord ID of the Role or Member that the Reminder targets.
         :param datetime old_r_datetime: the old date and time at which the Reminder will be sent.
         :param Union[datetime, None] new_r_datetime: the new date and time at which the Reminder will be sent.
         :param Union[str, None] new_r_text: the new text referring to what the Role or Member should be reminded about.
         """
         attributes_to_update: dict = {}
         reminder_to_update: query = method_session.query(Reminder).filter_by(
-            guild_id=g_id, mentionable=mention, reminder_datetime=old_r_datetime
+            guild_id=g_id, target_type=t_type, target_id=t_id, reminder_datetime=old_r_datetime
         )
         if new_r_datetime:
             attributes_to_update["reminder_datetime"] = new_r_datetime
         if new_r_text:
             attributes_to_update["reminder_text"] = new_r_text
         reminder_to_update.update(attributes_to_update)
-        method_session.commit()
 
     @staticmethod
     @BaseAddition.session_method
-    def get_reminders_by(method_session: Session, g_id: int, mention: str) -> list:
+    def update_recurrence_with(method_session: Session, g_id: int, t_type: MentionableType, t_id: int,
+                               r_datetime: datetime, r_rule: Union[str, None]) -> None:
+        """
+        This method sets or clears the recurrence rule of a Reminder.
+
+        :param method_session: a Session database connection.
+        :param g_id: a Discord Guild ID.
+        :param MentionableType t_type: the kind of mentionable that the Reminder targets.
+        :param int t_id: the Discord ID of the Role or Member that the Reminder targets.
+        :param datetime r_datetime: the date and time at which the Reminder will next be sent.
+        :param Union[str, None] r_rule: the text of the Reminder's recurrence rule, or None if it should not recur.
+        """
+        method_session.query(Reminder).filter_by(
+            guild_id=g_id, target_type=t_type, target_id=t_id, reminder_datetime=r_datetime
+        ).update({"recurrence_rule": r_rule})
+
+    @staticmethod
+    def query_reminders_by(method_session: Session, g_id: int, t_type: MentionableType, t_id: int) -> query:
+        """
+        This method builds the query for reminder datetimes, messages, and recurrence rules that are in some Guild
+        and apply to a given mentionable.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param MentionableType t_type: the kind of mentionable that the Reminders target.
+        :param int t_id: the Discord ID of the Role or Member that the Reminders target.
+        :return query: a query for Reminder datetimes, messages, and recurrence rules that meet the above criteria,
+        soonest first.
+        """
+        return method_session.query(
+            Reminder.reminder_datetime, Reminder.reminder_text, Reminder.recurrence_rule
+        ).filter_by(
+            guild_id=g_id, target_type=t_type, target_id=t_id
+        ).order_by(Reminder.reminder_datetime)
+
+    @staticmethod
+    @BaseAddition.session_method
+    def get_reminders_by(method_session: Session, g_id: int, t_type: MentionableType, t_id: int) -> list:
         """
         This method retrieves reminder datetimes and messages that are in some Guild and apply to a given mentionable.
 
         :param method_session: a Session database connection.
         :param int g_id: a Discord Guild ID.
-        :param str mention: text representing a Role or Member's mention.
+        :param MentionableType t_type: the kind of mentionable that the Reminders target.
+        :param int t_id: the Discord ID of the Role or Member that the Reminders target.
         :return list: a collection of Reminder datetimes and messages that meet the above criteria.
         """
-        reminder_list: list = method_session.query(Reminder.reminder_datetime, Reminder.reminder_text).filter_by(
-            guild_id=g_id, mentionable=mention
-        ).all()
+        reminder_list: list = Reminder.query_reminders_by(method_session, g_id, t_type, t_id).all()
         return reminder_list
 
     @staticmethod
     @BaseAddition.session_method
-    def pop_reminders_at(method_session: Session, relevant_datetime: datetime) -> list:
+    def get_reminder_page_by(method_session: Session, g_id: int, t_type: MentionableType, t_id: int,
+                             after_datetime: Union[datetime, None] = None, skipped_pages: int = 0) -> list:
         """
-        This method retrieves all Reminders that have passed some time.
-        It sends these back to the calling function and deletes them from the database.
+        This method retrieves a page of reminder datetimes and messages that are in some Guild
+        and apply to a given mentionable.
 
         :param method_session: a Session database connection.
-        :param datetime relevant_datetime: a time to which Reminder's datetimes will be compared.
-        :return list: a collection of Reminder objects that occurred before relevant_datetime.
+        :param int g_id: a Discord Guild ID.
+        :param MentionableType t_type: the kind of mentionable that the Reminders target.
+        :param int t_id: the Discord ID of the Role or Member that the Reminders target.
+        :param Union[datetime, None] after_datetime: the datetime after which the page starts, if any.
+        :param int skipped_pages: the number of pages between the given datetime and the desired page.
+        :return list: up to one Embed's worth of Reminder datetimes and messages that meet the above criteria,
+        soonest first.
         """
-        reminder_list: list = method_session.query(Reminder) \
-            .filter(Reminder.reminder_datetime <= relevant_datetime).all()
-        for reminder in reminder_list:
-            Reminder.delete_reminder_with(
-                g_id=reminder.guild_id, mention=reminder.mentionable, scheduled_time=reminder.reminder_datetime
-            )
-        return reminder_list
+        page_query: query = Reminder.query_reminders_by(method_session, g_id, t_type, t_id).order_by(None)
+        return BaseAddition.paginate(
+            method_session, page_query, Reminder.reminder_datetime, after_datetime, skipped_pages
+        )
+
+    @staticmethod
+    @BaseAddition.stream_method
+    def stream_reminders_by(method_session: Session, g_id: int, t_type: MentionableType, t_id: int) -> query:
+        """
+        This method streams reminder datetimes, messages, and recurrence rules that are in some Guild
+        and apply to a given mentionable.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param MentionableType t_type: the kind of mentionable that the Reminders target.
+        :param int t_id: the Discord ID of the Role or Member that the Reminders target.
+        :return query: the query whose Reminder datetimes, messages, and recurrence rules are streamed, soonest first.
+        """
+        return Reminder.query_reminders_by(method_session, g_id, t_type, t_id)
+
+    @staticmethod
+    @BaseAddition.fan_out_method(lambda shard_reminders: list(chain.from_iterable(shard_reminders)))
+    @BaseAddition.session_method
+    def claim_reminders_at(method_session: Session, relevant_datetime: datetime, claimant: str,
+                           lease_duration: timedelta, limit: int) -> list:
+        """
+        This method claims a batch of the Reminders that have passed some time for one bot process.
+        A claim is a lease: the Reminders are marked with their claimant and with when the lease expires
+        in a single UPDATE ... RETURNING statement, and they stay in the database until acknowledge_reminders
+        removes them once they are sent. Reminders under another claimant's unexpired lease are passed over,
+        so any number of bot processes can claim at once without receiving the same Reminder; those of a process that
+        crashed before acknowledging them can be claimed again once their lease expires.
+        On PostgreSQL, the batch is locked with FOR UPDATE SKIP LOCKED, so that concurrent claimants take different
+        batches instead of waiting on each other's row locks; SQLite lets only one writer in at a time.
+        Every database shard is claimed from concurrently, and their Reminders are returned together.
+
+        :param method_session: a Session database connection.
+        :param datetime relevant_datetime: a time to which Reminder's datetimes and leases will be compared.
+        :param str claimant: the name of the bot process that claims the Reminders.
+        :param timedelta lease_duration: how long the claimant has to send and acknowledge the Reminders.
+        :param int limit: the number of Reminders that each shard gives at most, earliest first.
+        :return list: a collection of Reminder rows that occurred before relevant_datetime.
+        """
+        reminder_table: sqlalchemy.Table = Reminder.__table__
+        reminder_columns: tuple = (
+            reminder_table.c.guild_id, reminder_table.c.target_type, reminder_table.c.target_id,
+            reminder_table.c.reminder_datetime, reminder_table.c.reminder_text, reminder_table.c.recurrence_rule
+        )
+        if engine.dialect.name == 'sqlite':
+            # SQLite has supported RETURNING since 3.35, but this version of SQLAlchemy cannot compile it for SQLite.
+            claim_statement = sqlalchemy.text(
+                "UPDATE reminders SET claimed_by = :claimant, claim_expires_at = :claim_expires_at "
+                "WHERE rowid IN (SELECT rowid FROM reminders WHERE reminder_datetime <= :relevant_datetime "
+                "AND (claim_expires_at IS NULL OR claim_expires_at <= :relevant_datetime) "
+                "ORDER BY reminder_datetime LIMIT :limit) "
+                "RETURNING guild_id, target_type, target_id, reminder_datetime, reminder_text, recurrence_rule"
+            ).bindparams(
+                sqlalchemy.bindparam("relevant_datetime", relevant_datetime, type_=UTCDateTime),
+                sqlalchemy.bindparam("claim_expires_at", relevant_datetime + lease_duration, type_=UTCDateTime),
+                claimant=claimant, limit=limit
+            ).columns(*reminder_columns)
+        else:
+            claimable_reminders = sqlalchemy.select(reminder_columns[:4]).where(sqlalchemy.and_(
+                reminder_table.c.reminder_datetime <= relevant_datetime,
+                sqlalchemy.or_(
+                    reminder_table.c.claim_expires_at.is_(None),
+                    reminder_table.c.claim_expires_at <= relevant_datetime
+                )
+            )).order_by(reminder_table.c.reminder_datetime).limit(limit).with_for_update(skip_locked=True)
+            claim_statement = reminder_table.update().where(
+                sqlalchemy.tuple_(*reminder_columns[:4]).in_(claimable_reminders)
+            ).values(
+                claimed_by=claimant, claim_expires_at=relevant_datetime + lease_duration
+            ).returning(*reminder_columns)
+        return method_session.execute(claim_statement).fetchall()
+
+    @staticmethod
+    @BaseAddition.fan_out_method(lambda shard_occurrences: sorted(chain.from_iterable(shard_occurrences)))
+    @BaseAddition.session_method
+    def acknowledge_reminders(method_session: Session, claimed_reminders: list, claimant: str,
+                              current_time: datetime) -> list:
+        """
+        This method settles Reminders that a bot process claimed and has sent, unless another claimant has taken them
+        over since their lease expired; those are left for their new claimant to settle. One-off Reminders are deleted
+        with one batched statement, while each recurring Reminder's row is moved on to its next occurrence in place
+        and released from its lease, all in the same transaction.
+        If another Reminder of the same target already holds a next occurrence, the recurring Reminder skips it,
+        as the other Reminder is sent then, and moves on to the first of its later occurrences that is free;
+        every skipped occurrence is logged.
+        Every database shard settles the Reminders of the Guilds that it owns concurrently.
+
+        :param method_session: a Session database connection.
+        :param list claimed_reminders: the Reminder rows that were claimed, as claim_reminders_at returned them.
+        :param str claimant: the name of the bot process that claimed the Reminders.
+        :param datetime current_time: the time zone aware date and time at which the Reminders were sent.
+        :return list: the occurrences to which the recurring Reminders were moved, in order.
+        """
+        claimed_reminders = [
+            reminder for reminder in claimed_reminders if route_guild(reminder.guild_id) == database_shard.get()
+        ]
+        if not claimed_reminders:
+            return []
+        claimed_keys: list = [
+            {
+                "claimed_guild_id": reminder.guild_id, "claimed_target_type": int(reminder.target_type),
+                "claimed_target_id": reminder.target_id, "claimed_reminder_datetime": reminder.reminder_datetime
+            } for reminder in claimed_reminders
+        ]
+        reminder_table: sqlalchemy.Table = Reminder.__table__
+        claimed_condition = sqlalchemy.and_(
+            reminder_table.c.guild_id == sqlalchemy.bindparam("claimed_guild_id"),
+            reminder_table.c.target_type == sqlalchemy.bindparam("claimed_target_type"),
+            reminder_table.c.target_id == sqlalchemy.bindparam("claimed_target_id"),
+            reminder_table.c.reminder_datetime == sqlalchemy.bindparam("claimed_reminder_datetime"),
+            reminder_table.c.claimed_by == claimant
+        )
+        one_off_keys: list = [
+            reminder_keys for reminder, reminder_keys in zip(claimed_reminders, claimed_keys)
+            if reminder.recurrence_rule is None
+        ]
+        if one_off_keys:
+            method_session.execute(reminder_table.delete().where(claimed_condition), one_off_keys)
+
+        advance_statement = reminder_table.update().where(claimed_condition).values(
+            reminder_datetime=sqlalchemy.bindparam("next_reminder_datetime", type_=UTCDateTime),
+            claimed_by=None, claim_expires_at=None, last_updated_at=sqlalchemy.func.current_timestamp()
+        )
+        next_occurrences: list = []
+        for reminder, reminder_keys in zip(claimed_reminders, claimed_keys):
+            if reminder.recurrence_rule is None:
+                continue
+            recurrence_rule: RecurrenceRule = RecurrenceRule.parse(reminder.recurrence_rule)
+            next_occurrence: datetime = recurrence_rule.next_after(reminder.reminder_datetime, current_time)
+            while True:
+                try:
+                    with method_session.begin_nested():
+                        advanced_count: int = method_session.execute(
+                            advance_statement, {**reminder_keys, "next_reminder_datetime": next_occurrence}
+                        ).rowcount
+                    break
+                except IntegrityError:
+                    logger.warning(
+                        f"A recurring reminder in Guild {reminder.guild_id} skipped its occurrence at "
+                        f"{next_occurrence.isoformat()}, which another reminder of the same target holds."
+                    )
+                    next_occurrence = recurrence_rule.next_after(next_occurrence, next_occurrence)
+            if advanced_count:
+                next_occurrences.append(next_occurrence)
+        return sorted(next_occurrences)
+
+    @staticmethod
+    @BaseAddition.fan_out_method(lambda shard_due_times: sorted(chain.from_iterable(shard_due_times)))
+    @BaseAddition.session_method
+    def get_due_times_before(method_session: Session, horizon: datetime, limit: int) -> list:
+        """
+        This method retrieves the earliest times at which Reminders are due, up to some horizon,
+        along with how many Reminders are due at each. It reads them from the index on Reminders' times.
+        A claimed Reminder is only due again once its lease expires, so its due time is taken to be its lease's expiry.
+        Every database shard is read concurrently; their times are merged in order, so up to limit per shard are given.
+
+        :param method_session: a Session database connection.
+        :param datetime horizon: the latest due time that is sought.
+        :param int limit: the number of distinct due times that each shard gives at most.
+        :return list: pairs of a due time and the number of Reminders due then, ordered by time.
+        """
+        claimable_datetime = sqlalchemy.func.coalesce(Reminder.claim_expires_at, Reminder.reminder_datetime)
+        return method_session.query(claimable_datetime, sqlalchemy.func.count()).filter(
+            Reminder.reminder_datetime <= horizon,
+            sqlalchemy.or_(Reminder.claim_expires_at.is_(None), Reminder.claim_expires_at <= horizon)
+        ).group_by(claimable_datetime).order_by(claimable_datetime).limit(limit).all()
 
     @staticmethod
     @BaseAddition.session_method
-    def has_reminder_with(method_session: Session, g_id: int, mention: str, scheduled_time: datetime) -> bool:
+    def has_reminder_with(method_session: Session, g_id: int, t_type: MentionableType, t_id: int,
+                          scheduled_time: datetime) -> bool:
         """
-        This method determines whether there's a Reminder with a given mention and datetime.
+        This method determines whether there's a Reminder with a given mentionable and datetime.
 
         :param method_session: a Session database connection.
         :param g_id: a Discord Guild ID.
-        :param mention: text representing a Role or Member's mention.
+        :param MentionableType t_type: the kind of mentionable that the Reminder targets.
+        :param int t_id: the Discord ID of the Role or Member that the Reminder targets.
         :param scheduled_time: a date and time at which a Reminder might be sent.
         :return bool: True if a Reminder with the given criteria exists; False, otherwise.
         """
         scheduled_reminder: Reminder = method_session.query(Reminder).filter_by(
-            guild_id=g_id, mentionable=mention, reminder_datetime=scheduled_time
+            guild_id=g_id, target_type=t_type, target_id=t_id, reminder_datetime=scheduled_time
         ).first()
         return True if scheduled_reminder else False
 
     @staticmethod
     @BaseAddition.session_method
-    def delete_reminder_with(method_session: Session, g_id: int, mention: str, scheduled_time: datetime) -> None:
+    def delete_reminder_with(method_session: Session, g_id: int, t_type: MentionableType, t_id: int,
+                             scheduled_time: datetime) -> None:
         """
-        This method deletes a Reminder if one exists that meets the given criteria: a Guild, a mention, and a datetime.
+        This method deletes a Reminder if one exists that meets the given criteria:
+        a Guild, a mentionable, and a datetime.
 
         :param method_session: a Session database connection.
         :param g_id: a Discord Guild ID.
-        :param mention: text representing a Role or Member's mention.
+        :param MentionableType t_type: the kind of mentionable that the Reminder targets.
+        :param int t_id: the Discord ID of the Role or Member that the Reminder targets.
         :param scheduled_time: a date and time at which a Reminder might be sent.
         """
         method_session.query(Reminder).filter_by(
-            guild_id=g_id, mentionable=mention, reminder_datetime=scheduled_time
+            guild_id=g_id, target_type=t_type, target_id=t_id, reminder_datetime=scheduled_time
         ).delete()
+
+    # Migrations:
+    @staticmethod
+    @BaseAddition.session_method
+    def migrate_reminder_targets(method_session: Session) -> IndexSizes:
+        """
+        This method migrates a database made when Reminders were keyed by their rendered mentions.
+        It parses each mention into a MentionableType and an ID, rebuilds the primary key on those columns,
+        and drops the mention column. It is written for PostgreSQL and does nothing if it has already been run.
+
+        :param method_session: a Session database connection.
+        :return IndexSizes: the size of the Reminders' primary key index before and after the migration.
+        """
+        reminder_columns: list = sqlalchemy.inspect(method_session.get_bind()).get_columns('reminders')
+        if 'mentionable' not in [column['name'] for column in reminder_columns]:
+            index_size: int = Reminder.measure_primary_key(method_session)
+            return IndexSizes(index_size, index_size)
+        migration_statements: tuple = (
+            "ALTER TABLE reminders ADD COLUMN target_type SMALLINT, ADD COLUMN target_id BIGINT",
+            f"UPDATE reminders SET target_id = CAST(substring(mentionable FROM '[0-9]+') AS BIGINT), "
+            f"target_type = CASE WHEN mentionable LIKE '<@&%' THEN {MentionableType.ROLE.value} "
+            f"ELSE {MentionableType.MEMBER.value} END",
+            "ALTER TABLE reminders DROP CONSTRAINT reminders_pkey",
+            "ALTER TABLE reminders ALTER COLUMN target_type SET NOT NULL, ALTER COLUMN target_id SET NOT NULL",
+            "ALTER TABLE reminders ADD CONSTRAINT reminders_pkey "
+            "PRIMARY KEY (guild_id, target_type, target_id, reminder_datetime)",
+            "ALTER TABLE reminders DROP COLUMN mentionable"
+        )
+        index_size_before: int = Reminder.measure_primary_key(method_session)
+        for statement in migration_statements:
+            method_session.execute(statement)
+        method_session.commit()
+        index_size_after: int = Reminder.measure_primary_key(method_session)
+        return IndexSizes(index_size_before, index_size_after)
+
+    @staticmethod
+    def migrate_datetime_index() -> None:
+        """
+        This method migrates a database made before Reminders were indexed by the times at which they are due.
+        It can safely be run more than once.
+        """
+        index_names: list = [
+            index["name"] for index in sqlalchemy.inspect(current_engine()).get_indexes(Reminder.__tablename__)
+        ]
+        for index in Reminder.__table__.indexes:
+            if index.name == 'ix_reminders_reminder_datetime' and index.name not in index_names:
+                index.create(bind=current_engine())
+
+    @staticmethod
+    def migrate_recurrence_rules() -> None:
+        """
+        This method migrates a database made before Reminders could recur by adding their recurrence_rule column;
+        on SQLite, it also adds the triggers that limit the column's length. It can safely be run more than once.
+        """
+        column_names: list = [
+            column["name"] for column in sqlalchemy.inspect(current_engine()).get_columns(Reminder.__tablename__)
+        ]
+        with current_engine().begin() as migration_connection:
+            if 'recurrence_rule' not in column_names:
+                migration_connection.execute(
+                    f"ALTER TABLE reminders ADD COLUMN recurrence_rule VARCHAR({Reminder.RECURRENCE_RULE_LENGTH})"
+                )
+            if engine.dialect.name == 'sqlite':
+                for length_trigger in compose_sqlite_length_triggers(
+                    Reminder.__table__, Reminder.__table__.c.recurrence_rule
+                ):
+                    migration_connection.execute(length_trigger)
+
+    @staticmethod
+    def migrate_reminder_leases() -> None:
+        """
+        This method migrates a database made before Reminders were claimed under leases by adding the columns
+        that hold their claimant and their lease's expiry; on SQLite, it also adds the triggers that limit
+        the claimant's length. It can safely be run more than once.
+        """
+        column_names: list = [
+            column["name"] for column in sqlalchemy.inspect(current_engine()).get_columns(Reminder.__tablename__)
+        ]
+        claim_expiry_type: str = Reminder.__table__.c.claim_expires_at.type.compile(dialect=engine.dialect)
+        with current_engine().begin() as migration_connection:
+            if 'claimed_by' not in column_names:
+                migration_connection.execute(
+                    f"ALTER TABLE reminders ADD COLUMN claimed_by VARCHAR({Reminder.CLAIMANT_LENGTH})"
+                )
+            if 'claim_expires_at' not in column_names:
+                migration_connection.execute(f"ALTER TABLE reminders ADD COLUMN claim_expires_at {claim_expiry_type}")
+            if engine.dialect.name == 'sqlite':
+                for length_trigger in compose_sqlite_length_triggers(
+                    Reminder.__table__, Reminder.__table__.c.claimed_by
+                ):
+                    migration_connection.execute(length_trigger)
+
+    @staticmethod
+    def measure_primary_key(method_session: Session) -> int:
+        """
+        This method rebuilds the Reminders' primary key index and measures it.
+        Rebuilding it first keeps dead entries, such as those left behind by a migration, out of the measurement.
+
+        :param method_session: a Session database connection.
+        :return int: the size of the Reminders' primary key index, in bytes.
+        """
+        method_session.execute("REINDEX INDEX reminders_pkey")
         method_session.commit()
+        return method_session.execute("SELECT pg_relation_size('reminders_pkey')").scalar()
 
 
 class Guild(Base, BaseAddition):
     """
-    This class represents a Discord server, called a Guild. It is the main table which other tables rely on.
+    This class represents a Discord server, called a Guild. It is the main table which other tables rely on;
+    their rows are deleted along with their Guild's.
     """
     __tablename__ = 'guilds'
+    RECONCILIATION_BATCH_SIZE: int = 1000
 
     # Attributes:
     guild_id = Column(BigInteger, primary_key=True, nullable=False)
     gamble_channel_id = Column(BigInteger, unique=True, nullable=True)
     guild_prefix = Column(String, default='.', nullable=False)
+    quote_count = Column(Integer, default=0, nullable=False)
     quotation_channel_id = Column(BigInteger, unique=True, nullable=True)
     reminder_channel_id = Column(BigInteger, unique=True, nullable=True)
     created_at = Column(DateTime, default=sqlalchemy.sql.func.now(), nullable=False)
@@ -300,31 +1788,95 @@ class Guild(Base, BaseAddition):
                              nullable=False, onupdate=sqlalchemy.sql.func.now())
 
     # Relationships:
-    quotes = relationship("Quote", order_by=Quote.quote_id, back_populates="guild", cascade="delete")
+    quotes = relationship(
+        "Quote", order_by=Quote.quote_id, back_populates="guild", cascade="delete", passive_deletes=True
+    )
     reminders = relationship(
-        "Reminder", order_by=Reminder.reminder_datetime, back_populates="guild", cascade="delete"
+        "Reminder", order_by=Reminder.reminder_datetime, back_populates="guild", cascade="delete",
+        passive_deletes=True
     )
+    author_quote_counts = relationship("AuthorQuoteCount", cascade="delete", passive_deletes=True)
 
     # Methods:
     def __repr__(self):
         return f'<Guild(guild_id: {self.guild_id}, gamble_channel_id: {self.gamble_channel_id}, ' \
-               f'guild_prefix: {self.guild_prefix}, quotation_channel_id: {self.quotation_channel_id}, ' \
+               f'guild_prefix: {self.guild_prefix}, quote_count: {self.quote_count}, ' \
+               f'quotation_channel_id: {self.quotation_channel_id}, ' \
                f'reminder_channel_id: {self.reminder_channel_id}, created_at: {self.created_at}, ' \
                f'last_updated_at: {self.last_updated_at})>'
 
     # Queries:
+    @staticmethod
+    def lock_with(method_session: Session, g_id: int) -> Guild:
+        """
+        This method retrieves a Guild and locks it for the rest of the transaction, so that the Guild's quotes
+        can be numbered and counted without interference. PostgreSQL locks the Guild's row;
+        SQLite has only one writer at a time, so a write to the row first makes the transaction that writer.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :return Guild: the locked Guild.
+        """
+        if engine.dialect.name == 'sqlite':
+            method_session.query(Guild).filter_by(guild_id=g_id).update(
+                {Guild.quote_count: Guild.quote_count}, synchronize_session=False
+            )
+        locked_guild: Guild = method_session.query(Guild).filter_by(guild_id=g_id).with_for_update().one()
+        return locked_guild
+
     @staticmethod
     @BaseAddition.session_method
-    def get_quotation_channel_by(method_session: Session, g_id: int) -> Union[int, None]:
+    def get_settings_by(method_session: Session, g_id: int) -> dict:
         """
-        This method retrieves the quotation channel for a given Guild.
+        This method retrieves the settings of a given Guild: its prefix and its designated channels.
+        It is the loader behind the GuildSettingsCache.
 
         :param method_session: a Session database connection.
         :param int g_id: a Discord Guild ID.
+        :return dict: the Guild's settings keyed by their column names, or an empty dictionary if it is unknown.
+        """
+        guild_settings = method_session.query(
+            Guild.guild_prefix, Guild.quotation_channel_id, Guild.reminder_channel_id, Guild.gamble_channel_id
+        ).filter_by(guild_id=g_id).first()
+        return guild_settings._asdict() if guild_settings else {}
+
+    @staticmethod
+    @BaseAddition.fan_out_method(lambda shard_settings: {
+        g_id: guild_settings for settings in shard_settings for g_id, guild_settings in settings.items()
+    })
+    @BaseAddition.session_method
+    def get_settings_of(method_session: Session, guild_ids: list) -> dict:
+        """
+        This method retrieves the settings of several Guilds at once, in one query per database shard.
+        It is the batched counterpart of get_settings_by.
+
+        :param method_session: a Session database connection.
+        :param list guild_ids: the Discord Guild IDs of the Guilds whose settings are sought.
+        :return dict: each known Guild's settings keyed by their column names, keyed by Guild ID.
+        """
+        shard_guild_ids: list = [g_id for g_id in guild_ids if route_guild(g_id) == database_shard.get()]
+        if not shard_guild_ids:
+            return {}
+        guild_settings: dict = {}
+        for settings_row in method_session.query(
+            Guild.guild_id, Guild.guild_prefix, Guild.quotation_channel_id, Guild.reminder_channel_id,
+            Guild.gamble_channel_id
+        ).filter(Guild.guild_id.in_(shard_guild_ids)):
+            settings_row: dict = settings_row._asdict()
+            guild_settings[settings_row.pop("guild_id")] = settings_row
+        return guild_settings
+
+    @staticmethod
+    @BaseAddition.cached_method(lambda g_id: g_id)
+    def get_quotation_channel_by(guild_settings: dict, g_id: int) -> Union[int, None]:
+        """
+        This method retrieves the quotation channel for a given Guild.
+
+        :param dict guild_settings: the Guild's cached settings.
+        :param int g_id: a Discord Guild ID.
         :return Union[int, None]: the Guild's quotation channel ID, if it exists.
         """
-        quotation_channel = method_session.query(Guild.quotation_channel_id).filter_by(guild_id=g_id).first()
-        return quotation_channel[0]
+        return guild_settings.get("quotation_channel_id")
 
     @staticmethod
     @BaseAddition.session_method
@@ -349,9 +1901,68 @@ class Guild(Base, BaseAddition):
         :param int g_id: a Discord Guild ID.
         :param int c_id: a Discord Channel ID.
         """
-        new_guild = Guild(guild_id=g_id, quotation_channel_id=c_id, reminder_channel_id=c_id)
+        guild_settings: dict = Guild.default_settings_with(c_id)
+        new_guild = Guild(guild_id=g_id, **guild_settings)
         method_session.add(new_guild)
-        method_session.commit()
+        BaseAddition.call_after_commit(partial(guild_settings_cache.put, g_id, guild_settings), method_session)
+
+    @staticmethod
+    @BaseAddition.fan_out_method(lambda shard_guild_ids: tuple(
+        list(chain.from_iterable(guild_ids)) for guild_ids in zip(*shard_guild_ids)
+    ))
+    @BaseAddition.session_method
+    def reconcile_with(method_session: Session, default_channel_ids: dict,
+                       is_departed: Union[Callable, None] = None) -> tuple:
+        """
+        This method brings the database's Guilds in line with the Guilds that Smorg is currently a member of.
+        It reads every known Guild's settings in one query, caching those of current Guilds,
+        creates the missing Guilds with multi-row inserts, and deletes the departed Guilds in one statement.
+        A known Guild that is not current has only departed if is_departed says so, as it may merely be unavailable
+        or belong to a Discord shard that another process runs; without is_departed, no Guild is deleted.
+        Every database shard is reconciled concurrently with the current Guilds that it owns.
+
+        :param method_session: a Session database connection.
+        :param dict default_channel_ids: the default channel ID, or None, of each current Guild, keyed by Guild ID.
+        :param Union[Callable, None] is_departed: a function that takes the ID of a known Guild that is not current
+        and determines whether Smorg has left it.
+        :return tuple: the IDs of the Guilds that were created and the IDs of the Guilds that were deleted.
+        """
+        default_channel_ids = {
+            g_id: c_id for g_id, c_id in default_channel_ids.items() if route_guild(g_id) == database_shard.get()
+        }
+        known_guild_ids: set = set()
+        for guild_settings in method_session.query(
+            Guild.guild_id, Guild.guild_prefix, Guild.quotation_channel_id, Guild.reminder_channel_id,
+            Guild.gamble_channel_id
+        ):
+            guild_settings: dict = guild_settings._asdict()
+            g_id: int = guild_settings.pop("guild_id")
+            known_guild_ids.add(g_id)
+            if g_id in default_channel_ids:
+                guild_settings_cache.put(g_id, guild_settings)
+
+        new_guilds: list = [
+            {"guild_id": g_id, **Guild.default_settings_with(c_id)} for g_id, c_id in default_channel_ids.items()
+            if g_id not in known_guild_ids
+        ]
+        for batch_start in range(0, len(new_guilds), Guild.RECONCILIATION_BATCH_SIZE):
+            new_guild_batch: list = new_guilds[batch_start:batch_start + Guild.RECONCILIATION_BATCH_SIZE]
+            method_session.execute(Guild.__table__.insert().values(new_guild_batch))
+        new_guild_ids: list = []
+        for new_guild in new_guilds:
+            new_guild_ids.append(new_guild.pop("guild_id"))
+            BaseAddition.call_after_commit(
+                partial(guild_settings_cache.put, new_guild_ids[-1], new_guild), method_session
+            )
+
+        departed_guild_ids: list = [] if is_departed is None else [
+            g_id for g_id in known_guild_ids.difference(default_channel_ids) if is_departed(g_id)
+        ]
+        if departed_guild_ids:
+            method_session.query(Guild).filter(Guild.guild_id.in_(departed_guild_ids)).delete(synchronize_session=False)
+            for g_id in departed_guild_ids:
+                BaseAddition.call_after_commit(partial(guild_settings_cache.discard, g_id), method_session)
+        return new_guild_ids, departed_guild_ids
 
     @staticmethod
     @BaseAddition.session_method
@@ -363,7 +1974,7 @@ class Guild(Base, BaseAddition):
         :param g_id: a Discord Guild ID.
         """
         method_session.query(Guild).filter_by(guild_id=g_id).delete()
-        method_session.commit()
+        BaseAddition.call_after_commit(partial(guild_settings_cache.discard, g_id), method_session)
 
     @staticmethod
     @BaseAddition.session_method
@@ -376,20 +1987,44 @@ class Guild(Base, BaseAddition):
         :param int c_id: a Discord Channel ID.
         """
         method_session.query(Guild).filter_by(guild_id=g_id).update({"quotation_channel_id": c_id})
-        method_session.commit()
+        BaseAddition.call_after_commit(
+            partial(guild_settings_cache.update, g_id, quotation_channel_id=c_id), method_session
+        )
 
     @staticmethod
-    @BaseAddition.session_method
-    def get_reminder_channel_by(method_session: Session, g_id: int) -> int:
+    @BaseAddition.cached_method(lambda g_id: g_id)
+    def get_reminder_channel_by(guild_settings: dict, g_id: int) -> Union[int, None]:
         """
         This method retrieves the reminder channel for a given Guild.
 
-        :param method_session: a Session database connection.
+        :param dict guild_settings: the Guild's cached settings.
         :param int g_id: a Discord Guild ID.
-        :return int: a channel ID.
+        :return Union[int, None]: a channel ID, if it exists.
+        """
+        return guild_settings.get("reminder_channel_id")
+
+    @staticmethod
+    @BaseAddition.awaitable_method
+    def get_reminder_channels_by(guild_ids: set) -> dict:
         """
-        reminder_channel = method_session.query(Guild.reminder_channel_id).filter_by(guild_id=g_id).first()
-        return reminder_channel[0]
+        This method retrieves the reminder channels of several Guilds at once. Cached settings are used where
+        they exist; the rest are loaded with one call to get_settings_of and cached for later calls.
+
+        :param set guild_ids: the Discord Guild IDs of the Guilds whose reminder channels are sought.
+        :return dict: each Guild's reminder channel ID, or None, keyed by Guild ID.
+        """
+        guild_settings: dict = {}
+        for g_id in guild_ids:
+            cached_settings: Union[dict, None] = guild_settings_cache.get(g_id)
+            if cached_settings is not None:
+                guild_settings[g_id] = cached_settings
+        missing_guild_ids: list = [g_id for g_id in guild_ids if g_id not in guild_settings]
+        if missing_guild_ids:
+            loaded_settings: dict = Guild.get_settings_of(missing_guild_ids)
+            for g_id in missing_guild_ids:
+                guild_settings[g_id] = loaded_settings.get(g_id, {})
+                guild_settings_cache.put(g_id, guild_settings[g_id])
+        return {g_id: settings.get("reminder_channel_id") for g_id, settings in guild_settings.items()}
 
     @staticmethod
     @BaseAddition.session_method
@@ -402,20 +2037,21 @@ class Guild(Base, BaseAddition):
         :param int c_id: a Discord Channel ID.
         """
         method_session.query(Guild).filter_by(guild_id=g_id).update({"reminder_channel_id": c_id})
-        method_session.commit()
+        BaseAddition.call_after_commit(
+            partial(guild_settings_cache.update, g_id, reminder_channel_id=c_id), method_session
+        )
 
     @staticmethod
-    @BaseAddition.session_method
-    def get_gamble_channel_by(method_session: Session, g_id: int) -> int:
+    @BaseAddition.cached_method(lambda g_id: g_id)
+    def get_gamble_channel_by(guild_settings: dict, g_id: int) -> Union[int, None]:
         """
         This method retrieves the gamble channel for a given Guild.
 
-        :param method_session: a Session database connection.
+        :param dict guild_settings: the Guild's cached settings.
         :param int g_id: a Discord Guild ID.
-        :return int: a channel ID.
+        :return Union[int, None]: a channel ID, if it exists.
         """
-        reminder_channel = method_session.query(Guild.gamble_channel_id).filter_by(guild_id=g_id).first()
-        return reminder_channel[0]
+        return guild_settings.get("gamble_channel_id")
 
     @staticmethod
     @BaseAddition.session_method
@@ -428,22 +2064,34 @@ class Guild(Base, BaseAddition):
         :param int c_id: a Discord Channel ID.
         """
         method_session.query(Guild).filter_by(guild_id=g_id).update({"gamble_channel_id": c_id})
-        method_session.commit()
+        BaseAddition.call_after_commit(
+            partial(guild_settings_cache.update, g_id, gamble_channel_id=c_id), method_session
+        )
 
     @staticmethod
-    @BaseAddition.session_method
-    def get_prefix(method_session: Session, bot: Bot, message: Message) -> str:
+    def default_settings_with(c_id: Union[int, None]) -> dict:
+        """
+        This method gives the settings of a newly-created Guild.
+
+        :param Union[int, None] c_id: a Discord Channel ID to use for quotations and reminders, if one exists.
+        :return dict: the Guild's settings, keyed by their column names.
+        """
+        return {
+            "guild_prefix": '.', "quotation_channel_id": c_id, "reminder_channel_id": c_id, "gamble_channel_id": None
+        }
+
+    @staticmethod
+    @BaseAddition.cached_method(lambda bot, message: message.channel.guild.id)
+    def get_prefix(guild_settings: dict, bot: Bot, message: Message) -> str:
         """
         This method retrieves the command prefix that must begin each of Smorg's commands.
 
-        :param method_session: a Session database connection.
+        :param dict guild_settings: the cached settings of the message's Guild.
         :param Bot bot: the Bot instance for which the given prefix is relevant.
         :param Message message: the Discord message for which a prefix must be identified.
         :return str: the character(s) of a specified Guild's command prefix.
         """
-        g_id: int = message.channel.guild.id
-        guild_prefix: list = method_session.query(Guild.guild_prefix).filter_by(guild_id=g_id).first()
-        return guild_prefix[0] if guild_prefix else '.'
+        return guild_settings.get("guild_prefix", '.')
 
     @staticmethod
     @BaseAddition.session_method
@@ -456,4 +2104,205 @@ class Guild(Base, BaseAddition):
         :param new_prefix: a series of characters that specifies a new prefix for the Guild's commands to Smorg.
         """
         method_session.query(Guild).filter_by(guild_id=g_id).update({"guild_prefix": new_prefix})
-        method_session.commit()
+        BaseAddition.call_after_commit(
+            partial(guild_settings_cache.update, g_id, guild_prefix=new_prefix), method_session
+        )
+
+    # Migrations:
+    @staticmethod
+    @BaseAddition.session_method
+    def migrate_guild_cascades(method_session: Session) -> None:
+        """
+        This method migrates a database made before Quotes and Reminders were deleted along with their Guild.
+        It recreates their foreign keys with ON DELETE CASCADE. It is written for PostgreSQL and can safely be run
+        more than once.
+
+        :param method_session: a Session database connection.
+        """
+        for table_name in (Quote.__tablename__, Reminder.__tablename__):
+            method_session.execute(
+                f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {table_name}_guild_id_fkey, "
+                f"ADD CONSTRAINT {table_name}_guild_id_fkey FOREIGN KEY (guild_id) "
+                f"REFERENCES guilds (guild_id) ON DELETE CASCADE"
+            )
+
+
+class AuthorQuoteCount(Base, BaseAddition):
+    """
+    This class represents the number of quotes that an author has in a Guild for the SQLAlchemy ORM.
+    Counts are maintained by Quote.create_quote_with and deleted along with their Guild,
+    so that statistics about quotes never need to count the quotes themselves.
+    Anonymous quotes are counted under an empty author.
+    """
+    __tablename__ = 'author_quote_counts'
+
+    # Attributes:
+    guild_id = Column(BigInteger, ForeignKey('guilds.guild_id', ondelete='CASCADE'), primary_key=True, nullable=False)
+    author = Column(String(DiscordConstant.MAX_ROLE_LENGTH), primary_key=True, nullable=False)
+    quote_count = Column(Integer, default=0, nullable=False)
+
+    # Methods:
+    def __repr__(self) -> str:
+        return f'<AuthorQuoteCount(guild_id: {self.guild_id}, author: {self.author}, ' \
+               f'quote_count: {self.quote_count})>'
+
+    # Queries:
+    @staticmethod
+    def add_quote_counts(method_session: Session, g_id: int, author_counts: Counter) -> None:
+        """
+        This method adds newly stored quotes to their authors' counts in a Guild.
+        It should be called while the Guild's row is locked, as Quote.create_quote_with does.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :param Counter author_counts: the number of new quotes by each author.
+        """
+        current_counts: dict = {
+            author_count.author: author_count for author_count in method_session.query(AuthorQuoteCount).filter(
+                AuthorQuoteCount.guild_id == g_id, AuthorQuoteCount.author.in_(list(author_counts))
+            )
+        } if author_counts else {}
+        for author, quote_count in author_counts.items():
+            if author in current_counts:
+                current_counts[author].quote_count += quote_count
+            else:
+                method_session.add(AuthorQuoteCount(guild_id=g_id, author=author, quote_count=quote_count))
+
+    @staticmethod
+    @BaseAddition.session_method
+    def get_top_authors_by(method_session: Session, g_id: int) -> list:
+        """
+        This method retrieves the authors with the most quotes in a Guild, up to one Embed's worth,
+        by reading them from the front of an index on the Guild's counts.
+
+        :param method_session: a Session database connection.
+        :param int g_id: a Discord Guild ID.
+        :return list: the authors and their quote counts, from the most quoted; ties are in alphabetical order.
+        """
+        author_list: list = method_session.query(AuthorQuoteCount.author, AuthorQuoteCount.quote_count).filter(
+            AuthorQuoteCount.guild_id == g_id
+        ).order_by(
+            AuthorQuoteCount.quote_count.desc(), AuthorQuoteCount.author
+        ).limit(DiscordConstant.MAX_EMBED_FIELDS).all()
+        return author_list
+
+    # Migrations:
+    @staticmethod
+    @BaseAddition.session_method
+    def migrate_author_quote_counts(method_session: Session) -> None:
+        """
+        This method migrates a database made before quote counts were maintained for each author.
+        It counts each Guild's existing quotes by author once, replacing any counts that are already present,
+        and can safely be run more than once.
+
+        :param method_session: a Session database connection.
+        """
+        method_session.query(AuthorQuoteCount).delete()
+        quote_author = sqlalchemy.func.coalesce(Quote.author, '')
+        method_session.execute(AuthorQuoteCount.__table__.insert().from_select(
+            ['guild_id', 'author', 'quote_count'],
+            sqlalchemy.select([Quote.guild_id, quote_author, sqlalchemy.func.count()]).group_by(
+                Quote.guild_id, quote_author
+            )
+        ))
+
+
+Index(
+    'ix_author_quote_counts_guild_id_count', AuthorQuoteCount.guild_id, AuthorQuoteCount.quote_count.desc(),
+    AuthorQuoteCount.author
+)
+
+
+class SchemaVersion(Base, BaseAddition):
+    """
+    This class represents a migration that has been applied to the database for the SQLAlchemy ORM.
+    The highest applied version tells bootstrap_database which of the SCHEMA_MIGRATIONS are still pending.
+    """
+    __tablename__ = 'schema_versions'
+
+    # Attributes:
+    version = Column(Integer, primary_key=True, autoincrement=False, nullable=False)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, default=sqlalchemy.sql.func.now(), nullable=False)
+
+    # Methods:
+    def __repr__(self) -> str:
+        return f'<SchemaVersion(version: {self.version}, name: {self.name}, applied_at: {self.applied_at})>'
+
+    # Queries:
+    @staticmethod
+    @BaseAddition.session_method
+    def get_current_version(method_session: Session) -> int:
+        """
+        This method retrieves the version of the latest migration that has been applied to the database.
+
+        :param method_session: a Session database connection.
+        :return int: the highest applied version, or zero if no migration has been recorded.
+        """
+        current_version: Union[int, None] = method_session.query(sqlalchemy.func.max(SchemaVersion.version)).scalar()
+        return current_version or 0
+
+    @staticmethod
+    @BaseAddition.session_method
+    def record_versions(method_session: Session, migrations: list) -> None:
+        """
+        This method records that some migrations have been applied to the database.
+
+        :param method_session: a Session database connection.
+        :param list migrations: a collection of migrations, each a version, a name, and the migrating function.
+        """
+        method_session.add_all([SchemaVersion(version=version, name=name) for version, name, migration in migrations])
+
+
+def compose_sqlite_length_triggers(table: sqlalchemy.Table, column: sqlalchemy.Column) -> list:
+    """
+    This function writes the SQLite triggers that abort an insert or update which would overfill a String column.
+
+    :param sqlalchemy.Table table: the table to which the column belongs.
+    :param sqlalchemy.Column column: a String column with a length.
+    :return list: the statements that create the column's triggers, if they do not already exist.
+    """
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table.name}_{column.name}_{operation.split()[0].lower()}_length "
+        f"BEFORE {operation} ON {table.name} "
+        f"WHEN length(new.{column.name}) > {int(column.type.length)} "
+        f"BEGIN SELECT RAISE(ABORT, 'value too long for {table.name}.{column.name}'); END"
+        for operation in ("INSERT", f"UPDATE OF {column.name}")
+    ]
+
+
+def enforce_sqlite_lengths(table: sqlalchemy.Table) -> None:
+    """
+    This function makes SQLite reject overlong values in a table's limited String columns, as PostgreSQL does.
+    For each such column, it adds triggers to the table's creation on SQLite that abort an overlong insert or update;
+    translate_sqlite_error then raises the same DataError as PostgreSQL would.
+
+    :param sqlalchemy.Table table: a table whose String columns' lengths should be enforced.
+    """
+    for column in table.columns:
+        if isinstance(column.type, String) and column.type.length:
+            for length_trigger in compose_sqlite_length_triggers(table, column):
+                event.listen(table, "after_create", DDL(length_trigger).execute_if(dialect='sqlite'))
+
+
+for limited_table in Base.metadata.sorted_tables:
+    enforce_sqlite_lengths(limited_table)
+
+
+# Each migration is a version, a name, and a function that can safely be run more than once. New migrations must be
+# appended with the next version, as bootstrap_database runs every migration above a database's recorded version.
+SCHEMA_MIGRATIONS: tuple = (
+    (1, "index quotes by author", Quote.migrate_author_index),
+    (2, "index reminders by due time", Reminder.migrate_datetime_index),
+    (3, "number quotes within guilds", Quote.migrate_quote_identity),
+    (4, "key reminders by target type and ID", Reminder.migrate_reminder_targets),
+    (5, "cascade guild deletions", Guild.migrate_guild_cascades),
+    (6, "order the author index by quote number", Quote.migrate_author_number_index),
+    (7, "search quotes by their content", Quote.migrate_search_vector),
+    (8, "count quotes by author", AuthorQuoteCount.migrate_author_quote_counts),
+    (9, "deduplicate quotes by content", Quote.migrate_content_hashes),
+    (10, "repeat reminders by a rule", Reminder.migrate_recurrence_rules),
+    (11, "claim reminders under leases", Reminder.migrate_reminder_leases),
+)
+# SQLite was supported from this version onwards, and the migrations before it were written for PostgreSQL.
+SQLITE_BASELINE_VERSION: int = 9
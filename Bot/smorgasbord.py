@@ -1,6 +1,7 @@
 """
 This file defines the Smorg class, inserting all Cogs into one AutoShardedBot instance.
-It removes the default help command and inserts the bot's Discord key.
+It removes the default help command, gives each command invocation its own database unit of work,
+and inserts the bot's Discord key.
 By having it as a class, it can be more formally created and run at separate times and in multiple instances.
 """
 
@@ -16,13 +17,15 @@ from .Cogs.logger import Logger
 from .Cogs.quoter import Quoter
 from .Cogs.recaller import Recaller
 from .secretbord import bot_key
-from .smorgasDB import Guild
+from .smorgasDB import BaseAddition, Guild
 
 
 class Smorg:
     def __init__(self):
-        self.bot = AutoShardedBot(command_prefix=Guild.get_prefix)
+        self.bot = AutoShardedBot(command_prefix=Guild.get_prefix.awaitable)
         self.bot.remove_command('help')
+        self.bot.before_invoke(BaseAddition.begin_unit_of_work)
+        self.bot.after_invoke(BaseAddition.end_unit_of_work)
 
         for cog in [Arranger, Cataloguer, Encoder, Gambler, Hearer, Helper, Logger, Quoter, Recaller]:
             self.bot.add_cog(cog(self.bot))
@@ -1,2 +1,22 @@
-# TODO: will contain tests for the Cataloguer Cog and its composite commands
+# Contains tests for the PageNumber converter, by which the Cataloguer's paged displays read their page arguments.
 
+import pytest
+
+from discord.ext.commands import BadArgument
+
+from ...Bot.Cogs.cataloguer import PageNumber
+
+
+class TestPageNumber:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("argument, page_number", [("page=3", 3), ("Page=12", 12)])
+    async def test_page_arguments_are_read(argument, page_number):
+        assert await PageNumber().convert(None, argument) == page_number
+
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("argument", ["1984", "page=", "page=0", "page=two", "pages=2"])
+    async def test_other_arguments_are_rejected(argument):
+        with pytest.raises(BadArgument):
+            await PageNumber().convert(None, argument)
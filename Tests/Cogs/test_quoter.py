@@ -1,2 +1,53 @@
-# TODO: will contain tests for the Quoter Cog and its composite commands
+# Contains tests for the Quoter's archive import, which reads quotes from an attached NDJSON or CSV file.
 
+import pytest
+
+from types import SimpleNamespace
+
+from ...Bot.Cogs.Helpers.exceptioner import InvalidImport
+from ...Bot.Cogs.quoter import Quoter
+from ...Bot.smorgasDB import Quote
+
+
+def make_import_context(filename: str, contents: str) -> SimpleNamespace:
+    async def read() -> bytes:
+        return contents.encode("utf-8")
+
+    attachment: SimpleNamespace = SimpleNamespace(filename=filename, read=read)
+    return SimpleNamespace(message=SimpleNamespace(attachments=[attachment]), guild=SimpleNamespace(id=1))
+
+
+class TestArchiveImport:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filename, contents, line_number", [
+        ("quotes.csv", 'author,text\r\nPlato,"A quote\r\nthat spans\r\nlines."\r\nPlato,\r\n', 5),
+        ("quotes.csv", 'author,text\nPlato,"Two\nlines."\n\nPlato,\n', 5),
+        ("quotes.ndjson", '{"author": "Plato", "text": "A quote."}\n\n{"author": "Plato"}\n', 3),
+    ])
+    async def test_invalid_quotes_are_found_by_line(filename, contents, line_number):
+        with pytest.raises(InvalidImport) as import_error:
+            await Quoter.import_quotes.callback(Quoter(None), make_import_context(filename, contents))
+        assert import_error.value.line_number == line_number
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_quoted_line_breaks_are_kept(monkeypatch):
+        imported_quotes: list = []
+        sent_embeds: list = []
+
+        async def import_quotes_with(g_id: int, quotes: list) -> int:
+            imported_quotes.extend(quotes)
+            return len(quotes)
+
+        async def send(embed) -> None:
+            sent_embeds.append(embed)
+
+        monkeypatch.setattr(Quote.import_quotes_with, "awaitable", import_quotes_with)
+        import_context: SimpleNamespace = make_import_context(
+            "quotes.csv", 'author,text\nPlato,"A quote\nthat spans lines."\n,Anonymous.\n'
+        )
+        import_context.send = send
+        await Quoter.import_quotes.callback(Quoter(None), import_context)
+        assert imported_quotes == [("Plato", "A quote\nthat spans lines."), ("A True Legend", "Anonymous.")]
+        assert len(sent_embeds) == 1
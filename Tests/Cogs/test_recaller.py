@@ -1,2 +1,347 @@
-# TODO: will contain tests for the Recaller Cog and its composite commands
+# Contains tests for the RecurrenceRule by which the Recaller's reminders repeat,
+# for the ReminderScheduler that wakes it when they are due, and for the ReminderDispatcher that sends them.
 
+import asyncio
+import pytest
+
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from ...Bot.Cogs.Helpers import dispatcher
+from ...Bot.Cogs.Helpers.dispatcher import ReminderDispatcher
+from ...Bot.Cogs.Helpers.Enumerators.timekeeper import SchedulerConstant
+from ...Bot.Cogs.Helpers.Enumerators.universalist import DiscordConstant, MentionableType
+from ...Bot.Cogs.Helpers.exceptioner import InvalidRecurrence
+from ...Bot.Cogs.Helpers.recurrence import RecurrenceRule
+from ...Bot.Cogs.Helpers.scheduler import ReminderScheduler
+
+EASTERN_OFFSET: timedelta = timedelta(hours=-5)
+FRIDAY_MORNING: datetime = datetime(2021, 3, 5, 14, 0, tzinfo=timezone.utc)
+WINDOW_START: datetime = datetime(2021, 3, 5, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeChannel:
+    def __init__(self, send_delay: float = 0.0, active_sends: list = None):
+        self.send_delay: float = send_delay
+        self.active_sends: list = active_sends if active_sends is not None else []
+        self.most_active_sends: int = 0
+        self.sent_messages: list = []
+
+    async def send(self, content: str) -> None:
+        self.active_sends.append(self)
+        self.most_active_sends = max(self.most_active_sends, len(self.active_sends))
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.active_sends.remove(self)
+        self.sent_messages.append(content)
+
+
+class FakeClock:
+    def __init__(self):
+        self.current_time: float = 0.0
+        self.sleeps: list = []
+
+    def monotonic(self) -> float:
+        return self.current_time
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.current_time += seconds
+
+
+def make_reminder(g_id: int, due_time: datetime, text: str = "check the oven", target_id: int = 1):
+    return SimpleNamespace(
+        guild_id=g_id, target_type=MentionableType.MEMBER.value, target_id=target_id,
+        reminder_datetime=due_time, reminder_text=text
+    )
+
+
+def make_dispatcher(channels: dict, channel_lookups: list = None) -> ReminderDispatcher:
+    async def get_reminder_channels(guild_ids: set) -> dict:
+        if channel_lookups is not None:
+            channel_lookups.append(guild_ids)
+        return {g_id: g_id * 10 for g_id in guild_ids if g_id * 10 in channels}
+
+    return ReminderDispatcher(get_reminder_channels, channels.get)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    clock: FakeClock = FakeClock()
+    monkeypatch.setattr(dispatcher, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(dispatcher.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+class TestRecurrenceRule:
+    @staticmethod
+    @pytest.mark.parametrize("rule_text, composed_rule", [
+        ("every 90 minutes", "every 90 minutes"),
+        ("Every 48  Hours", "every 2 days"),
+        ("weekly", "every week"),
+        ("on Mon, wed,FRI", "on mon,wed,fri UTC-05:00"),
+        ("on weekends", "on sat,sun UTC-05:00"),
+    ])
+    def test_rules_are_composed_and_read_back(rule_text, composed_rule):
+        recurrence_rule: RecurrenceRule = RecurrenceRule.parse(rule_text, EASTERN_OFFSET)
+        assert recurrence_rule.compose_rule() == composed_rule
+        assert RecurrenceRule.parse(composed_rule) == recurrence_rule
+
+    @staticmethod
+    @pytest.mark.parametrize("rule_text", ["every 0 days", "on funday", "sometimes"])
+    def test_invalid_rules_are_rejected(rule_text):
+        with pytest.raises(InvalidRecurrence):
+            RecurrenceRule.parse(rule_text)
+
+    @staticmethod
+    def test_never_does_not_recur():
+        assert RecurrenceRule.parse("never") is None
+
+    @staticmethod
+    def test_missed_intervals_are_skipped():
+        recurrence_rule: RecurrenceRule = RecurrenceRule.parse("every 2 days")
+        current_time: datetime = FRIDAY_MORNING + timedelta(days=5, hours=1)
+        assert recurrence_rule.next_after(FRIDAY_MORNING, current_time) == FRIDAY_MORNING + timedelta(days=6)
+
+    @staticmethod
+    def test_weekdays_keep_their_local_time():
+        recurrence_rule: RecurrenceRule = RecurrenceRule.parse("on mon, wed", EASTERN_OFFSET)
+        next_occurrence: datetime = recurrence_rule.next_after(FRIDAY_MORNING, FRIDAY_MORNING)
+        assert next_occurrence == FRIDAY_MORNING + timedelta(days=3)
+        assert next_occurrence.astimezone(timezone(EASTERN_OFFSET)).hour == 9
+
+
+class TestReminderScheduler:
+    @staticmethod
+    def test_times_are_held_until_unscheduled():
+        reminder_scheduler: ReminderScheduler = ReminderScheduler(None, None, None)
+        reminder_scheduler.window_end = WINDOW_START + timedelta(minutes=15)
+        first_time, second_time = WINDOW_START + timedelta(minutes=1), WINDOW_START + timedelta(minutes=2)
+        for due_time in (second_time, first_time, first_time, WINDOW_START + timedelta(hours=1)):
+            reminder_scheduler.schedule(due_time)
+        assert reminder_scheduler.get_next_wake() == first_time
+        reminder_scheduler.unschedule(first_time)
+        assert reminder_scheduler.get_next_wake() == first_time
+        reminder_scheduler.unschedule(first_time)
+        assert reminder_scheduler.get_next_wake() == second_time
+        reminder_scheduler.unschedule(second_time)
+        assert reminder_scheduler.get_next_wake() == reminder_scheduler.window_end
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_refill_adds_up_shards():
+        shared_time, scheduled_time = WINDOW_START + timedelta(minutes=1), WINDOW_START + timedelta(minutes=3)
+
+        async def load_due_times(horizon: datetime, limit: int) -> list:
+            return [(shared_time, 2), (shared_time, 3), (WINDOW_START + timedelta(hours=1), 1)]
+
+        reminder_scheduler: ReminderScheduler = ReminderScheduler(load_due_times, None, None)
+        reminder_scheduler.window_end = WINDOW_START + timedelta(minutes=5)
+        reminder_scheduler.schedule(scheduled_time)
+        await reminder_scheduler.refill_window(WINDOW_START)
+        assert reminder_scheduler.window_end == WINDOW_START + timedelta(minutes=15)
+        assert sorted(reminder_scheduler.due_counts.items()) == [(shared_time, 5), (scheduled_time, 1)]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_earlier_time_wakes_scheduler():
+        delivered_reminders: list = []
+        current_time: datetime = datetime.now(timezone.utc)
+        due_time: datetime = current_time + timedelta(milliseconds=50)
+
+        async def load_due_times(horizon: datetime, limit: int) -> list:
+            return [(current_time + timedelta(minutes=10), 1)]
+
+        async def claim_due_reminders(claim_time: datetime) -> list:
+            return [due_time] if claim_time >= due_time and not delivered_reminders else []
+
+        async def deliver_reminders(due_reminders: list) -> None:
+            delivered_reminders.extend(due_reminders)
+
+        reminder_scheduler: ReminderScheduler = ReminderScheduler(
+            load_due_times, claim_due_reminders, deliver_reminders
+        )
+        scheduler_task: asyncio.Task = asyncio.create_task(reminder_scheduler.run())
+        try:
+            await asyncio.sleep(0.01)
+            reminder_scheduler.schedule(due_time)
+            await asyncio.sleep(0.25)
+        finally:
+            scheduler_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await scheduler_task
+        assert delivered_reminders == [due_time]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_leases_held_elsewhere_are_awaited_once():
+        delivered_batches: list = []
+        lease_expiry: datetime = WINDOW_START + timedelta(seconds=SchedulerConstant.LEASE_SECONDS)
+
+        async def claim_due_reminders(claim_time: datetime) -> list:
+            return []
+
+        async def deliver_reminders(due_reminders: list) -> None:
+            delivered_batches.append(due_reminders)
+
+        reminder_scheduler: ReminderScheduler = ReminderScheduler(None, claim_due_reminders, deliver_reminders)
+        reminder_scheduler.window_end = WINDOW_START + timedelta(minutes=15)
+        reminder_scheduler.schedule(WINDOW_START, 2)
+        await reminder_scheduler.fire_due_reminders(WINDOW_START)
+        assert delivered_batches == []
+        assert reminder_scheduler.get_next_wake() == lease_expiry
+        assert reminder_scheduler.due_counts[lease_expiry] == 2
+        await reminder_scheduler.fire_due_reminders(lease_expiry)
+        assert reminder_scheduler.get_next_wake() == reminder_scheduler.window_end
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_lost_leases_are_reclaimed_when_they_expire():
+        delivered_batches: list = []
+        lease_expiry: datetime = WINDOW_START + timedelta(seconds=SchedulerConstant.LEASE_SECONDS)
+        unclaimed_reminders: list = ["first", "second"]
+
+        async def claim_due_reminders(claim_time: datetime) -> list:
+            claimed_reminders: list = list(unclaimed_reminders)
+            unclaimed_reminders.clear()
+            return claimed_reminders
+
+        async def deliver_reminders(due_reminders: list) -> None:
+            if not delivered_batches:
+                delivered_batches.append(None)
+                unclaimed_reminders.extend(due_reminders)
+                raise ConnectionError("The acknowledgement was lost.")
+            delivered_batches.append(due_reminders)
+
+        reminder_scheduler: ReminderScheduler = ReminderScheduler(None, claim_due_reminders, deliver_reminders)
+        reminder_scheduler.window_end = WINDOW_START + timedelta(minutes=15)
+        reminder_scheduler.schedule(WINDOW_START, 2)
+        with pytest.raises(ConnectionError):
+            await reminder_scheduler.fire_due_reminders(WINDOW_START)
+        assert reminder_scheduler.get_next_wake() == lease_expiry
+        await reminder_scheduler.fire_due_reminders(lease_expiry)
+        assert delivered_batches == [None, ["first", "second"]]
+        assert reminder_scheduler.get_next_wake() == reminder_scheduler.window_end
+
+
+class TestReminderDispatcher:
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_channels_are_looked_up_at_once(fake_clock):
+        channel_lookups: list = []
+        channels: dict = {10: FakeChannel(), 20: FakeChannel()}
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher(channels, channel_lookups)
+        await reminder_dispatcher.dispatch([
+            make_reminder(1, WINDOW_START), make_reminder(2, WINDOW_START), make_reminder(1, WINDOW_START)
+        ])
+        assert channel_lookups == [{1, 2}]
+        assert [len(channel.sent_messages) for channel in channels.values()] == [1, 1]
+        assert reminder_dispatcher.metrics().delivered == 3
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_missing_channels_fail_alone(fake_clock):
+        channels: dict = {10: FakeChannel()}
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher(channels)
+        await reminder_dispatcher.dispatch([make_reminder(1, WINDOW_START), make_reminder(3, WINDOW_START)])
+        assert len(channels[10].sent_messages) == 1
+        assert reminder_dispatcher.metrics()[:2] == (1, 1)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_workers_are_bounded():
+        active_sends: list = []
+        channels: dict = {
+            g_id * 10: FakeChannel(0.01, active_sends) for g_id in range(1, SchedulerConstant.DISPATCH_WORKERS * 2)
+        }
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher(channels)
+        await reminder_dispatcher.dispatch([make_reminder(channel_id // 10, WINDOW_START) for channel_id in channels])
+        assert all(len(channel.sent_messages) == 1 for channel in channels.values())
+        assert max(channel.most_active_sends for channel in channels.values()) == SchedulerConstant.DISPATCH_WORKERS
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_channels_are_paced(fake_clock):
+        channels: dict = {10: FakeChannel()}
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher(channels)
+        window_length: timedelta = timedelta(seconds=SchedulerConstant.COALESCE_SECONDS)
+        await reminder_dispatcher.dispatch([
+            make_reminder(1, WINDOW_START + window_length * window) for window in range(7)
+        ])
+        assert len(channels[10].sent_messages) == 7
+        assert fake_clock.sleeps == [DiscordConstant.CHANNEL_MESSAGE_PERIOD]
+        assert list(reminder_dispatcher.channel_sends[10]) == [DiscordConstant.CHANNEL_MESSAGE_PERIOD] * 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_idle_channels_are_forgotten(fake_clock):
+        channels: dict = {10: FakeChannel(), 20: FakeChannel()}
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher(channels)
+        await reminder_dispatcher.dispatch([make_reminder(1, WINDOW_START)])
+        fake_clock.current_time += DiscordConstant.CHANNEL_MESSAGE_PERIOD - 1
+        await reminder_dispatcher.dispatch([make_reminder(2, WINDOW_START)])
+        assert set(reminder_dispatcher.channel_sends) == {10, 20}
+        fake_clock.current_time += 1
+        reminder_dispatcher.forget_idle_channels()
+        assert set(reminder_dispatcher.channel_sends) == {20}
+
+    @staticmethod
+    def test_lag_is_measured():
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher({})
+        current_time: datetime = datetime.now(timezone.utc)
+        reminder_dispatcher.record_delivery(current_time - timedelta(seconds=30))
+        reminder_dispatcher.record_delivery(current_time - timedelta(seconds=10))
+        reminder_dispatcher.record_delivery(current_time + timedelta(seconds=10))
+        current_metrics = reminder_dispatcher.metrics()
+        assert current_metrics.delivered == 3 and current_metrics.failed == 0
+        assert 30 <= current_metrics.maximum_lag < 31
+        assert 40 <= current_metrics.total_lag < 42
+        assert current_metrics.average_lag == current_metrics.total_lag / 3
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reminders_are_coalesced_by_channel_and_window(fake_clock):
+        channels: dict = {10: FakeChannel(), 20: FakeChannel()}
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher(channels)
+        next_window: datetime = WINDOW_START + timedelta(seconds=SchedulerConstant.COALESCE_SECONDS)
+        await reminder_dispatcher.dispatch([
+            make_reminder(1, next_window, "second window"), make_reminder(1, WINDOW_START, "first", 2),
+            make_reminder(2, WINDOW_START, "elsewhere"), make_reminder(1, WINDOW_START, "also first", 3)
+        ])
+        assert channels[10].sent_messages == [
+            "Reminder for <@2>: first\nReminder for <@3>: also first", "Reminder for <@1>: second window"
+        ]
+        assert channels[20].sent_messages == ["Reminder for <@1>: elsewhere"]
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_long_windows_are_split_between_reminders():
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher({})
+        window_reminders: list = [make_reminder(1, WINDOW_START, f"{index}" * 900, index) for index in range(5)]
+        compact_messages: list = await reminder_dispatcher.coalesce(window_reminders)
+        assert [message.count("Reminder for") for message in compact_messages] == [2, 2, 1]
+        assert all(len(message) <= DiscordConstant.MAX_MESSAGE_LENGTH for message in compact_messages)
+        assert "\n".join(compact_messages) == "\n".join(map(reminder_dispatcher.compose_reminder, window_reminders))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_reminders_with_line_breaks_stay_whole():
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher({})
+        multiline_text: str = "\n".join(["buy:"] + [f"- item {index}" for index in range(150)])
+        window_reminders: list = [make_reminder(1, WINDOW_START, multiline_text, index) for index in range(3)]
+        compact_messages: list = await reminder_dispatcher.coalesce(window_reminders)
+        assert compact_messages == list(map(reminder_dispatcher.compose_reminder, window_reminders))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_overlong_reminders_are_condensed():
+        reminder_dispatcher: ReminderDispatcher = make_dispatcher({})
+        overlong_text: str = "\n".join(["line"] * 500)
+        window_reminders: list = [
+            make_reminder(1, WINDOW_START, "short", 1), make_reminder(1, WINDOW_START, overlong_text, 2)
+        ]
+        compact_messages: list = await reminder_dispatcher.coalesce(window_reminders)
+        assert compact_messages[0] == "Reminder for <@1>: short"
+        assert all(len(message) <= DiscordConstant.MAX_MESSAGE_LENGTH for message in compact_messages)
+        assert "".join(compact_messages[1:]) == reminder_dispatcher.compose_reminder(window_reminders[1])
@@ -1,4 +1,29 @@
-# TODO: description
+# Contains the fixtures shared by Smorg's tests. Without a secretbord, as on a clean checkout, the tests run
+# against an embedded SQLite database: its settings are put in secretbord's place before smorgasDB is imported,
+# in a temporary directory unless the SMORG_TEST_DATABASE environment variable names another file.
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+from types import ModuleType
+
+SECRETBORD_NAME: str = f"{__package__.rpartition('.')[0]}.Bot.secretbord"
+SECRETBORD_PATH: str = os.path.join(os.path.dirname(__file__), os.pardir, "Bot", "secretbord.py")
+
+if SECRETBORD_NAME not in sys.modules and not os.path.exists(SECRETBORD_PATH):
+    test_secretbord: ModuleType = ModuleType(SECRETBORD_NAME)
+    test_secretbord.bot_key = None
+    test_secretbord.database = "sqlite"
+    if os.environ.get("SMORG_TEST_DATABASE"):
+        test_secretbord.database_name = os.environ["SMORG_TEST_DATABASE"]
+    else:
+        test_database_directory: str = tempfile.mkdtemp(prefix="smorg-tests-")
+        atexit.register(shutil.rmtree, test_database_directory, ignore_errors=True)
+        test_secretbord.database_name = os.path.join(test_database_directory, "smorg.db")
+    sys.modules[SECRETBORD_NAME] = test_secretbord
 
 import discord.ext.test as dpytest
 import pytest
@@ -0,0 +1,481 @@
+# Contains query plan regression tests for smorgasDB. Each hot query is run against the configured database,
+# and the statements that it executes are explained; a test fails if any of them scans a whole table or index.
+# It also contains tests for the unit of work that a command invocation's database work shares
+# and for the return of connections to the pool and the pool's metrics, as well as for the schema bootstrap
+# and for streamed listings, full-text search, maintained quote counts, bulk imports, and deduplication,
+# as well as for the reconciliation of Guilds, their routing to database shards, and recurring and leased reminders.
+
+import logging
+import pytest
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event, func
+from sqlalchemy.exc import DataError, IntegrityError
+from time import sleep
+from types import SimpleNamespace
+
+from ..Bot import smorgasDB
+from ..Bot.Cogs.Helpers.Enumerators.universalist import DiscordConstant, MentionableType
+from ..Bot.smorgasDB import AuthorQuoteCount, Base, BaseAddition, ConnectionLeakDetector, create_database_engine, \
+    database_shard, engine, engines, get_pool_metrics, Guild, guild_settings_cache, PoolMetrics, Quote, Reminder, \
+    route_guild, SCHEMA_MIGRATIONS, SchemaVersion, Session
+
+PLAN_GUILD_ID: int = 1
+PLAN_AUTHOR: str = "Plan Author"
+PLAN_TARGET: tuple = (MentionableType.MEMBER, 1)
+PLAN_DATETIME: datetime = datetime(2000, 1, 1, tzinfo=timezone.utc)
+PLAN_CLAIMANT: str = "plan-claimant"
+PLANNABLE_STATEMENTS: tuple = ("SELECT", "UPDATE", "DELETE")
+SHARDED_GUILD_IDS: tuple = (2 << 22 | 1, 1 << 22 | 1)
+
+HOT_QUERIES: list = [
+    pytest.param(Guild.get_settings_by, (PLAN_GUILD_ID,), id="get_settings_by"),
+    pytest.param(Guild.get_settings_of, ([PLAN_GUILD_ID],), id="get_settings_of"),
+    pytest.param(Guild.exists_with, (PLAN_GUILD_ID,), id="exists_with"),
+    pytest.param(Quote.count_quotes, (PLAN_GUILD_ID,), id="count_quotes"),
+    pytest.param(AuthorQuoteCount.get_top_authors_by, (PLAN_GUILD_ID,), id="get_top_authors_by"),
+    pytest.param(Quote.get_quotes_by, (PLAN_GUILD_ID,), id="get_quotes_by"),
+    pytest.param(Quote.get_quotes_by, (PLAN_GUILD_ID, PLAN_AUTHOR), id="get_quotes_by_author"),
+    pytest.param(Quote.get_random_quote_by, (PLAN_GUILD_ID,), id="get_random_quote_by"),
+    pytest.param(Quote.get_quote_page_by, (PLAN_GUILD_ID, None, 0, 2), id="get_quote_page_by"),
+    pytest.param(Quote.get_quote_page_by, (PLAN_GUILD_ID, PLAN_AUTHOR, 0, 2), id="get_quote_page_by_author"),
+    pytest.param(Quote.search_quotes_by, (PLAN_GUILD_ID, "planning"), id="search_quotes_by"),
+    pytest.param(Quote.search_quotes_by, (PLAN_GUILD_ID, "planning", (1, 1)), id="search_quotes_by_after"),
+    pytest.param(Reminder.get_reminders_by, (PLAN_GUILD_ID, *PLAN_TARGET), id="get_reminders_by"),
+    pytest.param(Reminder.get_reminder_page_by, (PLAN_GUILD_ID, *PLAN_TARGET, PLAN_DATETIME, 2),
+                 id="get_reminder_page_by"),
+    pytest.param(Reminder.has_reminder_with, (PLAN_GUILD_ID, *PLAN_TARGET, PLAN_DATETIME), id="has_reminder_with"),
+    pytest.param(Reminder.claim_reminders_at, (PLAN_DATETIME - timedelta(days=1), PLAN_CLAIMANT, timedelta(0), 1),
+                 id="claim_reminders_at"),
+    pytest.param(Reminder.get_due_times_before, (PLAN_DATETIME, 1000), id="get_due_times_before"),
+]
+
+
+@pytest.fixture(scope='module')
+def plan_data():
+    # Setup:
+    Base.metadata.create_all()
+    remove_plan_data()
+    Guild.create_guild_with(PLAN_GUILD_ID, None)
+    Quote.create_quote_with(PLAN_GUILD_ID, "A quote worth planning for.", PLAN_AUTHOR)
+    Reminder.create_reminder_with(PLAN_GUILD_ID, *PLAN_TARGET, "A reminder worth planning for.", PLAN_DATETIME)
+
+    # Tests:
+    yield
+
+    # Teardown:
+    remove_plan_data()
+
+
+@pytest.fixture
+def two_shards(monkeypatch, tmp_path):
+    # Setup:
+    shard_engines: tuple = tuple(
+        create_database_engine(SimpleNamespace(database="sqlite", database_name=str(tmp_path / f"shard-{shard}.db")))
+        for shard in range(2)
+    )
+    monkeypatch.setattr(smorgasDB, "engines", shard_engines)
+    monkeypatch.setattr(smorgasDB, "engine", shard_engines[0])
+    BaseAddition.reset_database()
+
+    # Tests:
+    yield shard_engines
+
+    # Teardown:
+    for g_id in SHARDED_GUILD_IDS:
+        guild_settings_cache.discard(g_id)
+    for shard_engine in shard_engines:
+        shard_engine.dispose()
+
+
+def remove_plan_data() -> None:
+    plan_session: Session = Session()
+    plan_session.query(Reminder).filter_by(guild_id=PLAN_GUILD_ID).delete()
+    plan_session.query(Quote).filter_by(guild_id=PLAN_GUILD_ID).delete()
+    plan_session.query(Guild).filter_by(guild_id=PLAN_GUILD_ID).delete()
+    plan_session.commit()
+    plan_session.close()
+
+
+@contextmanager
+def captured_statements():
+    statements: list = []
+
+    def capture_statement(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(maxsplit=1)[0].upper() in PLANNABLE_STATEMENTS:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture_statement)
+
+
+def find_full_scans(statement: str, parameters) -> list:
+    with engine.connect() as plan_connection:
+        plan_transaction = plan_connection.begin()
+        if engine.dialect.name == "postgresql":
+            # Tiny test tables are cheaper to scan than to search, so the planner must be told to prefer an index.
+            plan_connection.execute("SET LOCAL enable_seqscan = off")
+            plan: list = plan_connection.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+            full_scans: list = find_full_postgresql_scans(plan_connection, plan[0]["Plan"])
+        else:
+            plan = [row[-1] for row in plan_connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            full_scans = [plan_line for plan_line in plan if is_full_sqlite_scan(plan_line.lstrip())]
+        plan_transaction.rollback()
+    return full_scans
+
+
+def is_full_sqlite_scan(plan_line: str) -> bool:
+    # A subquery's scan reads intermediate rows, and an FTS5 table's scan with a MATCH ("M") or a rowid ("=")
+    # among the constraints after its index number searches its index.
+    if plan_line.startswith("SCAN (subquery"):
+        return False
+    if "VIRTUAL TABLE INDEX" in plan_line:
+        return not {"M", "="}.intersection(plan_line.partition(":")[2])
+    return plan_line.startswith("SCAN")
+
+
+def find_full_postgresql_scans(plan_connection, plan_node: dict) -> list:
+    # An index condition on anything but the index's leading column still walks the whole index.
+    full_scans: list = []
+    node_type: str = plan_node["Node Type"]
+    if node_type == "Seq Scan":
+        full_scans.append(f'{node_type} on {plan_node["Relation Name"]}')
+    elif node_type.endswith("Index Scan"):
+        leading_column: str = plan_connection.execute(
+            "SELECT attribute.attname FROM pg_index AS index "
+            "JOIN pg_class AS class ON class.oid = index.indexrelid "
+            "JOIN pg_attribute AS attribute ON attribute.attrelid = index.indrelid "
+            "AND attribute.attnum = index.indkey[0] "
+            "WHERE class.relname = %(index_name)s", {"index_name": plan_node["Index Name"]}
+        ).scalar()
+        if f"({leading_column} " not in plan_node.get("Index Cond", ""):
+            full_scans.append(f'{node_type} on {plan_node["Index Name"]}')
+    for child_node in plan_node.get("Plans", []):
+        full_scans.extend(find_full_postgresql_scans(plan_connection, child_node))
+    return full_scans
+
+
+class TestQueryPlans:
+    @staticmethod
+    @pytest.mark.parametrize('query_method, query_arguments', HOT_QUERIES)
+    def test_uses_index(plan_data, query_method, query_arguments):
+        with captured_statements() as statements:
+            query_method(*query_arguments)
+        assert statements
+        for statement, parameters in statements:
+            assert not find_full_scans(statement, parameters), statement
+
+
+class TestUnitOfWork:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('command_failed', [False, True])
+    async def test_shares_one_connection(plan_data, command_failed):
+        checkouts: list = []
+        committed_callbacks: list = []
+        unit_context = SimpleNamespace(guild=SimpleNamespace(id=PLAN_GUILD_ID), command_failed=command_failed)
+        quote_count: int = Quote.count_quotes(PLAN_GUILD_ID)
+
+        def count_checkout(dbapi_connection, connection_record, connection_proxy):
+            checkouts.append(connection_record)
+
+        event.listen(engine, "checkout", count_checkout)
+        await BaseAddition.begin_unit_of_work(unit_context)
+        try:
+            await Quote.create_quote_with.awaitable(
+                PLAN_GUILD_ID, f"A quote worth {'abandoning' if command_failed else 'sharing'}.", PLAN_AUTHOR
+            )
+            await Reminder.get_reminders_by.awaitable(PLAN_GUILD_ID, *PLAN_TARGET)
+            unit_quote_count: int = await Quote.count_quotes.awaitable(PLAN_GUILD_ID)
+            BaseAddition.call_after_commit(lambda: committed_callbacks.append(unit_quote_count))
+            assert committed_callbacks == []
+        finally:
+            await BaseAddition.end_unit_of_work(unit_context)
+            event.remove(engine, "checkout", count_checkout)
+        assert unit_quote_count == quote_count + 1
+        assert len(checkouts) == 1
+        assert Quote.count_quotes(PLAN_GUILD_ID) == (quote_count if command_failed else quote_count + 1)
+        assert committed_callbacks == ([] if command_failed else [quote_count + 1])
+
+    @staticmethod
+    def test_failed_commits_leave_cache_alone(plan_data):
+        guild_settings_cache.discard(PLAN_GUILD_ID)
+        with pytest.raises(IntegrityError):
+            Guild.create_guild_with(PLAN_GUILD_ID, 1)
+        assert guild_settings_cache.get(PLAN_GUILD_ID) is None
+        plan_message = SimpleNamespace(channel=SimpleNamespace(guild=SimpleNamespace(id=PLAN_GUILD_ID)))
+        assert Guild.get_prefix(None, plan_message) == "."
+        Guild.update_prefix(PLAN_GUILD_ID, "!")
+        assert guild_settings_cache.get(PLAN_GUILD_ID)["guild_prefix"] == "!"
+        Guild.update_prefix(PLAN_GUILD_ID, ".")
+
+
+class TestConnectionSafety:
+    @staticmethod
+    def test_failed_method_returns_connection(plan_data):
+        overlong_text: str = "!" * (DiscordConstant.MAX_EMBED_FIELD_VALUE + 1)
+        with pytest.raises(DataError):
+            Reminder.create_reminder_with(PLAN_GUILD_ID, *PLAN_TARGET, overlong_text, PLAN_DATETIME)
+        assert engine.pool.checkedout() == 0
+
+    @staticmethod
+    def test_leak_detector_finds_call_site():
+        leak_detector: ConnectionLeakDetector = ConnectionLeakDetector(threshold=0.1)
+        event.listen(engine, "checkout", leak_detector.record_checkout)
+        event.listen(engine, "checkin", leak_detector.record_checkin)
+        leaky_session: Session = Session()
+        try:
+            leaky_session.execute("SELECT 1")
+            sleep(0.2)
+            leaks: list = leak_detector.find_leaks()
+        finally:
+            leaky_session.close()
+            event.remove(engine, "checkout", leak_detector.record_checkout)
+            event.remove(engine, "checkin", leak_detector.record_checkin)
+        assert len(leaks) == 1
+        assert "test_leak_detector_finds_call_site" in leaks[0][1]
+        assert not leak_detector.find_leaks()
+
+    @staticmethod
+    def test_pool_metrics_count_checkouts():
+        metrics_before: PoolMetrics = get_pool_metrics()
+        with engine.connect():
+            metrics_during: PoolMetrics = get_pool_metrics()
+        metrics_after: PoolMetrics = get_pool_metrics()
+        assert metrics_during.checked_out == metrics_before.checked_out + 1
+        assert metrics_after.checked_out == metrics_before.checked_out
+        assert metrics_after.checkouts == metrics_before.checkouts + 1
+        assert metrics_after.total_wait >= metrics_before.total_wait
+
+
+class TestSchemaBootstrap:
+    @staticmethod
+    def test_current_schema_is_left_alone(plan_data):
+        BaseAddition.bootstrap_database()
+        with captured_statements() as statements:
+            assert BaseAddition.bootstrap_database() == []
+        assert SchemaVersion.get_current_version() == SCHEMA_MIGRATIONS[-1][0]
+        assert not [statement for statement, parameters in statements if not statement.lstrip().startswith("SELECT")]
+        assert Quote.count_quotes(PLAN_GUILD_ID)
+
+
+class TestStreaming:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('list_method, stream_method, query_arguments', [
+        pytest.param(Quote.get_quotes_by, Quote.stream_quotes_by, (PLAN_GUILD_ID,), id="quotes"),
+        pytest.param(Reminder.get_reminders_by, Reminder.stream_reminders_by, (PLAN_GUILD_ID, *PLAN_TARGET),
+                     id="reminders")
+    ])
+    async def test_stream_matches_list(plan_data, list_method, stream_method, query_arguments):
+        streamed_rows: list = [tuple(row) async for row in stream_method(*query_arguments)]
+        assert streamed_rows == [tuple(row) for row in list_method(*query_arguments)]
+        assert engine.pool.checkedout() == 0
+
+
+class TestSearch:
+    @staticmethod
+    def test_ranks_matching_quotes(plan_data):
+        Quote.create_quote_with(PLAN_GUILD_ID, "Planning, planning, and more planning.", "Planner")
+        search_results: list = Quote.search_quotes_by(PLAN_GUILD_ID, "plans")
+        assert search_results[0].author == "Planner"
+        assert [row.search_position for row in search_results] == list(range(1, len(search_results) + 1))
+        first_result: tuple = (1, search_results[0].guild_quote_number)
+        assert Quote.search_quotes_by(PLAN_GUILD_ID, "plans", after_result=first_result) == search_results[1:]
+        assert Quote.search_quotes_by(PLAN_GUILD_ID, "plans", skipped_pages=1) == []
+        assert not Quote.search_quotes_by(PLAN_GUILD_ID, "unplanned absence")
+
+
+class TestQuoteCounts:
+    @staticmethod
+    def test_counts_match_quotes(plan_data):
+        Quote.create_quote_with(PLAN_GUILD_ID, "A quote worth counting.", PLAN_AUTHOR)
+        count_session: Session = Session()
+        author_counts: list = count_session.query(Quote.author, func.count()).filter_by(
+            guild_id=PLAN_GUILD_ID
+        ).group_by(Quote.author).all()
+        count_session.close()
+        assert Quote.count_quotes(PLAN_GUILD_ID) == sum(quote_count for author, quote_count in author_counts)
+        assert sorted(AuthorQuoteCount.get_top_authors_by(PLAN_GUILD_ID)) == sorted(author_counts)
+
+    @staticmethod
+    def test_import_skips_stored_quotes(plan_data):
+        quote_count: int = Quote.count_quotes(PLAN_GUILD_ID)
+        imported_quotes: list = [(PLAN_AUTHOR, "A quote worth planning for."), ("Importer", "A quote worth importing.")]
+        imported_quotes.append(("IMPORTER", "A quote  worth importing."))
+        assert Quote.import_quotes_with(PLAN_GUILD_ID, imported_quotes * 2) == 1
+        assert Quote.import_quotes_with(PLAN_GUILD_ID, imported_quotes) == 0
+        assert Quote.count_quotes(PLAN_GUILD_ID) == quote_count + 1
+        assert Quote.get_quote_by(PLAN_GUILD_ID, quote_count + 1).author == "Importer"
+        assert ("Importer", 1) in AuthorQuoteCount.get_top_authors_by(PLAN_GUILD_ID)
+
+    @staticmethod
+    def test_duplicate_is_ignored(plan_data):
+        quote_count: int = Quote.count_quotes(PLAN_GUILD_ID)
+        assert not Quote.create_quote_with(PLAN_GUILD_ID, "  a QUOTE worth\tplanning for. ", PLAN_AUTHOR.upper())
+        assert Quote.count_quotes(PLAN_GUILD_ID) == quote_count
+        assert Quote.create_quote_with(PLAN_GUILD_ID, "A quote worth planning for, twice.", PLAN_AUTHOR)
+        assert Quote.get_quote_by(PLAN_GUILD_ID, quote_count + 1).text == "A quote worth planning for, twice."
+
+    @staticmethod
+    def test_counts_leave_with_guild():
+        Guild.create_guild_with(PLAN_GUILD_ID + 1, None)
+        Quote.create_quote_with(PLAN_GUILD_ID + 1, "A quote worth forgetting.", PLAN_AUTHOR)
+        Guild.delete_guild_with(PLAN_GUILD_ID + 1)
+        assert Quote.count_quotes(PLAN_GUILD_ID + 1) == 0
+        assert not AuthorQuoteCount.get_top_authors_by(PLAN_GUILD_ID + 1)
+
+
+class TestRecurrence:
+    @staticmethod
+    def test_recurring_reminder_moves_on(plan_data):
+        recurring_target: tuple = (MentionableType.MEMBER, 2)
+        first_occurrence: datetime = PLAN_DATETIME - timedelta(weeks=4)
+        Reminder.create_reminder_with(PLAN_GUILD_ID, *recurring_target, "A weekly plan.", first_occurrence)
+        Reminder.update_recurrence_with(PLAN_GUILD_ID, *recurring_target, first_occurrence, "every week")
+        current_time: datetime = first_occurrence + timedelta(days=8)
+        claimed_reminders: list = Reminder.claim_reminders_at(current_time, PLAN_CLAIMANT, timedelta(minutes=5), 10)
+        assert [reminder.recurrence_rule for reminder in claimed_reminders] == ["every week"]
+        assert Reminder.acknowledge_reminders(claimed_reminders, PLAN_CLAIMANT, current_time) == [
+            first_occurrence + timedelta(weeks=2)
+        ]
+        assert [reminder.reminder_datetime for reminder in Reminder.get_reminders_by(
+            PLAN_GUILD_ID, *recurring_target
+        )] == [first_occurrence + timedelta(weeks=2)]
+        Reminder.delete_reminder_with(PLAN_GUILD_ID, *recurring_target, first_occurrence + timedelta(weeks=2))
+
+    @staticmethod
+    def test_taken_occurrences_are_passed_over(plan_data, caplog):
+        recurring_target: tuple = (MentionableType.MEMBER, 4)
+        first_occurrence: datetime = PLAN_DATETIME - timedelta(weeks=4)
+        Reminder.create_reminder_with(PLAN_GUILD_ID, *recurring_target, "A weekly plan.", first_occurrence)
+        Reminder.update_recurrence_with(PLAN_GUILD_ID, *recurring_target, first_occurrence, "every week")
+        Reminder.create_reminder_with(
+            PLAN_GUILD_ID, *recurring_target, "A one-off plan.", first_occurrence + timedelta(weeks=1)
+        )
+        claimed_reminders: list = Reminder.claim_reminders_at(first_occurrence, PLAN_CLAIMANT, timedelta(minutes=5), 10)
+        with caplog.at_level(logging.WARNING):
+            assert Reminder.acknowledge_reminders(claimed_reminders, PLAN_CLAIMANT, first_occurrence) == [
+                first_occurrence + timedelta(weeks=2)
+            ]
+        assert [record.levelno for record in caplog.records if "skipped its occurrence" in record.message] == [
+            logging.WARNING
+        ]
+        assert [tuple(reminder) for reminder in Reminder.get_reminders_by(PLAN_GUILD_ID, *recurring_target)] == [
+            (first_occurrence + timedelta(weeks=1), "A one-off plan.", None),
+            (first_occurrence + timedelta(weeks=2), "A weekly plan.", "every week")
+        ]
+        assert Reminder.get_due_times_before(first_occurrence + timedelta(weeks=2), 10) == [
+            (first_occurrence + timedelta(weeks=1), 1), (first_occurrence + timedelta(weeks=2), 1)
+        ]
+        for remaining_occurrence in (first_occurrence + timedelta(weeks=1), first_occurrence + timedelta(weeks=2)):
+            Reminder.delete_reminder_with(PLAN_GUILD_ID, *recurring_target, remaining_occurrence)
+
+
+class TestReminderLeases:
+    @staticmethod
+    def test_claims_are_exclusive_until_they_expire(plan_data):
+        leased_target: tuple = (MentionableType.ROLE, 3)
+        due_time: datetime = PLAN_DATETIME - timedelta(weeks=1)
+        lease_duration: timedelta = timedelta(minutes=5)
+        Reminder.create_reminder_with(PLAN_GUILD_ID, *leased_target, "A leased plan.", due_time)
+        assert len(Reminder.claim_reminders_at(due_time, "first-claimant", lease_duration, 10)) == 1
+        assert Reminder.claim_reminders_at(due_time + timedelta(minutes=1), "second-claimant", lease_duration, 10) == []
+        assert Reminder.get_due_times_before(PLAN_DATETIME, 10)[0] == (due_time + lease_duration, 1)
+
+        reclaimed_reminders: list = Reminder.claim_reminders_at(
+            due_time + lease_duration, "second-claimant", lease_duration, 10
+        )
+        assert len(reclaimed_reminders) == 1
+        Reminder.acknowledge_reminders(reclaimed_reminders, "first-claimant", due_time + lease_duration)
+        assert Reminder.has_reminder_with(PLAN_GUILD_ID, *leased_target, due_time)
+        Reminder.acknowledge_reminders(reclaimed_reminders, "second-claimant", due_time + lease_duration)
+        assert not Reminder.has_reminder_with(PLAN_GUILD_ID, *leased_target, due_time)
+
+
+    @staticmethod
+    def test_late_acknowledgements_do_not_fork_recurrences(plan_data):
+        recurring_target: tuple = (MentionableType.ROLE, 5)
+        due_time: datetime = PLAN_DATETIME - timedelta(weeks=1)
+        lease_duration: timedelta = timedelta(minutes=5)
+        Reminder.create_reminder_with(PLAN_GUILD_ID, *recurring_target, "A daily plan.", due_time)
+        Reminder.update_recurrence_with(PLAN_GUILD_ID, *recurring_target, due_time, "every day")
+        expired_reminders: list = Reminder.claim_reminders_at(due_time, "first-claimant", lease_duration, 10)
+        reclaimed_reminders: list = Reminder.claim_reminders_at(
+            due_time + lease_duration, "second-claimant", lease_duration, 10
+        )
+        assert Reminder.acknowledge_reminders(reclaimed_reminders, "second-claimant", due_time + lease_duration) == [
+            due_time + timedelta(days=1)
+        ]
+        assert Reminder.acknowledge_reminders(expired_reminders, "first-claimant", due_time + lease_duration) == []
+        assert [reminder.reminder_datetime for reminder in Reminder.get_reminders_by(
+            PLAN_GUILD_ID, *recurring_target
+        )] == [due_time + timedelta(days=1)]
+        Reminder.delete_reminder_with(PLAN_GUILD_ID, *recurring_target, due_time + timedelta(days=1))
+
+
+class TestReconciliation:
+    @staticmethod
+    def test_only_departed_guilds_are_deleted(plan_data):
+        kept_guild_id, departed_guild_id = 2, 3
+        Guild.reconcile_with({PLAN_GUILD_ID: None, kept_guild_id: None, departed_guild_id: None})
+        assert Guild.reconcile_with({PLAN_GUILD_ID: None}) == ([], [])
+        assert Guild.reconcile_with({PLAN_GUILD_ID: None}, lambda g_id: g_id == departed_guild_id) == (
+            [], [departed_guild_id]
+        )
+        assert Guild.exists_with(kept_guild_id) and not Guild.exists_with(departed_guild_id)
+        Guild.delete_guild_with(kept_guild_id)
+
+
+class TestShardRouting:
+    @staticmethod
+    def test_guilds_route_to_a_shard():
+        guild_ids: list = [PLAN_GUILD_ID, 1 << 22, 809_999_999_999_999_999, 2 ** 63 - 1]
+        assert all(route_guild(g_id) in range(len(engines)) for g_id in guild_ids)
+        assert [route_guild(g_id) for g_id in guild_ids] == [route_guild(g_id) for g_id in guild_ids]
+
+    @staticmethod
+    def test_fan_out_visits_every_shard():
+        assert BaseAddition.fan_out_method(sorted)(database_shard.get)() == list(range(len(engines)))
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_guilds_live_on_their_own_shards(two_shards):
+        def read_shard(shard: int, statement: str) -> list:
+            return [tuple(row) for row in two_shards[shard].execute(statement)]
+
+        due_time: datetime = PLAN_DATETIME - timedelta(days=1)
+        assert [route_guild(g_id) for g_id in SHARDED_GUILD_IDS] == [0, 1]
+        new_guild_ids, departed_guild_ids = Guild.reconcile_with({g_id: g_id % 100 for g_id in SHARDED_GUILD_IDS})
+        assert sorted(new_guild_ids) == sorted(SHARDED_GUILD_IDS) and departed_guild_ids == []
+        for g_id in SHARDED_GUILD_IDS:
+            Reminder.create_reminder_with(g_id, *PLAN_TARGET, "A sharded plan.", due_time)
+            guild_settings_cache.discard(g_id)
+        for shard, g_id in enumerate(SHARDED_GUILD_IDS):
+            assert read_shard(shard, "SELECT guild_id FROM guilds") == [(g_id,)]
+            assert read_shard(shard, "SELECT guild_id FROM reminders") == [(g_id,)]
+        assert await Guild.get_reminder_channels_by.awaitable(set(SHARDED_GUILD_IDS)) == {
+            g_id: g_id % 100 for g_id in SHARDED_GUILD_IDS
+        }
+
+        unit_context = SimpleNamespace(guild=SimpleNamespace(id=SHARDED_GUILD_IDS[1]), command_failed=False)
+        await BaseAddition.begin_unit_of_work(unit_context)
+        try:
+            await Quote.create_quote_with.awaitable(SHARDED_GUILD_IDS[1], "A sharded quote.", PLAN_AUTHOR)
+        finally:
+            await BaseAddition.end_unit_of_work(unit_context)
+        assert read_shard(0, "SELECT guild_id FROM quotes") == []
+        assert read_shard(1, "SELECT guild_id FROM quotes") == [(SHARDED_GUILD_IDS[1],)]
+
+        claimed_reminders: list = Reminder.claim_reminders_at(due_time, PLAN_CLAIMANT, timedelta(minutes=5), 10)
+        assert sorted(reminder.guild_id for reminder in claimed_reminders) == sorted(SHARDED_GUILD_IDS)
+        assert Reminder.acknowledge_reminders(claimed_reminders, PLAN_CLAIMANT, due_time) == []
+        assert read_shard(0, "SELECT guild_id FROM reminders") == read_shard(1, "SELECT guild_id FROM reminders") == []
+
+        assert Guild.reconcile_with({SHARDED_GUILD_IDS[0]: None}, lambda g_id: True) == ([], [SHARDED_GUILD_IDS[1]])
+        assert read_shard(0, "SELECT guild_id FROM guilds") == [(SHARDED_GUILD_IDS[0],)]
+        assert read_shard(1, "SELECT guild_id FROM guilds") == []